@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: clarity/completeness for every system, batch versus per system.
+
+Builds a deterministic state of N systems with random file, insight and
+dependency counts, then times the per-system scalar formulas
+(compute_clarity + compute_completeness), the batch engine on count columns
+alone, and a full `recompute` (columns, scoring and write-back).
+
+Usage:
+    python benchmarks/batch_metrics.py --systems 50000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from arch_scribe.metrics import batch  # noqa: E402
+from arch_scribe.metrics.clarity import compute_clarity  # noqa: E402
+from arch_scribe.metrics.completeness import compute_completeness  # noqa: E402
+
+
+def systems(n, seed=0):
+    rng = random.Random(seed)
+    return {
+        f"S{i}": {
+            "key_files": [f"s{i}/f{k}.py" for k in range(rng.randint(0, 15))],
+            "insights": ["insight"] * rng.randint(0, 8),
+            "dependencies": [{"system": "S0", "reason": ""}] * rng.randint(0, 2),
+            "clarity": "low",
+            "completeness": 0,
+        }
+        for i in range(n)
+    }
+
+
+def _scalar(data):
+    for s in data.values():
+        s["clarity"] = compute_clarity(s)
+        s["completeness"] = compute_completeness(s)
+
+
+def _ms(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return round((time.perf_counter() - started) * 1000, 2), result
+
+
+def run(n, seed=0):
+    data = systems(n, seed)
+    scalar_ms, _ = _ms(_scalar, data)
+    expected = [(s["clarity"], s["completeness"]) for s in data.values()]
+
+    for s in data.values():
+        s["clarity"], s["completeness"] = "low", 0
+    _, files, insights, deps = batch.columns(data)
+    batch.compute(files[:1], insights[:1], deps[:1])  # build the table untimed
+    compute_ms, _ = _ms(batch.compute, files, insights, deps)
+    recompute_ms, changed = _ms(batch.recompute, data)
+    actual = [(s["clarity"], s["completeness"]) for s in data.values()]
+
+    return {
+        "systems": n,
+        "numpy": batch._numpy() is not None,
+        "scalar_ms": scalar_ms,
+        "batch_compute_ms": compute_ms,
+        "batch_recompute_ms": recompute_ms,
+        "speedup": round(scalar_ms / recompute_ms, 1) if recompute_ms else None,
+        "changed": len(changed),
+        "matches_scalar": actual == expected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--systems", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(run(args.systems, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Load test: N parallel writers against one architecture.json.
+
+Each writer process repeatedly does what an exploration agent does through
+the CLI - load the state, add a system, map a file to it, save - with no
+coordination besides arch-scribe's own locking. At the end every system and
+every mapped file must be present (no lost updates).
+
+Usage:
+    python benchmarks/concurrent_writers.py --writers 8 --ops 25
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from arch_scribe.core.constants import STATE_FILE  # noqa: E402
+
+
+def _writer(project_dir, writer_id, ops, start_event):
+    from arch_scribe.core.state_manager import StateManager
+
+    os.chdir(project_dir)
+    start_event.wait()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(ops):
+            name = f"W{writer_id}-S{i}"
+            StateManager().add_system(name)
+            StateManager().map_files(name, [f"w{writer_id}/file{i}.py"])
+
+
+def run(writers, ops, project_dir=None):
+    """Run the load test and return a result dict (see main for fields)."""
+    from arch_scribe.core.state_manager import StateManager
+
+    owns_dir = project_dir is None
+    if owns_dir:
+        project_dir = tempfile.mkdtemp(prefix="arch-scribe-load-")
+
+    cwd = os.getcwd()
+    os.chdir(project_dir)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            StateManager().init_project("Load Test")
+
+        start_event = multiprocessing.Event()
+        procs = [
+            multiprocessing.Process(
+                target=_writer, args=(project_dir, w, ops, start_event)
+            )
+            for w in range(writers)
+        ]
+        for p in procs:
+            p.start()
+        started = time.perf_counter()
+        start_event.set()
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - started
+
+        with open(STATE_FILE) as f:
+            data = json.load(f)
+    finally:
+        os.chdir(cwd)
+        if owns_dir:
+            import shutil
+
+            shutil.rmtree(project_dir, ignore_errors=True)
+
+    systems = data["systems"]
+    missing_systems, missing_files = [], []
+    for w in range(writers):
+        for i in range(ops):
+            name = f"W{w}-S{i}"
+            if name not in systems:
+                missing_systems.append(name)
+            elif f"w{w}/file{i}.py" not in systems[name]["key_files"]:
+                missing_files.append(name)
+
+    total_ops = writers * ops * 2
+    return {
+        "writers": writers,
+        "ops_per_writer": ops * 2,
+        "total_ops": total_ops,
+        "elapsed_s": round(elapsed, 3),
+        "ops_per_s": round(total_ops / elapsed, 1) if elapsed else None,
+        "state_version": data["metadata"]["state_version"],
+        "lost_systems": missing_systems,
+        "lost_file_mappings": missing_files,
+        "exit_codes": [p.exitcode for p in procs],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--ops", type=int, default=25, help="systems per writer")
+    args = parser.parse_args()
+
+    result = run(args.writers, args.ops)
+    print(json.dumps(result, indent=2))
+    if result["lost_systems"] or result["lost_file_mappings"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark: rendering every export format from one shared model.
+
+Uses the synthetic graph from graph_stats.py, builds the reporter Model
+once, then times each format alone and all of them together, serially and
+through the thread pool.
+
+Usage:
+    python benchmarks/exporters.py --systems 10000 --edges 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+sys.path.insert(0, HERE)
+
+from arch_scribe.reporting.reporters import REPORTERS, Model, render  # noqa: E402
+from graph_stats import systems  # noqa: E402
+
+
+def _ms(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return round((time.perf_counter() - started) * 1000, 2), result
+
+
+def run(n, edges, seed=0):
+    data = {"metadata": {"project_name": "bench"}, "systems": systems(n, edges, seed)}
+    model_ms, model = _ms(Model.from_state, data)
+    formats = list(REPORTERS)
+    result = {"systems": n, "edges": model.graph.edge_count, "model_ms": model_ms}
+    with tempfile.TemporaryDirectory() as out:
+        for fmt in formats:
+            result[f"{fmt}_ms"], written = _ms(render, model, [fmt], out)
+            result[f"{fmt}_bytes"] = sum(os.path.getsize(p) for p in written[fmt])
+        result["all_serial_ms"], _ = _ms(render, model, formats, out, 1)
+        result["all_threaded_ms"], _ = _ms(render, model, formats, out)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--systems", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(run(args.systems, args.edges, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: dependency graph analytics on a large synthetic graph.
+
+Builds a deterministic state of N systems with E random dependencies (a
+mostly layered DAG with a few back edges, so there are cycles to find),
+then times building the adjacency index and each analysis `graph-stats`
+runs: Tarjan SCC, topological layers, fan-in/fan-out, sampled
+betweenness and a shortest-path query.
+
+Usage:
+    python benchmarks/graph_stats.py --systems 10000 --edges 100000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from arch_scribe.core.graph import Graph  # noqa: E402
+
+
+def systems(n, edges, seed=0, back_edges=0.01):
+    rng = random.Random(seed)
+    data = {f"S{i}": {"dependencies": []} for i in range(n)}
+    for _ in range(edges):
+        a, b = rng.randrange(n), rng.randrange(n)
+        if a == b:
+            continue
+        # Depend on a lower-numbered system, except for the odd back edge
+        if (a < b) != (rng.random() < back_edges):
+            a, b = b, a
+        data[f"S{a}"]["dependencies"].append({"system": f"S{b}", "reason": "uses"})
+    return data
+
+
+def _ms(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return round((time.perf_counter() - started) * 1000, 2), result
+
+
+def run(n, edges, samples, seed=0):
+    data = systems(n, edges, seed)
+    build_ms, graph = _ms(Graph.from_systems, data)
+    scc_ms, (components, _) = _ms(graph.scc)
+    layers_ms, layers = _ms(graph.layers)
+    degrees_ms, _ = _ms(graph.top_degrees, 10, True)
+    between_ms, _ = _ms(graph.betweenness, samples)
+    path_ms, path = _ms(graph.shortest_path, f"S{n - 1}", "S0")
+    return {
+        "systems": n,
+        "edges": graph.edge_count,
+        "build_ms": build_ms,
+        "scc_ms": scc_ms,
+        "components": len(components),
+        "largest_component": max(len(c) for c in components),
+        "layers_ms": layers_ms,
+        "layers": len(layers),
+        "fan_in_ms": degrees_ms,
+        "betweenness_samples": samples,
+        "betweenness_ms": between_ms,
+        "shortest_path_ms": path_ms,
+        "path_hops": len(path) - 1 if path else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--systems", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=100_000)
+    parser.add_argument("--samples", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(json.dumps(run(args.systems, args.edges, args.samples, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
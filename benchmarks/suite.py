@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: core operations on a synthetic large repository.
+
+Generates a deterministic tree (see synthetic_tree.py), initializes a
+project in it, maps a share of the significant files to `systems` systems
+with insights and dependencies, then times:
+
+    scan_files          FileScanner().scan_files() from cold
+    update_stats        rescan + refresh scan_stats + save
+    validate_full       validate_schema(full=True)
+    validate_cached     validate_schema() with nothing changed
+    save_state          one small edit, then save_state()
+    load_state          StateManager() - read, verify and hydrate
+    insight_validation  check_insight() on every recorded insight
+
+and prints one JSON document with the package version, the tree manifest
+and the timings (best of --repeat). Pass --baseline with an earlier result
+to list steps that got slower than --tolerance; the exit status is 1 if
+any did, so a release can be compared against the last one.
+
+Usage:
+    python benchmarks/suite.py --files 100000 --systems 200 > bench.json
+    python benchmarks/suite.py --files 100000 --systems 200 --baseline bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "src"))
+sys.path.insert(0, HERE)
+
+import arch_scribe  # noqa: E402
+from insight_quality import corpus  # noqa: E402
+from synthetic_tree import generate  # noqa: E402
+
+STEPS = (
+    "scan_files", "update_stats", "validate_full", "validate_cached",
+    "save_state", "load_state", "insight_validation",
+)
+
+
+def _best(fn, repeat):
+    """(best wall time in ms over `repeat` runs, last result)."""
+    best, result = None, None
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 2), result
+
+
+def populate(mgr, sig_paths, systems, insights, mapped=0.5, seed=0):
+    """Map `mapped` of the significant files to `systems` systems in
+    contiguous slices, give each `insights` insights and a few
+    dependencies on earlier systems. Applies the pure ops directly and
+    saves once."""
+    from arch_scribe.operations import dependency_ops, insight_ops, system_ops
+
+    rng = random.Random(seed)
+    paths = sorted(sig_paths)[: int(len(sig_paths) * mapped)]
+    texts = iter(corpus(systems * insights, seed))
+    per_system = -(-len(paths) // systems) if paths else 0
+    for i in range(systems):
+        name = f"System {i}"
+        system_ops.add_system(mgr.data, name)
+        system_ops.map_files(mgr.data, name, paths[i * per_system:(i + 1) * per_system])
+        for _ in range(insights):
+            insight_ops.add_insight(mgr.data, name, next(texts))
+        for target in rng.sample(range(i), min(i, 3)):
+            dependency_ops.add_dependency(mgr.data, name, f"System {target}", "calls into it")
+    mgr.save_state()
+
+
+def run(files, systems=50, insights=5, repeat=1, seed=0, directory=None, **tree_options):
+    """Generate the tree, run every step and return the result dict."""
+    from arch_scribe.core.constants import STATE_FILE
+    from arch_scribe.core.state_manager import StateManager
+    from arch_scribe.metrics.insight_quality import check_insight
+    from arch_scribe.scanning.file_scanner import FileScanner
+
+    owns_dir = directory is None
+    if owns_dir:
+        directory = tempfile.mkdtemp(prefix="arch-scribe-bench-")
+    manifest = generate(directory, files, seed=seed, **tree_options)
+
+    cwd = os.getcwd()
+    os.chdir(directory)
+    timings = {}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            timings["scan_files"], (total, sig_total, sig_paths) = _best(
+                lambda: FileScanner().scan_files(), repeat
+            )
+            mgr = StateManager()
+            mgr.init_project("Synthetic")
+            populate(mgr, sig_paths, systems, insights, seed=seed)
+
+            timings["update_stats"], _ = _best(mgr.update_stats, repeat)
+            timings["validate_full"], errors = _best(lambda: mgr.validate_schema(full=True), repeat)
+            timings["validate_cached"], _ = _best(mgr.validate_schema, repeat)
+
+            def edit_and_save():
+                mgr.update_system("System 0", f"Edited at {time.perf_counter()}")
+
+            # update_system saves; the edit itself is negligible
+            timings["save_state"], _ = _best(edit_and_save, repeat)
+            timings["load_state"], loaded = _best(StateManager, repeat)
+
+            texts = [t for s in loaded.data["systems"].values() for t in s["insights"]]
+            check_insight("")  # compile the matcher outside the timed region
+            timings["insight_validation"], _ = _best(
+                lambda: [check_insight(t) for t in texts], repeat
+            )
+            state_bytes = os.path.getsize(STATE_FILE)
+    finally:
+        os.chdir(cwd)
+        if owns_dir:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    scan_s = timings["scan_files"] / 1000
+    check_s = timings["insight_validation"] / 1000
+    return {
+        "version": arch_scribe.__version__,
+        "python": platform.python_version(),
+        "tree": manifest,
+        "scanned": {"total": total, "significant": sig_total},
+        "systems": systems,
+        "insights": len(texts),
+        "schema_errors": len(errors),
+        "state_bytes": state_bytes,
+        "repeat": repeat,
+        "timings_ms": timings,
+        "files_per_s": round(total / scan_s) if scan_s else None,
+        "insights_per_s": round(len(texts) / check_s) if check_s else None,
+    }
+
+
+def compare(result, baseline, tolerance=0.25, floor_ms=5.0):
+    """Steps slower than baseline by more than `tolerance` (a fraction)
+    and by at least `floor_ms`, so timer noise on tiny steps is ignored."""
+    regressions = []
+    old = baseline.get("timings_ms", {})
+    for step, ms in result["timings_ms"].items():
+        before = old.get(step)
+        if before is None:
+            continue
+        if ms > before * (1 + tolerance) and ms - before >= floor_ms:
+            regressions.append(
+                {"step": step, "baseline_ms": before, "ms": ms, "ratio": round(ms / before, 2)}
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=10000, help="1k to 1M")
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--per-dir", type=int, default=32, help="files per leaf directory")
+    parser.add_argument("--size-median", type=int, default=3000, help="bytes")
+    parser.add_argument("--size-sigma", type=float, default=1.5, help="log-normal spread")
+    parser.add_argument("--patterns", type=int, default=20, help=".gitignore rules")
+    parser.add_argument("--ignored", type=float, default=0.1, help="share of files gitignored")
+    parser.add_argument("--data", type=float, default=0.1, help="share of files in data dirs")
+    parser.add_argument("--systems", type=int, default=50)
+    parser.add_argument("--insights", type=int, default=5, help="per system")
+    parser.add_argument("--repeat", type=int, default=1, help="report the best of N runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dir", help="generate here and keep it (default: temporary)")
+    parser.add_argument("--baseline", help="earlier result JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    tree_options = {
+        "depth": args.depth,
+        "per_dir": args.per_dir,
+        "size_median": args.size_median,
+        "size_sigma": args.size_sigma,
+        "patterns": args.patterns,
+        "ignored": args.ignored,
+        "data": args.data,
+    }
+    result = run(
+        args.files, args.systems, args.insights, args.repeat, args.seed, args.dir, **tree_options
+    )
+    if args.baseline:
+        with open(args.baseline) as f:
+            result["regressions"] = compare(result, json.load(f), args.tolerance)
+    print(json.dumps(result, indent=2))
+    if result.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic source tree for the scale benchmarks.
+
+Lays out `files` files under `src/` in a balanced directory tree `depth`
+levels deep (about `per_dir` files per leaf directory), with log-normal
+file sizes, a .gitignore of `patterns` rules that a share of the files
+match, files under known data directories, and a few under always-ignored
+directories (node_modules, build) or with ignored extensions. The same
+arguments and seed always give the same tree; `digest` in the manifest
+identifies it.
+
+Files are created sparse (truncated to size, no content written), so a
+1M-file tree costs inodes rather than gigabytes.
+
+Usage:
+    python benchmarks/synthetic_tree.py /tmp/tree --files 100000 --depth 5
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import time
+
+DATA_DIRS = ("data", "assets", "fixtures", "locales", "static")
+VENDOR_DIRS = ("node_modules", "build", "dist")
+STEMS = ("module", "handler", "service", "util", "model", "client", "test_case")
+# (extension, weight) for ordinary files under src/
+EXTENSIONS = (
+    (".py", 30), (".js", 15), (".ts", 10), (".go", 8), (".md", 8), (".json", 8),
+    (".yaml", 4), (".txt", 4), (".csv", 3), (".lock", 2), (".png", 4), ("", 4),
+)
+DATA_EXTENSIONS = (".json", ".csv", ".txt", ".yaml")
+
+
+def gitignore(patterns):
+    """`patterns` rules cycling through directory, extension and prefix
+    globs, with a comment every ten."""
+    lines = []
+    for k in range(patterns):
+        if k % 10 == 0:
+            lines.append(f"# group {k // 10}")
+        lines.append(("gen{k}/", "*.g{k}", "tmp{k}_*")[k % 3].format(k=k))
+    return lines
+
+
+def plan(files, depth=4, per_dir=32, seed=0, size_median=3000, size_sigma=1.5,
+         max_size=2 << 20, patterns=20, ignored=0.1, data=0.1, vendor=0.02):
+    """Yield (category, path, size) for every file, deterministically.
+
+    Categories: "source", "data" (under a data directory), "gitignored"
+    (matches a .gitignore rule) and "vendor" (always-ignored directory).
+    """
+    rng = random.Random(seed)
+    n_dirs = max(1, math.ceil(files / per_dir))
+    branching = max(2, math.ceil(n_dirs ** (1 / max(depth, 1))))
+    extensions = [e for e, _ in EXTENSIONS]
+    weights = [w for _, w in EXTENSIONS]
+    mu = math.log(size_median)
+
+    for j in range(files):
+        i, parts = j // per_dir, []
+        for _ in range(depth):
+            i, digit = divmod(i, branching)
+            parts.append(f"pkg{digit}")
+        subdir = "/".join(reversed(parts))
+        name = f"{rng.choice(STEMS)}{j}"
+        size = min(int(rng.lognormvariate(mu, size_sigma)), max_size)
+
+        roll = rng.random()
+        if roll < vendor:
+            category, top, ext = "vendor", rng.choice(VENDOR_DIRS), ".js"
+        elif roll < vendor + data:
+            category, top, ext = "data", rng.choice(DATA_DIRS), rng.choice(DATA_EXTENSIONS)
+        else:
+            category, top = "source", "src"
+            ext = rng.choices(extensions, weights)[0]
+        if category == "source" and patterns and roll < vendor + data + ignored:
+            category, k = "gitignored", rng.randrange(patterns)
+            if k % 3 == 0:
+                top = f"gen{k}"
+            elif k % 3 == 1:
+                ext = f".g{k}"
+            else:
+                name = f"tmp{k}_{name}"
+        yield category, f"{top}/{subdir}/{name}{ext}", size
+
+
+def generate(root, files, **options):
+    """Write the tree under `root` and return its manifest."""
+    started = time.perf_counter()
+    os.makedirs(root, exist_ok=True)
+    rules = gitignore(options.get("patterns", 20))
+    with open(os.path.join(root, ".gitignore"), "w") as f:
+        f.write("\n".join(rules) + "\n")
+
+    made, digest = set(), hashlib.sha1()
+    counts = {"source": 0, "data": 0, "gitignored": 0, "vendor": 0}
+    total_bytes = 0
+    for category, path, size in plan(files, **options):
+        directory = os.path.dirname(path)
+        if directory not in made:
+            os.makedirs(os.path.join(root, directory), exist_ok=True)
+            made.add(directory)
+        with open(os.path.join(root, path), "wb") as f:
+            f.truncate(size)
+        digest.update(f"{path}\0{size}\n".encode())
+        counts[category] += 1
+        total_bytes += size
+
+    return {
+        "files": files,
+        "options": options,
+        "dirs": len(made),
+        "bytes": total_bytes,
+        "gitignore_rules": len(rules),
+        "categories": counts,
+        "digest": digest.hexdigest(),
+        "generate_s": round(time.perf_counter() - started, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("root")
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--depth", type=int, default=4)
+    parser.add_argument("--per-dir", type=int, default=32, help="files per leaf directory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--size-median", type=int, default=3000, help="bytes")
+    parser.add_argument("--size-sigma", type=float, default=1.5, help="log-normal spread")
+    parser.add_argument("--patterns", type=int, default=20, help=".gitignore rules")
+    parser.add_argument("--ignored", type=float, default=0.1, help="share of files gitignored")
+    parser.add_argument("--data", type=float, default=0.1, help="share of files in data dirs")
+    args = parser.parse_args()
+
+    options = {k: v for k, v in vars(args).items() if k not in ("root", "files")}
+    print(json.dumps(generate(args.root, args.files, **options), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,18 @@ LLM-guided architecture documentation generator.
 
 __version__ = "0.1.0"
 
-from .core.state_manager import StateManager
-from .arch_state import main
+__all__ = ["StateManager", "main"]
 
-__all__ = ["StateManager", "main"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Resolved on first access so that `import arch_scribe` (and the CLI's
+    # --help path) doesn't pay for the scanner, metrics and word lists.
+    if name == "StateManager":
+        from .core.state_manager import StateManager
+
+        return StateManager
+    if name == "main":
+        from .arch_state import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
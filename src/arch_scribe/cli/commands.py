@@ -1 +1,364 @@
-# commands.py - placeholder
+import argparse
+
+from ..core.constants import Colors
+
+
+STRICTNESS = ("lenient", "standard", "strict")
+# Output formats (see cli.output); kept here so --help doesn't import it
+FORMATS = ("text", "json", "jsonl")
+
+
+def _parser_with(*parents):
+    """ArgumentParser subclass that adds `parents` to every subcommand."""
+
+    class Parser(argparse.ArgumentParser):
+        def __init__(self, **kwargs):
+            kwargs.setdefault("parents", list(parents))
+            super().__init__(**kwargs)
+
+    return Parser
+
+
+def _add_strictness(cmd, default="standard"):
+    cmd.add_argument(
+        "--strictness", choices=STRICTNESS, default=default, help="insight quality level"
+    )
+
+
+def _add_yes(cmd, what):
+    cmd.add_argument("--yes", "-y", action="store_true", help=f"{what} without asking")
+
+
+def _confirm(args):
+    """Answer for a confirmation prompt: yes with --yes; otherwise ask in
+    text mode and decline in json/jsonl, which must never block on stdin."""
+    if args.yes:
+        return True
+    return None if args.format == "text" else False
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--format", choices=FORMATS, default="text", help="text, or compact JSON / JSON Lines for tools"
+    )
+    # Also accepted after the subcommand; only overrides when given there
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--format", choices=FORMATS, default=argparse.SUPPRESS)
+    sub = parser.add_subparsers(dest="cmd", parser_class=_parser_with(common))
+
+    init = sub.add_parser("init")
+    init.add_argument("name")
+    _add_yes(init, "overwrite an existing state file")
+    status = sub.add_parser("status")
+    status.add_argument("--refresh", action="store_true", help="rescan even if the tree looks unchanged")
+    sub.add_parser("list")
+    graph = sub.add_parser("graph")
+    graph.add_argument("--collapse-cycles", action="store_true", help="draw each cycle as one node")
+    graph.add_argument(
+        "--collapse-leaves", action="store_true", help="fold leaves of the same system into one node"
+    )
+    graph.add_argument(
+        "--max-nodes", type=int, default=None, help="nodes per diagram before sharding (0 = never shard)"
+    )
+    graph.add_argument("--out", help="directory for index.md and one file per shard")
+    # Its own --format picks exporters; the output format goes before "export"
+    export = sub.add_parser("export", parents=[])
+    export.add_argument(
+        "--format",
+        dest="formats",
+        nargs="+",
+        choices=("dot", "graphml", "jgf", "csv", "mermaid"),
+        default=["dot", "graphml", "jgf", "csv"],
+    )
+    export.add_argument("--out", default="architecture-export", help="output directory")
+    export.add_argument("--workers", type=int, help="formats rendered at once (default: all)")
+    graph_stats = sub.add_parser("graph-stats")
+    graph_stats.add_argument("--top", type=int, default=10, help="entries per ranking")
+    graph_stats.add_argument("--path", nargs=2, metavar=("FROM", "TO"), help="shortest dependency chain")
+    graph_stats.add_argument(
+        "--samples", type=int, default=32, help="source systems for estimated betweenness"
+    )
+    validate = sub.add_parser("validate")
+    _add_strictness(validate, default=None)
+    validate.add_argument("--full", action="store_true", help="recheck every system")
+    sub.add_parser("verify-stats")
+    recompute = sub.add_parser("recompute")
+    recompute.add_argument("--full", action="store_true", help="rescore every system")
+    audit = sub.add_parser("audit")
+    audit.add_argument("--corpus", help="JSONL file of insights instead of the state")
+    audit.add_argument(
+        "--workers", type=int, default=1, help="process pool size (0 = one per CPU)"
+    )
+    audit.add_argument("--all", action="store_true", help="list passing insights too")
+    audit.add_argument("--out", help="write per-insight results as JSONL")
+    _add_strictness(audit)
+    dedupe = sub.add_parser("dedupe")
+    dedupe.add_argument("--threshold", type=float, default=0.8)
+    coverage = sub.add_parser("coverage")
+    coverage.add_argument("--depth", type=int, help="subtree totals down to this depth")
+    coverage.add_argument("--min-files", type=int, default=1, help="hide smaller directories")
+    coverage.add_argument("--rescan", action="store_true", help="rescan instead of using the last scan")
+    coverage.add_argument("--top", type=int, default=10, help="unmapped files to list")
+    coverage.add_argument("--rank", choices=("bytes", "lines", "priority"), default="bytes")
+    trend = sub.add_parser("trend")
+    trend.add_argument("--field", default="coverage", help="series column (coverage, quality, mapped, systems, ...)")
+    trend.add_argument("--sessions", type=int, default=5)
+    trend.add_argument("--system", help="completeness history of one system instead")
+
+    sub.add_parser("owner").add_argument("path")
+    owners = sub.add_parser("owners")
+    owners_mode = owners.add_mutually_exclusive_group()
+    owners_mode.add_argument("--dir", dest="prefix", default=".")
+    owners_mode.add_argument("--shared", action="store_true")
+
+    sub.add_parser("session-start")
+    sub.add_parser("session-end")
+
+    show = sub.add_parser("show")
+    show.add_argument("name")
+    show.add_argument("--summary", action="store_true")
+
+    sub.add_parser("add").add_argument("name")
+
+    upd = sub.add_parser("update")
+    upd.add_argument("name")
+    upd.add_argument("--desc")
+
+    map_cmd = sub.add_parser("map")
+    map_cmd.add_argument("name")
+    map_cmd.add_argument("files", nargs="+")
+
+    ins = sub.add_parser("insight")
+    ins.add_argument("name")
+    ins.add_argument("text")
+    _add_strictness(ins)
+    _add_yes(ins, "add an insight that fails the quality check")
+
+    dep = sub.add_parser("dep")
+    dep.add_argument("name")
+    dep.add_argument("target")
+    dep.add_argument("reason")
+    _add_yes(dep, "create a missing target system")
+
+    return parser
+
+
+# --- HANDLERS ---
+# Each handler receives a StateManager and the parsed args. Anything heavier
+# than the state itself (scanner, word lists) is built lazily by the manager,
+# so handlers only pay for what their command actually touches. Handlers
+# return whether the command succeeded (cli.output reports it as "ok").
+
+
+def cmd_init(mgr, args):
+    return mgr.init_project(args.name, overwrite=_confirm(args))
+
+
+def cmd_status(mgr, args):
+    mgr.print_status(args.refresh)
+
+
+def cmd_list(mgr, args):
+    mgr.list_systems()
+
+
+def cmd_graph(mgr, args):
+    return mgr.export_graph(args.collapse_cycles, args.collapse_leaves, args.max_nodes, args.out) is not None
+
+
+def cmd_export(mgr, args):
+    return mgr.export_reports(args.formats, args.out, args.workers) is not None
+
+
+def cmd_graph_stats(mgr, args):
+    mgr.print_graph_stats(args.top, args.path, args.samples)
+
+
+def cmd_validate(mgr, args):
+    errors = mgr.validate_schema(args.strictness, args.full)
+    if errors:
+        print(f"\n{Colors.FAIL}❌ Validation Errors:{Colors.ENDC}")
+        for e in errors:
+            print(f"  • {e}")
+    else:
+        print(f"\n{Colors.GREEN}✅ Validation passed. Ready for Phase 2.{Colors.ENDC}")
+    return not errors
+
+
+def cmd_verify_stats(mgr, args):
+    errors = mgr.verify_stats()
+    if errors:
+        print(f"\n{Colors.FAIL}❌ Aggregates out of sync:{Colors.ENDC}")
+        for e in errors:
+            print(f"  • {e}")
+    else:
+        print(f"\n{Colors.GREEN}✅ Progress and scan stats match a full recomputation.{Colors.ENDC}")
+    return not errors
+
+
+def cmd_recompute(mgr, args):
+    mgr.recompute_metrics(args.full)
+    return True
+
+
+def cmd_trend(args):
+    """Answers from the time series alone; the state file is never read."""
+    import datetime
+
+    from ..core.timeseries import Series
+
+    series = Series()
+    if not len(series):
+        print(f"{Colors.WARNING}No history recorded yet (run status or a session first).{Colors.ENDC}")
+        return
+
+    def when(ts):
+        return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M")
+
+    if args.system:
+        print(f"\n{Colors.HEADER}=== 📈 {args.system}: completeness ==={Colors.ENDC}")
+        for ts, value in series.system_history(args.system):
+            print(f"  {when(ts)}  {value:>3}%")
+        return
+
+    try:
+        deltas = series.session_deltas(args.field, args.sessions)
+    except KeyError as e:
+        print(f"{Colors.FAIL}{e.args[0]}{Colors.ENDC}")
+        return
+    print(f"\n{Colors.HEADER}=== 📈 {args.field}: last {args.sessions} sessions ==={Colors.ENDC}")
+    if not deltas:
+        for ts, value in series.trend(args.field, args.sessions):
+            print(f"  {when(ts)}  {value:g}")
+        print(f"{Colors.BLUE}No complete sessions recorded; showing the latest updates.{Colors.ENDC}")
+        return
+    for sid, delta in deltas:
+        print(f"  Session {sid:<4} {delta:+g}")
+    velocity = series.velocity(args.field, args.sessions)
+    print(f"{Colors.BOLD}Velocity: {velocity:+.2f} per session{Colors.ENDC}")
+
+
+def cmd_audit(mgr, args):
+    return mgr.audit_insights(args.corpus, args.workers, args.all, args.out, args.strictness) is not None
+
+
+def cmd_dedupe(mgr, args):
+    return mgr.print_duplicates(args.threshold) is not None
+
+
+def cmd_coverage(mgr, args):
+    mgr.print_coverage_detail(args.depth, args.min_files, args.rescan, args.top, args.rank)
+
+
+def cmd_owner(mgr, args):
+    mgr.print_owner(args.path)
+
+
+def cmd_owners(mgr, args):
+    mgr.print_owners(args.prefix, shared=args.shared)
+
+
+def cmd_session_start(mgr, args):
+    return mgr.start_session()
+
+
+def cmd_session_end(mgr, args):
+    return mgr.end_session()
+
+
+def cmd_show(mgr, args):
+    mgr.show_system(args.name, args.summary)
+
+
+def cmd_add(mgr, args):
+    return mgr.add_system(args.name)
+
+
+def cmd_update(mgr, args):
+    return mgr.update_system(args.name, args.desc)
+
+
+def cmd_map(mgr, args):
+    return mgr.map_files(args.name, args.files)
+
+
+def cmd_insight(mgr, args):
+    return mgr.add_insight(
+        args.name, args.text, force=False, strictness=args.strictness, confirm=_confirm(args)
+    )
+
+
+def cmd_dep(mgr, args):
+    return mgr.add_dependency(args.name, args.target, args.reason, create=_confirm(args))
+
+
+COMMANDS = {
+    "init": cmd_init,
+    "status": cmd_status,
+    "list": cmd_list,
+    "graph": cmd_graph,
+    "graph-stats": cmd_graph_stats,
+    "export": cmd_export,
+    "validate": cmd_validate,
+    "verify-stats": cmd_verify_stats,
+    "recompute": cmd_recompute,
+    "audit": cmd_audit,
+    "dedupe": cmd_dedupe,
+    "coverage": cmd_coverage,
+    "owner": cmd_owner,
+    "owners": cmd_owners,
+    "session-start": cmd_session_start,
+    "session-end": cmd_session_end,
+    "show": cmd_show,
+    "add": cmd_add,
+    "update": cmd_update,
+    "map": cmd_map,
+    "insight": cmd_insight,
+    "dep": cmd_dep,
+}
+
+
+# Commands that never need the state loaded: handler(args)
+STANDALONE = {
+    "trend": cmd_trend,
+}
+
+
+def run(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.cmd in STANDALONE:
+        if args.format != "text":
+            from . import output
+
+            output.run_standalone(STANDALONE[args.cmd], args)
+        else:
+            STANDALONE[args.cmd](args)
+        return
+
+    handler = COMMANDS.get(args.cmd)
+    if handler is None:
+        parser.print_help()
+        return
+
+    from ..reporting import render_cache
+
+    def manager():
+        from ..core.state_manager import StateManager
+
+        return StateManager()
+
+    if args.format != "text":
+        from . import output
+
+        def call():
+            output.run(handler, manager, args)
+    else:
+        def call():
+            handler(manager(), args)
+
+    # Read-only reports are answered from the render cache when unchanged
+    if not render_cache.run(call, args):
+        call()
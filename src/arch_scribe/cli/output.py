@@ -0,0 +1,320 @@
+"""
+Machine-readable output: `--format json` and `--format jsonl`.
+
+Commands with a structured result (STRUCTURED) return a dict; an `items`
+entry, if present, is an iterable of records produced lazily. `json` writes
+the whole result as one compact object; `jsonl` writes the result without
+`items` as a header line, then one line per item as it is produced, so
+`list` and `coverage` never hold their whole output. The remaining
+commands are the single-line mutations (init, add, update, map, insight,
+dep): their handler reports success as "ok" and the lines it printed are
+passed on as "messages", with only the terminal colors removed.
+
+Whatever a structured command prints along the way is captured and
+dropped rather than mixed into the output, and everything goes out through
+one buffered Writer.
+"""
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class Writer:
+    """Single buffered sink: records are joined and written in chunks."""
+
+    CHUNK = 1 << 16
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.CHUNK:
+            self.flush()
+
+    def record(self, obj):
+        self.write(json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default) + "\n")
+
+    def flush(self):
+        if self._parts:
+            self.stream.write("".join(self._parts))
+            self._parts.clear()
+            self._size = 0
+        self.stream.flush()
+
+
+def _default(obj):
+    from ..core.models import to_json
+
+    if isinstance(obj, (set, frozenset, tuple)):
+        return sorted(obj) if isinstance(obj, (set, frozenset)) else list(obj)
+    return to_json(obj)
+
+
+def clean(text):
+    """Non-blank message lines without terminal colors."""
+    return [line.strip() for line in _ANSI.sub("", text).splitlines() if line.strip()]
+
+
+@contextlib.contextmanager
+def _captured():
+    buffer = io.StringIO()
+    real = sys.stdout
+    sys.stdout = buffer
+    try:
+        yield buffer
+    finally:
+        sys.stdout = real
+
+
+def emit(fmt, command, result, writer=None):
+    """Write a command's result in `fmt` (json or jsonl)."""
+    writer = writer or Writer()
+    result = dict(result)
+    items = result.pop("items", None)
+    head = {"command": command, "ok": result.pop("ok", True), **result}
+    if fmt == "json":
+        if items is not None:
+            head["items"] = list(items)
+        writer.record(head)
+    else:
+        writer.record(head)
+        for item in items or ():
+            writer.record(item)
+    writer.flush()
+
+
+# --- structured results ---
+NO_STATE = {"ok": False, "error": "No architecture.json found (run init first)"}
+
+
+def _status(mgr, args):
+    return mgr.status_summary(args.refresh)
+
+
+def _list(mgr, args):
+    return {"items": mgr.systems_summary()}
+
+
+def _show(mgr, args):
+    system = mgr.data["systems"].get(args.name)
+    if system is None:
+        return {"ok": False, "error": f"System '{args.name}' not found"}
+    if args.summary:
+        return {
+            "name": args.name,
+            "description": system["description"],
+            "completeness": system["completeness"],
+            "dependencies": [d["system"] for d in system.get("dependencies", [])],
+            "top_insights": system.get("insights", [])[:3],
+        }
+    return {"name": args.name, "system": system}
+
+
+def _coverage(mgr, args):
+    rows, unmapped = mgr.coverage_report(args.depth, args.min_files, args.rescan, args.top, args.rank)
+
+    def items():
+        for directory, mapped, total in rows:
+            yield {"type": "dir", "dir": directory, "mapped": mapped, "total": total}
+        for path, size, lines, score in unmapped:
+            yield {"type": "unmapped", "file": path, "bytes": size, "lines": lines, "score": round(score, 2)}
+
+    return {"depth": args.depth, "rank": args.rank, "items": items()}
+
+
+def _validate(mgr, args):
+    errors = mgr.validate_schema(args.strictness, args.full)
+    return {"ok": not errors, "errors": errors}
+
+
+def _verify_stats(mgr, args):
+    mismatches = mgr.verify_stats()
+    return {"ok": not mismatches, "mismatches": mismatches}
+
+
+def _owner(mgr, args):
+    from ..core.index import index_of
+
+    owners = index_of(mgr.data).owners_of(args.path)
+    return {"ok": bool(owners), "path": args.path, "owners": owners}
+
+
+def _owners(mgr, args):
+    from ..core.index import index_of
+
+    index = index_of(mgr.data)
+    entries = index.shared() if args.shared else index.under(args.prefix or ".")
+    return {"items": ({"path": p, "owners": o} for p, o in entries.items())}
+
+
+def _graph_stats(mgr, args):
+    if args.path:
+        source, target = args.path
+        try:
+            chain = mgr.dependency_path(source, target)
+        except KeyError as e:
+            return {"ok": False, "error": f"System '{e.args[0]}' not found"}
+        return {"ok": chain is not None, "path": chain}
+    return mgr.graph_summary(args.top, args.samples)
+
+
+def _graph(mgr, args):
+    from ..reporting import mermaid
+
+    if args.out is None:
+        buffer = io.StringIO()
+        diagrams = mgr.export_graph(
+            args.collapse_cycles, args.collapse_leaves, args.max_nodes, out=buffer
+        )
+        return {"diagrams": diagrams, "mermaid": buffer.getvalue()}
+    diagrams = mgr.export_graph(args.collapse_cycles, args.collapse_leaves, args.max_nodes, args.out)
+    names = ["index.md"] + [mermaid.shard_file(i) for i in range(diagrams if diagrams > 1 else 0)]
+    return {"diagrams": diagrams, "files": [os.path.join(args.out, n) for n in names]}
+
+
+def _export(mgr, args):
+    from ..reporting.reporters import Model, render
+
+    try:
+        written = render(Model.from_state(mgr.data), args.formats, args.out, args.workers)
+    except ValueError as e:
+        return {"ok": False, "error": str(e)}
+    return {"out": args.out, "files": written}
+
+
+def _recompute(mgr, args):
+    return {"changed": mgr.recompute_metrics(args.full)}
+
+
+def _audit(mgr, args):
+    from ..metrics.audit import summarize
+
+    report = mgr.audit_report(args.corpus, args.workers, args.out, args.strictness)
+    if report is None:
+        return {"ok": False, "error": f"Corpus '{args.corpus}' not found"}
+    results, source = report
+    return {
+        "source": source,
+        "strictness": args.strictness,
+        "systems": summarize(results),
+        "items": results,
+    }
+
+
+def _dedupe(mgr, args):
+    from ..operations.insight_ops import duplicate_clusters
+
+    systems = mgr.data["systems"]
+
+    def items():
+        for cluster in duplicate_clusters(mgr.data, args.threshold):
+            yield {
+                "insights": [
+                    {"system": name, "position": i, "text": systems[name]["insights"][i]}
+                    for name, i in cluster
+                ]
+            }
+
+    return {"threshold": args.threshold, "items": items()}
+
+
+def _session_start(mgr, args):
+    if not mgr.start_session():
+        return None
+    return {"session": mgr.data["metadata"]["total_sessions"]}
+
+
+def _session_end(mgr, args):
+    if not mgr.end_session():
+        return {"ok": False, "error": "No active session found (run session-start first)"}
+    return {"session": mgr.data["metadata"]["session_history"][-1]}
+
+
+STRUCTURED = {
+    "status": _status,
+    "list": _list,
+    "show": _show,
+    "coverage": _coverage,
+    "validate": _validate,
+    "verify-stats": _verify_stats,
+    "owner": _owner,
+    "owners": _owners,
+    "graph-stats": _graph_stats,
+    "graph": _graph,
+    "export": _export,
+    "recompute": _recompute,
+    "audit": _audit,
+    "dedupe": _dedupe,
+    "session-start": _session_start,
+    "session-end": _session_end,
+}
+
+
+def _trend(args):
+    from ..core.timeseries import Series
+
+    series = Series()
+    if args.system:
+        history = series.system_history(args.system)
+        return {"system": args.system, "items": ({"ts": t, "completeness": v} for t, v in history)}
+    try:
+        deltas = series.session_deltas(args.field, args.sessions)
+    except KeyError as e:
+        return {"ok": False, "error": e.args[0]}
+    return {
+        "field": args.field,
+        "velocity": series.velocity(args.field, args.sessions),
+        "items": ({"session": sid, "delta": d} for sid, d in deltas),
+    }
+
+
+STANDALONE = {"trend": _trend}
+
+
+def _needs_state(args):
+    """init creates the state and audit --corpus scores a file instead."""
+    if args.cmd == "init":
+        return False
+    return not (args.cmd == "audit" and args.corpus)
+
+
+def run(text_handler, manager, args):
+    """Run a state command in args.format: its structured result if it has
+    one, else its text output as messages."""
+    structured = STRUCTURED.get(args.cmd)
+    with _captured() as printed:
+        mgr = manager()
+        if mgr.data is None and _needs_state(args):
+            result = NO_STATE
+        elif structured is not None:
+            result = structured(mgr, args) or NO_STATE
+        else:
+            result = {"ok": bool(text_handler(mgr, args))}
+            messages = clean(printed.getvalue())
+            if messages:
+                result["messages"] = messages
+    emit(args.format, args.cmd, dict(result))
+
+
+def run_standalone(text_handler, args):
+    structured = STANDALONE.get(args.cmd)
+    with _captured() as printed:
+        result = structured(args) if structured is not None else None
+        if result is None:
+            text_handler(args)
+    if result is None:
+        result = {"ok": True}
+    result = dict(result)
+    messages = clean(printed.getvalue())
+    if messages:
+        result["messages"] = messages
+    emit(args.format, args.cmd, result)
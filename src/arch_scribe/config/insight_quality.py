@@ -141,11 +141,18 @@ IMPACT_WORDS = [
     'providing visibility', 'tracking behavior', 'measuring impact',
 ]
 
+# [HOW] - Connectives that introduce the mechanism (checked by 'strict')
+HOW_WORDS = [
+    'using', 'via', 'through', 'with', 'by', 'by means of', 'backed by',
+    'built on', 'based on', 'on top of', 'leveraging', 'powered by',
+    'implemented as', 'in terms of',
+]
+
 # Quality thresholds
 MIN_WORD_COUNT = 15  # Minimum words for a complete insight
 MAX_WORD_COUNT = 100  # Maximum to prevent rambling (optional enforcement)
 
-# Optional: Validation strictness levels (for future use)
+# Validation strictness levels (see metrics/quality_rules.py)
 STRICTNESS_LEVELS = {
     'lenient': {
         'min_words': 10,
@@ -161,6 +168,6 @@ STRICTNESS_LEVELS = {
         'min_words': 20,
         'require_action': True,
         'require_impact': True,
-        'require_how': True,  # Future: detect technical implementation details
+        'require_how': True,  # a HOW_WORDS connective must be present
     }
 }
\ No newline at end of file
@@ -0,0 +1,110 @@
+"""
+Which systems changed since a consumer last looked at them.
+
+Mutations mark the systems they touch on the in-memory State (`State.dirty`).
+On save the marks are stamped with the new state_version in a sidecar
+(CHANGES_FILE). Consumers - validation, the metric recompute - record a
+checkpoint when they finish a pass, and next time only revisit the systems
+changed after it. Validation results are cached per system in the same file.
+
+No checkpoint, a plain dict state or a reset (migration, salvage, init)
+means a full pass.
+"""
+import json
+import os
+
+from .constants import CHANGES_FILE
+from .models import State
+
+VALIDATE = "validate"
+METRICS = "metrics"
+
+
+def mark(data, name):
+    """Record that system `name` changed (no-op for plain dicts)."""
+    if isinstance(data, State):
+        data.dirty.add(name)
+
+
+def unsaved(data):
+    """Names marked on this State and not yet saved."""
+    return set(data.dirty) if isinstance(data, State) else set()
+
+
+class ChangeLog:
+    """{system: last changed version}, consumer checkpoints, cached results."""
+
+    __slots__ = ("changed", "checkpoints", "results", "dirty")
+
+    def __init__(self, changed=None, checkpoints=None, results=None):
+        self.changed = changed if changed is not None else {}
+        self.checkpoints = checkpoints if checkpoints is not None else {}
+        self.results = results if results is not None else {}
+        self.dirty = False
+
+    def record(self, names, version):
+        for name in names:
+            self.changed[name] = version
+        self.dirty = True
+
+    def since(self, consumer):
+        """Systems changed after `consumer`'s checkpoint; None if it has none."""
+        stamp = self.checkpoints.get(consumer)
+        if stamp is None:
+            return None
+        return {name for name, v in self.changed.items() if v > stamp}
+
+    def checkpoint(self, consumer, version):
+        if self.checkpoints.get(consumer) != version:
+            self.checkpoints[consumer] = version
+            self.dirty = True
+        # Entries every consumer has seen are no longer needed
+        oldest = min(self.checkpoints.values())
+        stale = [name for name, v in self.changed.items() if v <= oldest]
+        for name in stale:
+            del self.changed[name]
+
+    # --- persistence ---
+    @classmethod
+    def load(cls, path=CHANGES_FILE):
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+        except json.JSONDecodeError:
+            return cls()
+        return cls(raw.get("changed"), raw.get("checkpoints"), raw.get("results"))
+
+    def save(self, path=CHANGES_FILE):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp = path + ".tmp"
+        with open(temp, "w") as f:
+            json.dump(
+                {
+                    "changed": self.changed,
+                    "checkpoints": self.checkpoints,
+                    "results": self.results,
+                },
+                f,
+            )
+        os.replace(temp, path)
+        self.dirty = False
+
+
+def commit(data, version, path=CHANGES_FILE):
+    """Stamp the State's unsaved marks with `version`. Call under the lock."""
+    if not isinstance(data, State) or not data.dirty:
+        return
+    log = ChangeLog.load(path)
+    log.record(data.dirty, version)
+    log.save(path)
+    data.dirty.clear()
+
+
+def reset(path=CHANGES_FILE):
+    """Forget every checkpoint, forcing full passes."""
+    if os.path.exists(path):
+        os.remove(path)
@@ -1,9 +1,35 @@
-import datetime
-
 # --- CONFIGURATION ---
 STATE_FILE = "architecture.json"
 BACKUP_FILE = "architecture.json.backup"
 SESSION_FILE = ".session_start"
+LOCK_FILE = "architecture.json.lock"
+
+# Derived data (path table, indexes, caches) lives in a sidecar directory
+CACHE_DIR = ".arch_scribe"
+PATHS_FILE = CACHE_DIR + "/paths.json"
+OWNERS_FILE = CACHE_DIR + "/owners.json"
+JOURNAL_FILE = CACHE_DIR + "/journal.jsonl"
+MINHASH_FILE = CACHE_DIR + "/minhash.jsonl"
+QUALITY_CACHE_FILE = CACHE_DIR + "/quality.json"
+CHANGES_FILE = CACHE_DIR + "/changes.json"
+SCAN_FILE = CACHE_DIR + "/scan.json"
+DIRTREE_FILE = CACHE_DIR + "/dirtree.json"
+# Cached command output (see reporting.render_cache)
+RENDER_CACHE_DIR = CACHE_DIR + "/render"
+# Metrics history (see core.timeseries)
+SERIES_DIR = CACHE_DIR + "/series"
+# Pre-migration copies of the state file (see io.migrations)
+MIGRATION_BACKUP_DIR = CACHE_DIR + "/backups"
+
+# arch-scribe's own artifacts; never counted as project files by the scanner
+TOOL_FILES = {
+    STATE_FILE,
+    BACKUP_FILE,
+    SESSION_FILE,
+    LOCK_FILE,
+    CACHE_DIR,
+    STATE_FILE + ".tmp",
+}
 
 # Legacy threshold - kept for backward compatibility
 SIGNIFICANT_SIZE_KB = 1
@@ -64,14 +90,17 @@ class Colors:
     BOLD = "\033[1m"
 
 # --- DEFAULT SCHEMA ---
+SCHEMA_VERSION = "2.3"
+
 DEFAULT_STATE = {
-    "schema_version": "2.2",
+    "schema_version": SCHEMA_VERSION,
     "metadata": {
         "project_name": "",
         "project_type": "Unknown",
         "last_updated": "",
         "phase": "survey",
         "total_sessions": 0,
+        "state_version": 0,
         "scan_stats": {
             "total_files_scanned": 0,
             "significant_files_total": 0,
@@ -0,0 +1,224 @@
+"""
+Directory prefix tree with mapped/total counters for coverage drill-downs.
+
+Each directory node counts the significant files directly in it and in its
+whole subtree, mapped and total. Mapping a file walks its ancestors once,
+so the counters stay current without a rescan. The tree is built from the
+scan snapshot (core.snapshot) and the reverse index, kept on the State like
+the index, and persisted (DIRTREE_FILE) stamped with the snapshot id and
+the state's files_digest, the same O(1) stamp as the owners index
+(core.index).
+"""
+import json
+import os
+import posixpath
+
+from .constants import DIRTREE_FILE
+from .index import files_digest, index_of
+from .models import State
+
+ROOT = "."
+
+
+class DirTree:
+    """Nodes are ids into parallel lists; node 0 is the project root."""
+
+    __slots__ = (
+        "names",
+        "parents",
+        "depths",
+        "children",
+        "total",
+        "mapped",
+        "direct_total",
+        "direct_mapped",
+        "unmapped",
+        "snapshot_id",
+        "dirty",
+    )
+
+    def __init__(self, snapshot_id=None):
+        self.names = [ROOT]
+        self.parents = [-1]
+        self.depths = [0]
+        self.children = [{}]
+        self.total = [0]
+        self.mapped = [0]
+        self.direct_total = [0]
+        self.direct_mapped = [0]
+        # Significant files not mapped yet (the only ones map() can change)
+        self.unmapped = set()
+        self.snapshot_id = snapshot_id
+        self.dirty = False
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def build(cls, significant, is_mapped, snapshot_id=None):
+        tree = cls(snapshot_id)
+        for path in significant:
+            tree.add(path, is_mapped(path))
+        return tree
+
+    def _node(self, directory):
+        """Node id for a directory path, creating missing ancestors."""
+        if directory in ("", ROOT):
+            return 0
+        node = 0
+        for part in directory.split("/"):
+            child = self.children[node].get(part)
+            if child is None:
+                child = len(self.names)
+                self.children[node][part] = child
+                self.names.append(part if node == 0 else f"{self.names[node]}/{part}")
+                self.parents.append(node)
+                self.depths.append(self.depths[node] + 1)
+                self.children.append({})
+                for column in (self.total, self.mapped, self.direct_total, self.direct_mapped):
+                    column.append(0)
+            node = child
+        return node
+
+    def _find(self, directory):
+        if directory in ("", ROOT):
+            return 0
+        node = 0
+        for part in directory.split("/"):
+            node = self.children[node].get(part)
+            if node is None:
+                return None
+        return node
+
+    def add(self, path, mapped=False):
+        """Count a significant file."""
+        node = self._node(posixpath.dirname(path))
+        self.direct_total[node] += 1
+        self.direct_mapped[node] += mapped
+        while node >= 0:
+            self.total[node] += 1
+            self.mapped[node] += mapped
+            node = self.parents[node]
+        if not mapped:
+            self.unmapped.add(path)
+        self.dirty = True
+
+    def map(self, paths):
+        """Count newly mapped files; ones not significant or already mapped
+        are ignored."""
+        for path in paths:
+            if path not in self.unmapped:
+                continue
+            self.unmapped.discard(path)
+            node = self._find(posixpath.dirname(path))
+            self.direct_mapped[node] += 1
+            while node >= 0:
+                self.mapped[node] += 1
+                node = self.parents[node]
+            self.dirty = True
+
+    def unmapped_ratio(self, directory):
+        """Share of a directory's own significant files still unmapped."""
+        node = self._find(directory)
+        if node is None or not self.direct_total[node]:
+            return 0.0
+        return 1 - self.direct_mapped[node] / self.direct_total[node]
+
+    def rows(self, depth=None, min_files=1, under=ROOT):
+        """(directory, mapped, total) in path order.
+
+        With `depth`, every directory down to that depth below `under` with
+        subtree counts; without, each directory holding significant files
+        directly, with its direct counts.
+        """
+        start = self._find(under.rstrip("/") or ROOT)
+        if start is None:
+            return []
+        base = self.depths[start]
+        out = []
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if depth is None:
+                total, mapped = self.direct_total[node], self.direct_mapped[node]
+            else:
+                total, mapped = self.total[node], self.mapped[node]
+            if total >= min_files and (depth is not None or total):
+                out.append((self.names[node], mapped, total))
+            if depth is None or self.depths[node] - base < depth:
+                kids = self.children[node]
+                # Skip subtrees too small to show anything
+                stack.extend(
+                    kids[k] for k in sorted(kids, reverse=True) if self.total[kids[k]] >= min_files
+                )
+        return out
+
+    # --- persistence ---
+    @classmethod
+    def load(cls, stamp, snapshot_id=None, path=DIRTREE_FILE):
+        """The saved tree if it matches the mapped-files digest (and the
+        scan, if given), else None."""
+        if stamp is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+        except json.JSONDecodeError:
+            return None
+        if raw.get("files_digest") != stamp:
+            return None
+        if snapshot_id is not None and raw.get("snapshot") != snapshot_id:
+            return None
+        tree = cls(raw.get("snapshot"))
+        tree.names = raw["names"]
+        tree.parents = raw["parents"]
+        tree.total, tree.mapped = raw["total"], raw["mapped"]
+        tree.direct_total, tree.direct_mapped = raw["direct_total"], raw["direct_mapped"]
+        tree.unmapped = set(raw["unmapped"])
+        tree.depths = [0] * len(tree.names)
+        tree.children = [{} for _ in tree.names]
+        for node in range(1, len(tree.names)):
+            parent = tree.parents[node]
+            tree.depths[node] = tree.depths[parent] + 1
+            tree.children[parent][posixpath.basename(tree.names[node])] = node
+        return tree
+
+    def save(self, stamp, path=DIRTREE_FILE):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp = path + ".tmp"
+        with open(temp, "w") as f:
+            json.dump(
+                {
+                    "snapshot": self.snapshot_id,
+                    "files_digest": stamp,
+                    "names": self.names,
+                    "parents": self.parents,
+                    "total": self.total,
+                    "mapped": self.mapped,
+                    "direct_total": self.direct_total,
+                    "direct_mapped": self.direct_mapped,
+                    "unmapped": sorted(self.unmapped),
+                },
+                f,
+            )
+        os.replace(temp, path)
+        self.dirty = False
+
+
+def tree_of(data, snapshot=None):
+    """The coverage tree for a state.
+
+    Without a snapshot, returns only a tree that is already attached or can
+    be loaded as-is (mutations use this to keep a saved tree current). With
+    one, a tree built from a different scan is replaced by a fresh build.
+    """
+    tree = getattr(data, "dirtree", None)
+    if tree is not None and (snapshot is None or tree.snapshot_id == snapshot.id):
+        return tree
+    tree = DirTree.load(files_digest(data), snapshot.id if snapshot is not None else None)
+    if tree is None and snapshot is not None:
+        index = index_of(data)
+        tree = DirTree.build(snapshot.significant, index.is_mapped, snapshot.id)
+    if isinstance(data, State):
+        data.dirtree = tree
+    return tree
@@ -0,0 +1,76 @@
+"""
+Cheap change detection for the state file and the project tree.
+
+`stamp` identifies one file's current content by its stat - every save
+replaces the state file, so its stamp moves with state_version without
+parsing it. `tree` fingerprints the project layout from directory mtimes
+(which change whenever an entry is added, removed or renamed) plus the git
+index and .gitignore, walking directories only. Edits that rewrite a file
+in place are not seen; `status --refresh` and `coverage --rescan` cover
+those.
+"""
+import fnmatch
+import hashlib
+import os
+
+from .constants import IGNORE_DIRS, TOOL_FILES
+
+GIT_INDEX = os.path.join(".git", "index")
+
+
+def stamp(path):
+    """'inode:size:mtime_ns' for a file, None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _ignore_patterns():
+    patterns = []
+    if os.path.exists(".gitignore"):
+        with open(".gitignore", "r", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    patterns.append(line.rstrip("/"))
+    return patterns
+
+
+def tree(root="."):
+    """Hex digest of the directory layout under `root`, pruned like the
+    scanner prunes directories.
+
+    The root is fingerprinted by its entry names instead of its mtime: the
+    tool's own saves replace files there.
+    """
+    patterns = _ignore_patterns()
+
+    def ignored(name):
+        if name in IGNORE_DIRS or name in TOOL_FILES:
+            return True
+        return any(fnmatch.fnmatch(name, p) for p in patterns)
+
+    h = hashlib.blake2b(digest_size=16)
+    for path in (GIT_INDEX, ".gitignore"):
+        h.update(f"{path}={stamp(path)}\n".encode())
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError:
+            continue
+        if directory == root:
+            h.update("\0".join(e.name for e in entries if not ignored(e.name)).encode())
+        for entry in entries:
+            try:
+                if not entry.is_dir(follow_symlinks=False) or ignored(entry.name):
+                    continue
+                mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+            except OSError:
+                continue
+            h.update(f"\n{entry.path}:{mtime}".encode())
+            stack.append(entry.path)
+    return h.hexdigest()
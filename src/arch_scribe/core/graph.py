@@ -0,0 +1,245 @@
+"""
+The system dependency graph as an adjacency index, plus graph analytics.
+
+Systems become integer ids; forward (`out`) and reverse (`inn`) adjacency
+lists hold ids, with repeated `dep` calls for the same pair collapsed into
+one edge (their reasons are kept, in order). Dependencies on systems that
+don't exist get a node of their own, flagged as missing.
+
+All algorithms are iterative and run over ids, so 10k+ systems and 100k+
+edges stay well within a second - except exact betweenness, which is
+O(V·E) and is sampled on large graphs.
+"""
+import random
+from collections import deque
+
+
+class Graph:
+    __slots__ = ("names", "ids", "out", "inn", "reasons", "missing")
+
+    def __init__(self):
+        self.names = []
+        self.ids = {}
+        self.out = []
+        self.inn = []
+        # (source id, target id) -> [reason, ...]
+        self.reasons = {}
+        self.missing = set()
+
+    @classmethod
+    def from_systems(cls, systems):
+        graph = cls()
+        for name in systems:
+            graph.node(name)
+        ids, out, inn, reasons = graph.ids, graph.out, graph.inn, graph.reasons
+        for a, s in enumerate(systems.values()):
+            for dep in s.get("dependencies", ()):
+                target = dep["system"]
+                b = ids.get(target)
+                if b is None:
+                    graph.missing.add(target)
+                    b = graph.node(target)
+                edge = (a, b)
+                found = reasons.get(edge)
+                if found is None:
+                    reasons[edge] = found = []
+                    out[a].append(b)
+                    inn[b].append(a)
+                reason = dep.get("reason", "")
+                if reason and reason not in found:
+                    found.append(reason)
+        return graph
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def edge_count(self):
+        return len(self.reasons)
+
+    def node(self, name):
+        nid = self.ids.get(name)
+        if nid is None:
+            nid = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.out.append([])
+            self.inn.append([])
+        return nid
+
+    def add_edge(self, source, target, reason=""):
+        a, b = self.node(source), self.node(target)
+        reasons = self.reasons.get((a, b))
+        if reasons is None:
+            self.reasons[(a, b)] = reasons = []
+            self.out[a].append(b)
+            self.inn[b].append(a)
+        if reason and reason not in reasons:
+            reasons.append(reason)
+
+    def edges(self):
+        """(source id, target id) per distinct edge, in insertion order."""
+        return self.reasons.keys()
+
+    # --- degrees ---
+    def fan_out(self, nid):
+        return len(self.out[nid])
+
+    def fan_in(self, nid):
+        return len(self.inn[nid])
+
+    def top_degrees(self, k=10, reverse_edges=False):
+        """[(name, degree)] with the highest fan-in (or fan-out)."""
+        adj = self.inn if reverse_edges else self.out
+        ranked = sorted(range(len(self)), key=lambda n: (-len(adj[n]), self.names[n]))
+        return [(self.names[n], len(adj[n])) for n in ranked[:k]]
+
+    # --- strongly connected components ---
+    def scc(self):
+        """Tarjan's SCC, iterative. Returns (components, component id per
+        node); components come out in reverse topological order."""
+        n = len(self)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        comp = [-1] * n
+        stack, components = [], []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            work = [(root, 0)]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                v, i = work[-1]
+                edges = self.out[v]
+                if i < len(edges):
+                    work[-1] = (v, i + 1)
+                    w = edges[i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, 0))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    members = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        comp[w] = len(components)
+                        members.append(w)
+                        if w == v:
+                            break
+                    components.append(members)
+        return components, comp
+
+    def cycles(self):
+        """Names in each dependency cycle: SCCs of 2+ systems and self-loops."""
+        components, _ = self.scc()
+        out = []
+        for members in components:
+            if len(members) > 1 or (members[0], members[0]) in self.reasons:
+                out.append(sorted(self.names[m] for m in members))
+        return sorted(out, key=lambda c: (-len(c), c))
+
+    # --- layering ---
+    def layers(self):
+        """Topological layers of the condensation, dependencies first.
+
+        Layer 0 holds systems that depend on nothing; every system sits one
+        layer above its deepest dependency. Members of a cycle share a
+        layer. Returns [[names]].
+        """
+        components, comp = self.scc()
+        depth = [0] * len(components)
+        # Tarjan emits components with their dependencies first
+        for c, members in enumerate(components):
+            best = -1
+            for v in members:
+                for w in self.out[v]:
+                    cw = comp[w]
+                    if cw != c and depth[cw] > best:
+                        best = depth[cw]
+            depth[c] = best + 1
+        result = [[] for _ in range(max(depth, default=-1) + 1)]
+        for c, members in enumerate(components):
+            result[depth[c]].extend(self.names[m] for m in members)
+        return [sorted(layer) for layer in result]
+
+    # --- paths ---
+    def shortest_path(self, source, target):
+        """Fewest-hops dependency chain from source to target, or None."""
+        a, b = self.ids.get(source), self.ids.get(target)
+        if a is None or b is None:
+            return None
+        parent = {a: None}
+        queue = deque([a])
+        while queue:
+            v = queue.popleft()
+            if v == b:
+                path = []
+                while v is not None:
+                    path.append(self.names[v])
+                    v = parent[v]
+                return path[::-1]
+            for w in self.out[v]:
+                if w not in parent:
+                    parent[w] = v
+                    queue.append(w)
+        return None
+
+    def betweenness(self, samples=None, seed=0):
+        """Brandes betweenness centrality over directed, unweighted edges.
+
+        With `samples`, only that many source nodes are expanded and the
+        result is scaled up - an unbiased estimate that keeps large graphs
+        tractable. Returns {name: score}.
+        """
+        n = len(self)
+        sources = range(n)
+        scale = 1.0
+        if samples is not None and samples < n:
+            sources = random.Random(seed).sample(range(n), samples)
+            scale = n / samples
+        out = self.out
+        score = [0.0] * n
+        for s in sources:
+            sigma = [0] * n
+            dist = [-1] * n
+            sigma[s], dist[s] = 1, 0
+            order, preds = [], {}
+            queue = deque([s])
+            while queue:
+                v = queue.popleft()
+                order.append(v)
+                dv = dist[v] + 1
+                for w in out[v]:
+                    if dist[w] < 0:
+                        dist[w] = dv
+                        queue.append(w)
+                    if dist[w] == dv:
+                        sigma[w] += sigma[v]
+                        preds.setdefault(w, []).append(v)
+            delta = [0.0] * n
+            for w in reversed(order):
+                coeff = (1 + delta[w]) / sigma[w]
+                for v in preds.get(w, ()):
+                    delta[v] += sigma[v] * coeff
+                if w != s:
+                    score[w] += delta[w]
+        return {self.names[i]: score[i] * scale for i in range(n)}
+
+
+def graph_of(data):
+    return Graph.from_systems(data.get("systems", {}))
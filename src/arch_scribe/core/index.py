@@ -0,0 +1,158 @@
+"""
+Reverse index: file path -> systems that list it in key_files.
+
+Kept on the in-memory State (see models.State) and updated by map_files, so
+"who owns this file?" is a dict lookup instead of a walk over every system.
+Persisted to a sidecar stamped with the state's files_digest (see
+files_digest); a stamp that doesn't match the state (another branch, a
+restored backup, a hand edit) means the sidecar is stale and the index is
+rebuilt.
+"""
+import bisect
+import json
+import os
+
+from .constants import OWNERS_FILE
+from .models import State
+from .paths import canonical
+from .session import path_hash
+
+
+class FileIndex:
+    __slots__ = ("owners", "dirty", "_sorted", "_ids")
+
+    def __init__(self, owners=None):
+        self.owners = owners if owners is not None else {}
+        self.dirty = False
+        self._sorted = None
+        self._ids = None
+
+    @classmethod
+    def build(cls, systems):
+        index = cls()
+        for name, s in systems.items():
+            index.add(name, [canonical(p) for p in s.get("key_files", [])])
+        return index
+
+    def add(self, system, files):
+        owners = self.owners
+        for path in files:
+            claimed = owners.get(path)
+            if claimed is None:
+                owners[path] = [system]
+                self._sorted = None
+            elif system not in claimed:
+                claimed.append(system)
+            else:
+                continue
+            self.dirty = True
+
+    # --- queries ---
+    def owners_of(self, path):
+        return self.owners.get(canonical(path), [])
+
+    def is_mapped(self, path):
+        return path in self.owners
+
+    def under(self, prefix):
+        """{path: systems} for paths under a directory prefix, in path order."""
+        prefix = canonical(prefix).rstrip("/")
+        if prefix in ("", "."):
+            keys = self._keys()
+        else:
+            prefix += "/"
+            keys = self._keys()
+            lo = bisect.bisect_left(keys, prefix)
+            # "0" sorts right after "/", so this bounds every path in prefix/
+            hi = bisect.bisect_left(keys, prefix[:-1] + "0", lo)
+            keys = keys[lo:hi]
+        return {p: self.owners[p] for p in keys}
+
+    def shared(self):
+        """{path: systems} for files claimed by more than one system."""
+        return {p: s for p, s in sorted(self.owners.items()) if len(s) > 1}
+
+    def ids(self, table):
+        """Mapped files as PathTable IDs, cached per table generation."""
+        key = (id(table), table.generation, len(self.owners))
+        if self._ids is None or self._ids[0] != key:
+            self._ids = (key, table.intern_many(self.owners))
+        return self._ids[1]
+
+    def _keys(self):
+        if self._sorted is None:
+            self._sorted = sorted(self.owners)
+        return self._sorted
+
+    # --- persistence ---
+    @classmethod
+    def load(cls, stamp, path=OWNERS_FILE):
+        """Load the sidecar if it was written for `stamp`, else None."""
+        if stamp is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+        except json.JSONDecodeError:
+            return None
+        if raw.get("files_digest") != stamp:
+            return None
+        return cls(raw.get("owners", {}))
+
+    def save(self, stamp, path=OWNERS_FILE):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp = path + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"files_digest": stamp, "owners": self.owners}, f)
+        os.replace(temp, path)
+        self.dirty = False
+
+
+def _pair_hash(name, path):
+    return path_hash(f"{name}\x00{path}")
+
+
+def files_digest(data):
+    """Stamp for the sidecars derived from key_files.
+
+    An XOR of one hash per (system, mapped file), kept in metadata and moved
+    by record_files, so reading it is O(1); states written without it get it
+    computed once here.
+    """
+    meta = data["metadata"]
+    digest = meta.get("files_digest")
+    if digest is None:
+        acc = 0
+        for name, s in data.get("systems", {}).items():
+            for path in dict.fromkeys(s.get("key_files", [])):
+                acc ^= _pair_hash(name, path)
+        digest = meta["files_digest"] = f"{acc:016x}"
+    return digest
+
+
+def record_files(data, name, paths):
+    """Move files_digest by `paths` just mapped to `name`."""
+    meta = data["metadata"]
+    if meta.get("files_digest") is None:
+        files_digest(data)  # computed from the mapping as it now is
+        return
+    acc = int(meta["files_digest"], 16)
+    for path in paths:
+        acc ^= _pair_hash(name, path)
+    meta["files_digest"] = f"{acc:016x}"
+
+
+def index_of(data):
+    """The reverse index for a state, loading or rebuilding it as needed.
+
+    Plain dicts (not loaded through models.hydrate) get a transient index.
+    """
+    if isinstance(data, State):
+        if data.index is None:
+            index = FileIndex.load(files_digest(data))
+            if index is None:
+                index = FileIndex.build(data.get("systems", {}))
+                index.dirty = True
+            data.index = index
+        return data.index
+    return FileIndex.build(data.get("systems", {}))
@@ -0,0 +1,277 @@
+"""
+MinHash signatures with LSH banding over every insight in the project.
+
+Near-duplicate checks used to compare a new insight pairwise with every
+insight of its system. Here each insight gets a MinHash signature of its
+word set; signatures are split into bands and bucketed, so only insights
+sharing a bucket are candidates. Candidates are then confirmed with the exact
+measure (insight_ops.similar_words), so a hit means the same thing it always
+did - LSH only decides what is worth comparing.
+
+With 32 bands of 4 rows, a pair at the default 0.8 overlap threshold
+(Jaccard >= 0.67, the worst case) shares a bucket with probability > 0.999,
+while a pair at Jaccard 0.1 does so with probability ~0.003. Below
+LSH_MIN_THRESHOLD recall drops, and callers compare exhaustively instead.
+
+Band keys are persisted to a JSON Lines sidecar, one entry per insight with
+a digest of the text it was computed from, and each save ends with the
+state's insights_digest (an XOR of per-insight hashes kept in metadata and
+moved by record_insight, so reading it is O(1)). A sidecar whose last stamp
+matches is used as-is; otherwise every entry is checked against the insight
+now at its position, so one left over from another state (a branch switch,
+a restored backup, a hand edit) only costs re-signing the insights that
+differ. Adding an insight appends its line and a new stamp.
+"""
+import base64
+import hashlib
+import json
+import os
+import zlib
+from array import array
+
+from .constants import MINHASH_FILE
+from .models import State
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+SEED = 1
+LSH_MIN_THRESHOLD = 0.6
+
+# Each word is hashed with NUM_PERM independent 32-bit hash functions, taken
+# 16 at a time from salted 64-byte blake2b digests.
+_SALTS = [
+    hashlib.blake2b(f"{SEED}:{k}".encode(), digest_size=16).digest()
+    for k in range(NUM_PERM // 16)
+]
+
+
+def _hashes(word):
+    raw = word.encode("utf-8")
+    return array(
+        "I", b"".join(hashlib.blake2b(raw, digest_size=64, salt=s).digest() for s in _SALTS)
+    )
+
+
+def signature(words):
+    """MinHash signature (NUM_PERM 32-bit ints) of a word set."""
+    if not words:
+        return None
+    return tuple(map(min, zip(*map(_hashes, words))))
+
+
+def band_keys(sig):
+    """One 32-bit bucket key per band of ROWS signature values."""
+    rows = array("I", sig).tobytes()
+    step = ROWS * 4
+    return array(
+        "I", (zlib.crc32(rows[i:i + step]) for i in range(0, len(rows), step))
+    )
+
+
+def _words(text):
+    return frozenset(text.lower().split())
+
+
+def _keys_for(text):
+    sig = signature(_words(text))
+    return band_keys(sig) if sig is not None else None
+
+
+def text_digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _entry_hash(system, position, text):
+    raw = f"{system}\x00{position}\x00{text}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "big")
+
+
+def insights_digest(data):
+    """The sidecar stamp: XOR of one hash per (system, position, text).
+
+    Kept in metadata; states written without it get it computed once here.
+    """
+    meta = data["metadata"]
+    digest = meta.get("insights_digest")
+    if digest is None:
+        acc = 0
+        for name, s in data.get("systems", {}).items():
+            for i, text in enumerate(s.get("insights", [])):
+                acc ^= _entry_hash(name, i, text)
+        digest = meta["insights_digest"] = f"{acc:016x}"
+    return digest
+
+
+def record_insight(data, system, position, text):
+    """Move insights_digest by an insight about to be stored at `position`."""
+    acc = int(insights_digest(data), 16) ^ _entry_hash(system, position, text)
+    data["metadata"]["insights_digest"] = f"{acc:016x}"
+
+
+class MinHashIndex:
+    """Band keys per (system, insight position), plus the LSH buckets."""
+
+    __slots__ = ("keys", "bands", "digests", "buckets", "saved", "rewrite")
+
+    def __init__(self):
+        self.keys = []
+        self.bands = []
+        self.digests = []
+        self.buckets = [{} for _ in range(BANDS)]
+        # Entries [0, saved) are in the sidecar; `rewrite` means it must be
+        # written out whole rather than appended to
+        self.saved = 0
+        self.rewrite = True
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def dirty(self):
+        return self.rewrite or self.saved < len(self.keys)
+
+    @classmethod
+    def build(cls, systems):
+        index = cls()
+        for name, s in systems.items():
+            for i, text in enumerate(s.get("insights", [])):
+                index.add(name, i, text)
+        return index
+
+    def add(self, system, position, text, bands=None, digest=None):
+        if bands is None:
+            bands = _keys_for(text)
+        entry = len(self.keys)
+        self.keys.append((system, position))
+        self.bands.append(bands)
+        self.digests.append(digest or text_digest(text))
+        if bands is not None:
+            for buckets, key in zip(self.buckets, bands):
+                buckets.setdefault(key, []).append(entry)
+
+    def candidates(self, text):
+        """(system, position) of insights sharing at least one LSH bucket."""
+        bands = _keys_for(text)
+        if bands is None:
+            return []
+        found = set()
+        for buckets, key in zip(self.buckets, bands):
+            found.update(buckets.get(key, ()))
+        return [self.keys[e] for e in sorted(found)]
+
+    def candidate_pairs(self):
+        """Entry pairs (i < j) that share a bucket."""
+        pairs = set()
+        for buckets in self.buckets:
+            for members in buckets.values():
+                if len(members) > 1:
+                    for x, i in enumerate(members):
+                        for j in members[x + 1:]:
+                            pairs.add((i, j))
+        return sorted(pairs)
+
+    # --- persistence ---
+    @classmethod
+    def load(cls, systems, stamp, path=MINHASH_FILE):
+        """The sidecar's signatures for `systems`.
+
+        If the sidecar's last stamp is `stamp` its entries are taken as they
+        are (positions are still bounds-checked); otherwise each is checked
+        against the text now at its position and stale ones are dropped.
+        Insights without an entry are signed afresh. None if there is no
+        usable sidecar.
+        """
+        if not os.path.exists(path):
+            return None
+        entries, saved_stamp = [], None
+        with open(path, "r") as f:
+            try:
+                header = json.loads(f.readline() or "null")
+            except json.JSONDecodeError:
+                return None
+            if not isinstance(header, dict) or header.get("params") != _params():
+                return None
+            for line in f:
+                try:
+                    raw = json.loads(line)
+                except json.JSONDecodeError:
+                    raw = None  # torn append
+                if isinstance(raw, dict):
+                    saved_stamp = raw.get("stamp")
+                else:
+                    entries.append(raw)
+
+        trusted = saved_stamp is not None and saved_stamp == stamp
+        index = cls()
+        covered = set()
+        stale = not trusted
+        for raw in entries:
+            try:
+                system, position, digest, packed = raw
+                insights = systems[system].get("insights", [])
+                valid = 0 <= position < len(insights) and (
+                    trusted or text_digest(insights[position]) == digest
+                )
+            except (ValueError, TypeError, KeyError):
+                valid = False
+            if not valid or (system, position) in covered:
+                stale = True
+                continue
+            covered.add((system, position))
+            bands = array("I", base64.b64decode(packed)) if packed else None
+            index.add(system, position, None, bands, digest)
+        index.saved = len(index)
+        index.rewrite = stale
+        if len(covered) < sum(len(s.get("insights", ())) for s in systems.values()):
+            for name, s in systems.items():
+                for i, text in enumerate(s.get("insights", [])):
+                    if (name, i) not in covered:
+                        index.add(name, i, text)
+        return index
+
+    def _line(self, entry):
+        bands = self.bands[entry]
+        packed = base64.b64encode(bands.tobytes()).decode() if bands else None
+        system, position = self.keys[entry]
+        return json.dumps([system, position, self.digests[entry], packed]) + "\n"
+
+    def save(self, stamp, path=MINHASH_FILE):
+        """Append the entries added since the last save, or write the whole
+        sidecar if it is missing or had stale entries; either way it ends
+        stamped with `stamp` (the state's insights_digest)."""
+        tail = json.dumps({"stamp": stamp}) + "\n"
+        if self.rewrite or not os.path.exists(path):
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            temp = path + ".tmp"
+            with open(temp, "w") as f:
+                f.write(json.dumps({"params": _params()}) + "\n")
+                f.writelines(self._line(e) for e in range(len(self)))
+                f.write(tail)
+            os.replace(temp, path)
+        else:
+            with open(path, "a") as f:
+                f.writelines(self._line(e) for e in range(self.saved, len(self)))
+                f.write(tail)
+        self.saved = len(self)
+        self.rewrite = False
+
+
+def _params():
+    return {"perm": NUM_PERM, "bands": BANDS, "seed": SEED}
+
+
+def minhash_of(data):
+    """The signature index of a State, loading or rebuilding it as needed.
+
+    Returns None for plain dicts; callers fall back to pairwise comparison.
+    """
+    if not isinstance(data, State):
+        return None
+    if data.minhash is None:
+        systems = data.get("systems", {})
+        index = MinHashIndex.load(systems, insights_digest(data))
+        if index is None:
+            index = MinHashIndex.build(systems)
+        data.minhash = index
+    return data.minhash
@@ -1 +1,335 @@
-# models.py - placeholder
+"""
+In-memory domain model for architecture.json.
+
+Systems, dependencies and session records are slotted objects instead of
+dicts. They still behave as read-only-ish mappings (`sys["key_files"]`,
+`sys.get("insights", [])`), so reporting code and the metrics functions work
+on either form, and `to_json()` gives back the schema dict unchanged.
+
+Hydration is done by `hydrate(data)` when the state is loaded; systems that
+arrive as plain dicts later (e.g. assigned directly) are converted on first
+mutation through `system(data, name)`.
+"""
+from collections.abc import Mapping
+
+from ..metrics.batch import score
+
+
+class _Record(Mapping):
+    """Mapping view over slotted fields plus an `extra` dict for unknown keys.
+
+    Subclasses define FIELDS (schema order) and DEFAULTS.
+    """
+
+    __slots__ = ("extra",)
+    FIELDS = ()
+    DEFAULTS = {}
+
+    def __getitem__(self, key):
+        if key in self.FIELDS:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __iter__(self):
+        yield from self.FIELDS
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self):
+        return len(self.FIELDS) + (len(self.extra) if self.extra else 0)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_json()!r})"
+
+    def _load(self, raw):
+        for field in self.FIELDS:
+            default = self.DEFAULTS.get(field)
+            setattr(self, field, raw.get(field, default() if callable(default) else default))
+        extra = {k: v for k, v in raw.items() if k not in self.FIELDS}
+        self.extra = extra or None
+
+    def to_json(self):
+        out = {field: getattr(self, field) for field in self.FIELDS}
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+
+class Dependency(_Record):
+    __slots__ = ("system", "reason")
+    FIELDS = ("system", "reason")
+    DEFAULTS = {"reason": ""}
+
+    def __init__(self, system, reason=""):
+        self.system = system
+        self.reason = reason
+        self.extra = None
+
+    @classmethod
+    def from_json(cls, raw):
+        if isinstance(raw, cls):
+            return raw
+        dep = cls.__new__(cls)
+        dep._load(raw)
+        return dep
+
+
+class SessionRecord(_Record):
+    __slots__ = (
+        "session_id",
+        "timestamp",
+        "new_systems_found",
+        "new_files_mapped",
+        "insights_added",
+    )
+    FIELDS = __slots__
+    DEFAULTS = {
+        "new_systems_found": 0,
+        "new_files_mapped": 0,
+        "insights_added": 0,
+    }
+
+    @classmethod
+    def from_json(cls, raw):
+        if isinstance(raw, cls):
+            return raw
+        rec = cls.__new__(cls)
+        rec._load(raw)
+        return rec
+
+
+class Insight:
+    """An insight with its owning system and cached tokenization.
+
+    Insights are plain strings in the schema; this is the working form used
+    by quality and similarity checks.
+    """
+
+    __slots__ = ("text", "system", "_words")
+
+    def __init__(self, text, system=None):
+        self.text = text
+        self.system = system
+        self._words = None
+
+    @property
+    def words(self):
+        if self._words is None:
+            self._words = frozenset(self.text.lower().split())
+        return self._words
+
+    @classmethod
+    def from_json(cls, raw, system=None):
+        return cls(raw, system)
+
+    def to_json(self):
+        return self.text
+
+    def __eq__(self, other):
+        if isinstance(other, Insight):
+            return self.text == other.text
+        return self.text == other
+
+    def __hash__(self):
+        return hash(self.text)
+
+    def __repr__(self):
+        return f"Insight({self.text!r})"
+
+
+class System(_Record):
+    """One architectural system.
+
+    key_files stays a list (schema order, compact); a membership set is built
+    on demand for mutation paths and kept while the list only grows through
+    add_files(). clarity/completeness are cached against the counts they
+    depend on.
+    """
+
+    __slots__ = (
+        "description",
+        "completeness",
+        "clarity",
+        "key_files",
+        "dependencies",
+        "insights",
+        "complexities",
+        "_file_set",
+        "_file_ids",
+        "_metrics_key",
+        "_insight_words",
+    )
+    FIELDS = (
+        "description",
+        "completeness",
+        "clarity",
+        "key_files",
+        "dependencies",
+        "insights",
+        "complexities",
+    )
+    DEFAULTS = {
+        "description": "TODO",
+        "completeness": 0,
+        "clarity": "low",
+        "key_files": list,
+        "dependencies": list,
+        "insights": list,
+        "complexities": list,
+    }
+
+    def __init__(self, description="TODO"):
+        self.description = description
+        self.completeness = 0
+        self.clarity = "low"
+        self.key_files = []
+        self.dependencies = []
+        self.insights = []
+        self.complexities = []
+        self.extra = None
+        self._file_set = None
+        self._file_ids = None
+        self._metrics_key = None
+        self._insight_words = None
+
+    @classmethod
+    def from_json(cls, raw):
+        if isinstance(raw, cls):
+            return raw
+        sys = cls.__new__(cls)
+        sys._load(raw)
+        sys.key_files = list(sys.key_files)
+        sys.dependencies = [Dependency.from_json(d) for d in sys.dependencies]
+        sys._file_set = None
+        sys._file_ids = None
+        sys._metrics_key = None
+        sys._insight_words = None
+        return sys
+
+    def to_json(self):
+        out = super().to_json()
+        out["key_files"] = list(self.key_files)
+        out["dependencies"] = [d.to_json() for d in self.dependencies]
+        out["insights"] = list(self.insights)
+        out["complexities"] = list(self.complexities)
+        return out
+
+    # --- files ---
+    def _files(self):
+        # Rebuild if the list was changed behind our back
+        if self._file_set is None or len(self._file_set) != len(self.key_files):
+            self._file_set = set(self.key_files)
+            if len(self._file_set) != len(self.key_files):
+                # Older states may hold duplicates; drop them once, keep order
+                self.key_files = list(dict.fromkeys(self.key_files))
+        return self._file_set
+
+    def has_file(self, path):
+        return path in self._files()
+
+    def add_files(self, files):
+        """Add files not already mapped here; returns the newly added ones."""
+        members = self._files()
+        added = []
+        for path in files:
+            if path not in members:
+                members.add(path)
+                self.key_files.append(path)
+                added.append(path)
+        return added
+
+    def file_ids(self, table):
+        """key_files as a set of PathTable IDs, cached per table generation."""
+        key = (id(table), table.generation, len(self.key_files))
+        cache = self._file_ids
+        if cache is None or cache[0] != key:
+            cache = self._file_ids = (key, table.intern_many(self.key_files))
+        return cache[1]
+
+    # --- insights ---
+    def insight_words(self):
+        """Tokenized insights, cached while the insight list only grows."""
+        cache = self._insight_words
+        if cache is None or len(cache) > len(self.insights):
+            cache = self._insight_words = []
+        for text in self.insights[len(cache):]:
+            cache.append(frozenset(text.lower().split()))
+        return cache
+
+    def add_dependency(self, target, reason):
+        self.dependencies.append(Dependency(target, reason))
+
+    # --- metrics ---
+    def refresh_metrics(self):
+        """Recompute clarity/completeness only if their inputs changed."""
+        key = (len(self.key_files), len(self.insights), bool(self.dependencies))
+        if key != self._metrics_key:
+            self.clarity, self.completeness = score(*key)
+            self._metrics_key = key
+
+
+class State(dict):
+    """The state document plus slots for derived, non-persisted structures.
+
+    Serializes exactly like the plain dict. `index` holds the file -> systems
+    reverse index, `totals` the running progress totals and `minhash` the
+    insight signature index, once something asks for them (see
+    core.index.index_of, core.progress.totals_of, core.minhash.minhash_of).
+    `dirty` collects the names of systems changed since the last save (see
+    core.changes); `dirtree` is the coverage tree (core.dirtree.tree_of).
+    """
+
+    __slots__ = ("index", "totals", "minhash", "dirty", "dirtree")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.index = None
+        self.totals = None
+        self.minhash = None
+        self.dirty = set()
+        self.dirtree = None
+
+
+def system(data, name):
+    """Return data["systems"][name] as a System, converting it in place."""
+    raw = data["systems"].get(name)
+    if raw is None or isinstance(raw, System):
+        return raw
+    sys = System.from_json(raw)
+    data["systems"][name] = sys
+    return sys
+
+
+def hydrate(data):
+    """Convert a freshly loaded state dict to the in-memory model."""
+    if not data:
+        return data
+    if not isinstance(data, State):
+        data = State(data)
+    systems = data.get("systems")
+    if systems:
+        for name, raw in systems.items():
+            systems[name] = System.from_json(raw)
+    meta = data.get("metadata")
+    if meta and meta.get("session_history"):
+        meta["session_history"] = [
+            SessionRecord.from_json(r) for r in meta["session_history"]
+        ]
+    return data
+
+
+def to_json(obj):
+    """json.dump `default=` hook for model objects."""
+    if hasattr(obj, "to_json"):
+        return obj.to_json()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
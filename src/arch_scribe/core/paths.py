@@ -0,0 +1,129 @@
+"""
+Project-wide path table: canonical relative path <-> small integer ID.
+
+Coverage and orphan calculations work on ID sets / int bitmaps instead of
+hashing full path strings on every intersection. The table is append-only
+and persisted next to the state, so IDs are stable across runs.
+"""
+import json
+import os
+
+from .constants import PATHS_FILE
+
+
+def canonical(path):
+    """Canonical relative form used by the scanner: forward slashes, no './'."""
+    path = path.replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    if "//" in path or "/./" in path or path.endswith("/."):
+        path = os.path.normpath(path).replace("\\", "/")
+    return path
+
+
+def bitmap(ids):
+    """Int bitset with bit `i` set for each id."""
+    if not ids:
+        return 0
+    buf = bytearray((max(ids) >> 3) + 1)
+    for i in ids:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+def popcount(bits):
+    try:
+        return bits.bit_count()
+    except AttributeError:  # Python < 3.10
+        return bin(bits).count("1")
+
+
+def bitmap_ids(bits):
+    """Yield the ids set in a bitmap, ascending."""
+    raw = bits.to_bytes((bits.bit_length() + 7) >> 3, "little")
+    for byte_index, byte in enumerate(raw):
+        if byte:
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    yield base + bit
+
+
+class PathTable:
+    __slots__ = ("paths", "ids", "generation", "_saved")
+
+    def __init__(self, paths=()):
+        self.paths = []
+        self.ids = {}
+        # Bumped whenever existing IDs are reassigned (merge with another
+        # writer's table); caches keyed on IDs must check it.
+        self.generation = 0
+        for path in paths:
+            self.intern(path)
+        self._saved = len(self.paths)
+
+    def __len__(self):
+        return len(self.paths)
+
+    @property
+    def dirty(self):
+        return len(self.paths) != self._saved
+
+    def intern(self, path):
+        path = canonical(path)
+        pid = self.ids.get(path)
+        if pid is None:
+            pid = len(self.paths)
+            self.ids[path] = pid
+            self.paths.append(path)
+        return pid
+
+    def intern_many(self, paths):
+        return {self.intern(p) for p in paths}
+
+    def lookup(self, path):
+        return self.ids.get(canonical(path))
+
+    def path(self, pid):
+        return self.paths[pid]
+
+    def paths_for(self, ids):
+        paths = self.paths
+        return [paths[i] for i in ids]
+
+    # --- persistence ---
+    @classmethod
+    def load(cls, path=PATHS_FILE):
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, "r") as f:
+                return cls(json.load(f).get("paths", []))
+        except (json.JSONDecodeError, AttributeError):
+            return cls()
+
+    def save(self, path=PATHS_FILE):
+        """Persist, merging with whatever another writer saved meanwhile.
+
+        Call under the state lock. Paths already on disk keep their IDs;
+        ours are appended after them.
+        """
+        disk = PathTable.load(path)
+        if disk.paths == self.paths:
+            self._saved = len(self.paths)
+            return
+        if disk.paths != self.paths[: len(disk.paths)]:
+            old = self.paths
+            for p in old:
+                disk.intern(p)
+            self.paths = disk.paths
+            self.ids = disk.ids
+            if self.paths[: len(old)] != old:
+                self.generation += 1
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp = path + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"version": 1, "paths": self.paths}, f)
+        os.replace(temp, path)
+        self._saved = len(self.paths)
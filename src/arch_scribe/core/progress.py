@@ -0,0 +1,111 @@
+"""
+Running totals behind data["progress"].
+
+systems_identified / systems_complete / estimated_overall_completeness used
+to be recomputed by walking every system on each stats refresh. The totals
+are now kept on the in-memory State and adjusted by each mutation, so the
+cost of a mutation doesn't grow with the number of systems. The running
+completeness sum is saved in data["progress"] next to the counts, so a new
+process picks the totals up from there instead of walking the systems.
+
+`recompute()` is the from-scratch version, used by `verify-stats`,
+`recompute --full` and for states saved before the sum was kept.
+"""
+from .models import State
+
+# A system counts as complete from this completeness score on
+COMPLETE_THRESHOLD = 85
+
+
+class Totals:
+    __slots__ = ("identified", "complete", "completeness_sum")
+
+    def __init__(self, identified=0, complete=0, completeness_sum=0):
+        self.identified = identified
+        self.complete = complete
+        self.completeness_sum = completeness_sum
+
+    def add(self, completeness=0):
+        self.identified += 1
+        self.change(0, completeness)
+
+    def change(self, before, after):
+        if before == after:
+            return
+        self.completeness_sum += after - before
+        self.complete += (after >= COMPLETE_THRESHOLD) - (before >= COMPLETE_THRESHOLD)
+
+    def as_progress(self):
+        """The progress fields these totals determine."""
+        out = {
+            "systems_identified": self.identified,
+            "systems_complete": self.complete,
+            "completeness_sum": self.completeness_sum,
+        }
+        if self.identified:
+            out["estimated_overall_completeness"] = round(
+                self.completeness_sum / self.identified, 1
+            )
+        return out
+
+
+def recompute(systems):
+    """Totals from scratch (O(systems))."""
+    totals = Totals()
+    for s in systems.values():
+        totals.add(s.get("completeness", 0))
+    return totals
+
+
+def stored(data):
+    """Totals saved in data["progress"], or None if it has no running sum."""
+    prog = data.get("progress", {})
+    if "completeness_sum" not in prog:
+        return None
+    return Totals(
+        prog.get("systems_identified", 0),
+        prog.get("systems_complete", 0),
+        prog["completeness_sum"],
+    )
+
+
+def totals_of(data):
+    """Running totals for a state, seeded from the saved progress on first
+    use (from scratch if it has none).
+
+    Call before mutating, so the seed doesn't already include the change.
+    Plain dicts (not loaded through models.hydrate) get transient totals.
+    """
+    if isinstance(data, State):
+        if data.totals is None:
+            data.totals = stored(data) or recompute(data.get("systems", {}))
+        return data.totals
+    return recompute(data.get("systems", {}))
+
+
+def publish(data, totals):
+    data.setdefault("progress", {}).update(totals.as_progress())
+
+
+def refresh_metrics(data, sys):
+    """sys.refresh_metrics(), folding any completeness change into the totals."""
+    totals = totals_of(data)
+    before = sys.completeness
+    sys.refresh_metrics()
+    totals.change(before, sys.completeness)
+    publish(data, totals)
+
+
+def verify(data):
+    """Compare stored progress with a from-scratch recomputation.
+
+    Returns a list of "field: stored X, expected Y" strings (empty if
+    consistent).
+    """
+    expected = recompute(data.get("systems", {})).as_progress()
+    stored = data.get("progress", {})
+    return [
+        f"progress.{field}: stored {stored.get(field)}, expected {value}"
+        for field, value in expected.items()
+        if stored.get(field) != value
+    ]
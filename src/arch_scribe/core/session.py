@@ -0,0 +1,140 @@
+import datetime
+import hashlib
+
+from .models import SessionRecord
+
+
+def path_hash(path):
+    digest = hashlib.blake2b(path.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def files_hash(files, base=0):
+    """Order-independent hash of a file set (XOR of per-path digests).
+
+    XOR is its own inverse, so files_hash(changed, old) moves the hash of
+    a set by the paths added or removed.
+    """
+    acc = base
+    for path in files:
+        acc ^= path_hash(path)
+    return f"{acc:016x}"
+
+
+def fingerprint(data):
+    """Compact session baseline: state version plus per-system counts/hashes.
+
+    This replaces dumping (and deep-copying) the whole state at session start.
+    """
+    systems = {}
+    for name, s in data.get("systems", {}).items():
+        key_files = s.get("key_files", [])
+        systems[name] = {
+            "files": len(key_files),
+            "insights": len(s.get("insights", [])),
+            "dependencies": len(s.get("dependencies", [])),
+            "files_hash": files_hash(key_files),
+        }
+    return {
+        "state_version": data.get("metadata", {}).get("state_version", 0),
+        "systems": systems,
+    }
+
+
+def is_fingerprint(baseline):
+    """True for fingerprints, False for legacy full-state session dumps."""
+    return "state_version" in baseline and "metadata" not in baseline
+
+
+def begin(data, session_id):
+    """Open an incremental delta on the state; mutations record into it."""
+    data["metadata"]["active_session"] = {
+        "session_id": session_id,
+        "started": datetime.datetime.now().isoformat(),
+        "base_version": data["metadata"].get("state_version", 0),
+        "systems_added": [],
+        "files_mapped": [],
+        "insights_added": 0,
+    }
+
+
+def active(data):
+    if not data:
+        return None
+    return data.get("metadata", {}).get("active_session")
+
+
+def record_system_added(data, name):
+    delta = active(data)
+    if delta is not None and name not in delta["systems_added"]:
+        delta["systems_added"].append(name)
+
+
+def record_files_mapped(data, files):
+    """Record files that were not mapped to any system before this session."""
+    delta = active(data)
+    if delta is None:
+        return
+    seen = set(delta["files_mapped"])
+    for path in files:
+        if path not in seen:
+            seen.add(path)
+            delta["files_mapped"].append(path)
+
+
+def record_insight_added(data):
+    delta = active(data)
+    if delta is not None:
+        delta["insights_added"] += 1
+
+
+def delta_counts(data):
+    """(systems, files, insights) added so far in the active session."""
+    delta = active(data)
+    return (
+        len(delta["systems_added"]),
+        len(delta["files_mapped"]),
+        delta["insights_added"],
+    )
+
+
+def open_session(data):
+    data["metadata"]["total_sessions"] += 1
+    begin(data, data["metadata"]["total_sessions"])
+
+
+def close_session(data, counts, timestamp):
+    """Drop the active delta and append the session to session_history."""
+    meta = data["metadata"]
+    meta.pop("active_session", None)
+    systems_added, files_mapped, insights_added = counts
+    meta["session_history"].append(
+        SessionRecord.from_json(
+            {
+                "session_id": meta["total_sessions"],
+                "timestamp": timestamp,
+                "new_systems_found": systems_added,
+                "new_files_mapped": files_mapped,
+                "insights_added": insights_added,
+            }
+        )
+    )
+
+
+def diff_fingerprints(old, new):
+    """Fallback delta when the incremental record is missing.
+
+    Files are estimated from per-system count growth; exact paths are not
+    kept in the baseline.
+    """
+    old_systems = old.get("systems", {})
+    new_systems = new.get("systems", {})
+    systems_added = len(set(new_systems) - set(old_systems))
+    files_mapped = 0
+    insights_added = 0
+    for name, entry in new_systems.items():
+        base = old_systems.get(name, {"files": 0, "insights": 0, "files_hash": None})
+        if entry["files_hash"] != base["files_hash"]:
+            files_mapped += max(entry["files"] - base["files"], 0)
+        insights_added += entry["insights"] - base["insights"]
+    return systems_added, files_mapped, insights_added
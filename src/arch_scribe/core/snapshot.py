@@ -0,0 +1,109 @@
+"""
+The last scan's result, kept in a sidecar (SCAN_FILE).
+
+Coverage drill-downs read the significant files from here instead of walking
+the tree again; `coverage --rescan` or any command that scans refreshes it.
+Each file carries what the scan already learned about it - size and mtime
+from its one stat call - plus a line count once something asked for it.
+Scanning never reads file contents: line counts are carried over from the
+previous snapshot for files whose size and mtime are unchanged, left unknown
+(None) otherwise, and counted on demand by lines().
+
+`id` is an order-independent hash of the significant file set, so derived
+structures (core.dirtree) can tell whether they were built from the same
+scan. It is moved from the previous snapshot's id by the paths added and
+removed rather than rehashed.
+"""
+import json
+import os
+
+from .constants import SCAN_FILE
+from .session import files_hash
+
+# files[path] = [size, mtime_ns, lines]
+SIZE, MTIME, LINES = 0, 1, 2
+
+
+def count_lines(path, chunk=1 << 20):
+    """Number of lines in a file (a final line without newline counts)."""
+    lines, last = 0, b"\n"
+    try:
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(chunk)
+                if not block:
+                    break
+                lines += block.count(b"\n")
+                last = block[-1:]
+    except OSError:
+        return 0
+    return lines + (last != b"\n")
+
+
+class Snapshot:
+    __slots__ = ("id", "total", "files", "dirty")
+
+    def __init__(self, total, files, id=None):
+        self.total = total
+        self.files = files
+        self.id = id if id is not None else files_hash(files)
+        # Line counts were added since the snapshot was loaded or saved
+        self.dirty = False
+
+    @classmethod
+    def from_scan(cls, total, sig_paths, stats=None, previous=None):
+        """Snapshot of a scan; `stats` maps path -> (size, mtime_ns)."""
+        stats = stats or {}
+        known = previous.files if previous is not None else {}
+        files = {}
+        for path in sig_paths:
+            size, mtime = stats.get(path, (0, 0))
+            old = known.get(path)
+            if old is not None and old[SIZE] == size and old[MTIME] == mtime:
+                lines = old[LINES]
+            else:
+                lines = None
+            files[path] = [size, mtime, lines]
+        if previous is None or previous.id is None:
+            return cls(total, files)
+        changed = files.keys() ^ known.keys()
+        return cls(total, files, files_hash(changed, int(previous.id, 16)))
+
+    @property
+    def significant(self):
+        return self.files.keys()
+
+    def size(self, path):
+        return self.files[path][SIZE]
+
+    def lines(self, path):
+        """Line count, read from the file the first time it is needed."""
+        entry = self.files[path]
+        if entry[LINES] is None:
+            entry[LINES] = count_lines(path)
+            self.dirty = True
+        return entry[LINES]
+
+    @classmethod
+    def load(cls, path=SCAN_FILE):
+        """The saved snapshot, or None."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+        except json.JSONDecodeError:
+            return None
+        if "files" not in raw:
+            return None
+        return cls(raw["total"], raw["files"], raw.get("id"))
+
+    def save(self, path=SCAN_FILE):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Saved outside the state lock (scans and reports), so concurrent
+        # writers each need their own temp file
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "w") as f:
+            json.dump({"id": self.id, "total": self.total, "files": self.files}, f)
+        os.replace(temp, path)
+        self.dirty = False
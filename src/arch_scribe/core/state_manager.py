@@ -1,66 +1,205 @@
 import json
 import os
 import sys
-import shutil
 import datetime
-import re
 import copy
-from collections import defaultdict
+import time
 
 # Core imports
 from .constants import (
     STATE_FILE, BACKUP_FILE, SESSION_FILE, Colors, DEFAULT_STATE
 )
-# Config imports
-from ..config.insight_quality import ACTION_VERBS, IMPACT_WORDS, MIN_WORD_COUNT
-
+from . import changes, fingerprint, minhash, models, session, timeseries
+from .index import index_of, files_digest
+from .paths import PathTable
+from ..io import integrity, journal, migrations, persistence
 # New modular imports
-from ..scanning.file_scanner import FileScanner
-from ..metrics.coverage import calculate_coverage_quality
-from ..metrics.clarity import compute_clarity
-from ..metrics.completeness import compute_completeness
+# NOTE: the scanner and the insight word lists are imported where they are
+# used, so commands like `list` or `show` don't pay for them at startup.
+from ..operations import system_ops, insight_ops, dependency_ops, stats_ops
 
 
 class StateManager:
     def __init__(self):
         self.data = self.load_state()
-        self.scanner = FileScanner()
+        self._base_version = persistence.state_version(self.data)
+        self._journal = []
+        self._scanner = None
+        self._paths = None
+        self._snapshot = None
         self.session_start_state = None
 
+    @property
+    def scanner(self):
+        """FileScanner, built on first use (it reads .gitignore)."""
+        if self._scanner is None:
+            from ..scanning.file_scanner import FileScanner
+
+            self._scanner = FileScanner()
+        return self._scanner
+
+    def scan(self):
+        """scanner.scan_files(), keeping the result as the scan snapshot."""
+        from .snapshot import Snapshot
+
+        total, sig_total, sig_paths = self.scanner.scan_files()
+        saved = Snapshot.load()
+        snapshot = Snapshot.from_scan(
+            total, sig_paths, getattr(self.scanner, "stats", None), saved
+        )
+        if saved is None or saved.total != total or saved.files != snapshot.files:
+            snapshot.save()
+        self._snapshot = snapshot
+        return total, sig_total, sig_paths
+
+    def snapshot(self, rescan=False):
+        """The last scan's snapshot; scans if there is none (or `rescan`)."""
+        if rescan or self._snapshot is None:
+            from .snapshot import Snapshot
+
+            self._snapshot = None if rescan else Snapshot.load()
+            if self._snapshot is None:
+                self.scan()
+        return self._snapshot
+
+    @property
+    def paths(self):
+        """Persistent PathTable (path <-> integer ID), loaded on first use."""
+        if self._paths is None:
+            self._paths = PathTable.load()
+        return self._paths
+
     def load_state(self):
         if not os.path.exists(STATE_FILE):
             return None
         try:
-            with open(STATE_FILE, "r") as f:
-                return json.load(f)
+            self.upgrade_state()
+            return models.hydrate(persistence.read_state(STATE_FILE))
+        except integrity.ChecksumMismatch as e:
+            print(
+                f"{Colors.WARNING}⚠️  {STATE_FILE} was edited outside arch_state "
+                f"(systems affected: {', '.join(e.damaged) or 'none'}); "
+                f"keeping the edits.{Colors.ENDC}"
+            )
+            return self.restamp_state(e.data)
         except json.JSONDecodeError:
             print(f"{Colors.FAIL}❌ Error: {STATE_FILE} is corrupted.{Colors.ENDC}")
-            if os.path.exists(BACKUP_FILE):
-                print(f"{Colors.WARNING}⚠️  Restoring from backup...{Colors.ENDC}")
-                with open(BACKUP_FILE, "r") as f:
-                    return json.load(f)
+        return self.salvage_state()
+
+    def restamp_state(self, data):
+        """Take a hand-edited state as it is and write it back with fresh
+        checksums, so the edits are not mistaken for damage again."""
+        data = integrity.adopt(data)
+        with persistence.state_lock():
+            persistence.write_state(data, STATE_FILE, BACKUP_FILE)
+        changes.reset()
+        return data
+
+    def salvage_state(self):
+        """Rebuild from what still parses, the backup and the journal."""
+        print(f"{Colors.WARNING}⚠️  Restoring from backup, journal and intact parts of {STATE_FILE}...{Colors.ENDC}")
+        data, report = integrity.salvage(STATE_FILE, BACKUP_FILE)
+        changes.reset()
+        if data is None:
+            print(f"{Colors.FAIL}❌ Nothing could be recovered.{Colors.ENDC}")
             sys.exit(1)
+        print(
+            f"{Colors.WARNING}   {report['from_file']} systems intact in file, "
+            f"{report['rebuilt']} rebuilt from backup, "
+            f"{report['replayed']} journal operations replayed.{Colors.ENDC}"
+        )
+        for name in report["unverified"]:
+            print(f"{Colors.WARNING}   ⚠️  {name}: kept unverified (no other copy){Colors.ENDC}")
+        return data
+
+    def upgrade_state(self):
+        """Migrate STATE_FILE to the current schema if it is older.
+
+        A current file costs one small read; the lock is only taken when
+        there is something to migrate.
+        """
+        if not migrations.plan(migrations.detect_version(STATE_FILE)):
+            return
+        with persistence.state_lock():
+            result = migrations.migrate_file(STATE_FILE)
+            if result:
+                changes.reset()
+        if result:
+            old, new = result
+            print(
+                f"{Colors.BLUE}🔄 Migrated {STATE_FILE} from schema {old or 'legacy'} to {new}{Colors.ENDC}"
+            )
+
+    def _apply(self, op, *args):
+        """Run a pure operation on the state and journal it for replay."""
+        result = op(self.data, *args)
+        self._journal.append((op, args))
+        return result
 
     def save_state(self):
+        """Commit under the state lock with optimistic concurrency.
+
+        If another writer saved since we loaded (state_version moved on), the
+        journaled operations are replayed on top of the fresh state instead
+        of overwriting it.
+        """
         if not self.data:
             return
-        self.data["metadata"]["last_updated"] = datetime.datetime.now().isoformat()
 
-        # Atomic Write Pattern
-        if os.path.exists(STATE_FILE):
-            shutil.copy(STATE_FILE, BACKUP_FILE)
-        temp = STATE_FILE + ".tmp"
-        with open(temp, "w") as f:
-            json.dump(self.data, f, indent=2)
-        os.replace(temp, STATE_FILE)
+        with persistence.state_lock():
+            disk_version = persistence.read_version(STATE_FILE)
+            if (
+                self._journal
+                and disk_version is not None
+                and disk_version != self._base_version
+            ):
+                fresh = models.hydrate(persistence.read_state(STATE_FILE))
+                for op, args in self._journal:
+                    op(fresh, *args)
+                self.data = fresh
+
+            meta = self.data["metadata"]
+            meta["last_updated"] = datetime.datetime.now().isoformat()
+            meta["state_version"] = max(
+                meta.get("state_version", 0), disk_version or 0
+            ) + 1
+
+            # Journal first, so a damaged write can be rebuilt from the backup
+            journal.append(meta["state_version"], self._journal)
+            # Atomic Write Pattern
+            persistence.write_state(self.data, STATE_FILE, BACKUP_FILE)
+            changes.commit(self.data, meta["state_version"])
+            if self._paths is not None and self._paths.dirty:
+                self._paths.save()
+            # The owners index and the coverage tree share one stamp
+            stamp = files_digest(self.data)
+            index = getattr(self.data, "index", None)
+            if index is not None and index.dirty:
+                index.save(stamp)
+            signatures = getattr(self.data, "minhash", None)
+            if signatures is not None and signatures.dirty:
+                signatures.save(minhash.insights_digest(self.data))
+            tree = getattr(self.data, "dirtree", None)
+            if tree is not None and tree.dirty:
+                tree.save(stamp)
+
+        self._base_version = meta["state_version"]
+        self._journal = []
         print(f"{Colors.GREEN}💾 State saved.{Colors.ENDC}")
 
-    def init_project(self, name):
+    def init_project(self, name, overwrite=None):
+        """Start a fresh state. An existing state file is replaced only if
+        `overwrite`; None asks."""
         if os.path.exists(STATE_FILE):
-            if input(f"Overwrite {STATE_FILE}? (y/N): ").lower() != "y":
-                return
+            if overwrite is None:
+                overwrite = input(f"Overwrite {STATE_FILE}? (y/N): ").lower() == "y"
+            if not overwrite:
+                print(f"{Colors.WARNING}⚠️  {STATE_FILE} already exists; not overwritten.{Colors.ENDC}")
+                return False
 
-        self.data = copy.deepcopy(DEFAULT_STATE)
+        self.data = models.State(copy.deepcopy(DEFAULT_STATE))
+        self._journal = []
+        changes.reset()
 
         self.data["metadata"]["project_name"] = name
         self.data["metadata"]["project_type"] = self.detect_project_type()
@@ -69,6 +208,7 @@ class StateManager:
         print(
             f"{Colors.BLUE}   Detected type: {self.data['metadata']['project_type']}{Colors.ENDC}"
         )
+        return True
 
     def detect_project_type(self):
         """Infer project type from file signatures"""
@@ -96,87 +236,108 @@ class StateManager:
         return "Unknown"
 
     # --- METRICS & SCANNING ---
-    def update_stats(self):
+    def update_stats(self, save=True):
+        """Rescan and refresh scan_stats. Read commands pass save=False:
+        the refreshed stats are only used in memory."""
         if not self.data:
             return
-        
-        # Delegate to scanner
-        total, sig_total, sig_paths = self.scanner.scan_files()
 
-        mapped = set()
-        systems = self.data.get("systems", {})
-        for s in systems.values():
-            mapped.update(s.get("key_files", []))
-
-        mapped_sig = len(sig_paths.intersection(mapped))
-        cov = (mapped_sig / sig_total * 100) if sig_total > 0 else 0.0
-        
-        # Delegate to metrics
-        quality = calculate_coverage_quality(sig_paths, mapped)
-
-        stats = self.data["metadata"]["scan_stats"]
-        stats.update(
-            {
-                "total_files_scanned": total,
-                "significant_files_total": sig_total,
-                "mapped_files_count": mapped_sig,
-                "coverage_percentage": round(cov, 1),
-                "coverage_quality": quality,
-            }
+        # Fingerprint first: a change during the scan then shows as stale
+        tree = fingerprint.tree()
+        # Delegate to scanner
+        total, sig_total, sig_paths = self.scan()
+        self._apply(
+            stats_ops.refresh_stats, total, sig_total, sig_paths, self.paths, tree
         )
+        if save:
+            self.save_state()
+            self.record_series()
 
-        prog = self.data["progress"]
-        prog["systems_identified"] = len(systems)
-        prog["systems_complete"] = len(
-            [s for s in systems.values() if s.get("completeness", 0) >= 85]
-        )
-        if systems:
-            prog["estimated_overall_completeness"] = round(
-                sum(s.get("completeness", 0) for s in systems.values()) / len(systems),
-                1,
-            )
-        self.save_state()
+    def stats_stale(self):
+        """True if the tree changed since scan_stats were computed (or they
+        never recorded a fingerprint)."""
+        stored = self.data["metadata"].get("scan_stats", {}).get("tree_fingerprint")
+        return stored is None or stored != fingerprint.tree()
+
+    def record_series(self, kind=timeseries.STATS):
+        """Append the current metrics to the time series."""
+        with persistence.state_lock():
+            timeseries.append(self.data, kind)
 
     # --- SESSION TRACKING ---
     def start_session(self):
         """Mark the beginning of a new session"""
         if not self.data:
-            return
+            return False
 
+        # Baseline is a compact fingerprint, not a copy of the whole state;
+        # the actual deltas are recorded by the mutation commands.
+        self.session_start_state = session.fingerprint(self.data)
         with open(SESSION_FILE, "w") as f:
-            json.dump(self.data, f)
+            json.dump(self.session_start_state, f)
 
-        self.session_start_state = copy.deepcopy(self.data)
-        self.data["metadata"]["total_sessions"] += 1
+        self._apply(session.open_session)
         self.save_state()
+        self.record_series(timeseries.SESSION_START)
         print(
             f"{Colors.BLUE}📍 Session {self.data['metadata']['total_sessions']} started{Colors.ENDC}"
         )
+        return True
 
     def end_session(self):
         """Record what happened in this session"""
         if not self.data:
-            return
+            return False
 
-        if self.session_start_state is None and os.path.exists(SESSION_FILE):
-            try:
-                with open(SESSION_FILE, "r") as f:
-                    self.session_start_state = json.load(f)
-            except json.JSONDecodeError:
-                pass
+        if session.active(self.data) is not None:
+            counts = session.delta_counts(self.data)
+        else:
+            if self.session_start_state is None and os.path.exists(SESSION_FILE):
+                try:
+                    with open(SESSION_FILE, "r") as f:
+                        self.session_start_state = json.load(f)
+                except json.JSONDecodeError:
+                    pass
 
-        if not self.session_start_state:
-            print(
-                f"{Colors.WARNING}⚠️  No active session found (run session-start first).{Colors.ENDC}"
-            )
-            return
+            if not self.session_start_state:
+                print(
+                    f"{Colors.WARNING}⚠️  No active session found (run session-start first).{Colors.ENDC}"
+                )
+                return False
+
+            if session.is_fingerprint(self.session_start_state):
+                counts = session.diff_fingerprints(
+                    self.session_start_state, session.fingerprint(self.data)
+                )
+            else:
+                counts = self._legacy_session_delta(self.session_start_state)
 
-        old_systems = set(self.session_start_state.get("systems", {}).keys())
+        self._apply(
+            session.close_session, counts, datetime.datetime.now().isoformat()
+        )
+        self.save_state()
+        self.record_series(timeseries.SESSION_END)
+        systems_added, files_mapped, insights_added = counts
+        session_id = self.data["metadata"]["total_sessions"]
+        self.session_start_state = None
+
+        if os.path.exists(SESSION_FILE):
+            os.remove(SESSION_FILE)
+
+        print(f"{Colors.GREEN}✅ Session {session_id} recorded:{Colors.ENDC}")
+        print(f"   Systems added: {systems_added}")
+        print(f"   Files mapped: {files_mapped}")
+        print(f"   Insights added: {insights_added}")
+        return True
+
+    def _legacy_session_delta(self, start_state):
+        """Delta against a full-state dump written by older versions."""
+        old_systems = set(start_state.get("systems", {}).keys())
         new_systems = set(self.data["systems"].keys())
         systems_added = len(new_systems - old_systems)
 
         old_files = set()
-        for s in self.session_start_state.get("systems", {}).values():
+        for s in start_state.get("systems", {}).values():
             old_files.update(s.get("key_files", []))
 
         new_files = set()
@@ -187,105 +348,64 @@ class StateManager:
 
         old_insights = sum(
             len(s.get("insights", []))
-            for s in self.session_start_state.get("systems", {}).values()
+            for s in start_state.get("systems", {}).values()
         )
         new_insights = sum(
             len(s.get("insights", [])) for s in self.data["systems"].values()
         )
-        insights_added = new_insights - old_insights
-
-        session_id = self.data["metadata"]["total_sessions"]
-        self.data["metadata"]["session_history"].append(
-            {
-                "session_id": session_id,
-                "timestamp": datetime.datetime.now().isoformat(),
-                "new_systems_found": systems_added,
-                "new_files_mapped": files_mapped,
-                "insights_added": insights_added,
-            }
-        )
-
-        self.save_state()
-
-        if os.path.exists(SESSION_FILE):
-            os.remove(SESSION_FILE)
-
-        print(f"{Colors.GREEN}✅ Session {session_id} recorded:{Colors.ENDC}")
-        print(f"   Systems added: {systems_added}")
-        print(f"   Files mapped: {files_mapped}")
-        print(f"   Insights added: {insights_added}")
+        return systems_added, files_mapped, new_insights - old_insights
 
     # --- MODIFICATION COMMANDS ---
     def add_system(self, name):
         if not self.data:
-            return
-        if name in self.data["systems"]:
+            return False
+        if not self._apply(system_ops.add_system, name):
             print(f"{Colors.WARNING}⚠️  System '{name}' already exists.{Colors.ENDC}")
-            return
-        self.data["systems"][name] = {
-            "description": "TODO",
-            "completeness": 0,
-            "clarity": "low",
-            "key_files": [],
-            "dependencies": [],
-            "insights": [],
-            "complexities": [],
-        }
+            return False
         print(f"{Colors.GREEN}✅ Added system: {name}{Colors.ENDC}")
         self.save_state()
+        return True
 
     def update_system(self, name, desc=None):
         if name not in self.data["systems"]:
             print(f"{Colors.FAIL}❌ System '{name}' not found.{Colors.ENDC}")
-            return
-
-        sys = self.data["systems"][name]
+            return False
 
-        if desc:
-            if "\n" in desc:
-                print(
-                    f"{Colors.FAIL}❌ Description cannot contain newlines. Use single-line descriptions.{Colors.ENDC}"
-                )
-                return
-            sys["description"] = desc
+        if desc and "\n" in desc:
+            print(
+                f"{Colors.FAIL}❌ Description cannot contain newlines. Use single-line descriptions.{Colors.ENDC}"
+            )
+            return False
 
-        # Delegate to metrics
-        sys["clarity"] = compute_clarity(sys)
-        sys["completeness"] = compute_completeness(sys)
+        self._apply(system_ops.update_system, name, desc)
 
         print(f"{Colors.GREEN}✅ Updated metadata for: {name}{Colors.ENDC}")
         self.save_state()
+        return True
 
     def map_files(self, name, files):
         if name not in self.data["systems"]:
             print(f"{Colors.FAIL}❌ System '{name}' not found.{Colors.ENDC}")
-            return
-
-        sys = self.data["systems"][name]
-        sys["key_files"].extend(files)
-        sys["key_files"] = list(set(sys["key_files"]))
+            return False
 
-        # Delegate to metrics
-        sys["clarity"] = compute_clarity(sys)
-        sys["completeness"] = compute_completeness(sys)
+        self._apply(system_ops.map_files, name, files)
 
         print(f"{Colors.GREEN}✅ Mapped {len(files)} files to: {name}{Colors.ENDC}")
         self.update_stats()
+        return True
 
     def similar_text(self, a, b, threshold=0.8):
-        words_a = set(a.lower().split())
-        words_b = set(b.lower().split())
-        if not words_a or not words_b:
-            return False
-        overlap = len(words_a & words_b) / max(len(words_a), len(words_b))
-        return overlap > threshold
+        return insight_ops.similar_text(a, b, threshold)
 
-    def add_insight(self, name, text, force=False):
+    def add_insight(self, name, text, force=False, strictness="standard", confirm=None):
+        """Record an insight. `force` skips the quality check; otherwise
+        one that fails it is added only if `confirm` (None asks)."""
         if name not in self.data["systems"]:
-            return
+            print(f"{Colors.FAIL}❌ System '{name}' not found.{Colors.ENDC}")
+            return False
 
         if not force:
-            errors = self.validate_insight_quality(text)
+            errors = self.validate_insight_quality(text, strictness)
             if errors:
                 print(f"{Colors.WARNING}⚠️  Insight quality issues:{Colors.ENDC}")
                 for e in errors:
@@ -298,102 +418,106 @@ class StateManager:
                     f"{Colors.BLUE}Example: 'Implements token refresh using Redis cache, which reduces DB load'{Colors.ENDC}"
                 )
 
-                response = input(f"\n{Colors.WARNING}Add anyway? (y/N): {Colors.ENDC}")
-                if response.lower() != "y":
+                if confirm is None:
+                    response = input(f"\n{Colors.WARNING}Add anyway? (y/N): {Colors.ENDC}")
+                    confirm = response.lower() == "y"
+                if not confirm:
                     print(
                         f"{Colors.FAIL}❌ Insight rejected. Please rewrite.{Colors.ENDC}"
                     )
-                    return
+                    return False
                 else:
                     print(
                         f"{Colors.WARNING}⚠️  Added with quality issues (consider revising later){Colors.ENDC}"
                     )
 
-        existing = self.data["systems"][name]["insights"]
-        if any(self.similar_text(text, e) for e in existing):
+        if not self._apply(insight_ops.add_insight, name, text):
             print(
                 f"{Colors.WARNING}⚠️  Similar insight already exists. Skipping.{Colors.ENDC}"
             )
-            return
-
-        existing.append(text)
-
-        sys = self.data["systems"][name]
-        # Delegate to metrics
-        sys["clarity"] = compute_clarity(sys)
-        sys["completeness"] = compute_completeness(sys)
+            return False
 
         print(f"{Colors.GREEN}✅ Added insight to: {name}{Colors.ENDC}")
+        elsewhere = sorted(
+            {s for s, _ in insight_ops.find_similar(self.data, text) if s != name}
+        )
+        if elsewhere:
+            print(
+                f"{Colors.WARNING}⚠️  Similar insight also recorded in: {', '.join(elsewhere)}{Colors.ENDC}"
+            )
         self.save_state()
+        return True
 
-    def add_dependency(self, name, target, reason):
+    def add_dependency(self, name, target, reason, create=None):
+        """Link `name` to `target`. A missing target is created first only
+        if `create` (None asks)."""
         if name not in self.data["systems"]:
             print(f"{Colors.FAIL}❌ System '{name}' not found.{Colors.ENDC}")
-            return
+            return False
 
         if target not in self.data["systems"]:
             print(
                 f"{Colors.WARNING}⚠️  Target system '{target}' doesn't exist yet.{Colors.ENDC}"
             )
-            if input("Create it now? (y/N): ").lower() == "y":
-                self.add_system(target)
-            else:
-                return
-
-        sys = self.data["systems"][name]
-        sys["dependencies"].append({"system": target, "reason": reason})
+            if create is None:
+                create = input("Create it now? (y/N): ").lower() == "y"
+            if not create:
+                print(f"{Colors.FAIL}❌ Not linked: create '{target}' first.{Colors.ENDC}")
+                return False
+            self.add_system(target)
 
-        # Delegate to metrics
-        sys["clarity"] = compute_clarity(sys)
-        sys["completeness"] = compute_completeness(sys)
+        self._apply(dependency_ops.add_dependency, name, target, reason)
 
         print(f"{Colors.GREEN}✅ Linked {name} -> {target}{Colors.ENDC}")
         self.save_state()
+        return True
 
-    def validate_schema(self):
+    def validate_schema(self, strictness=None, full=False):
+        """Schema and coverage checks. Systems unchanged since the last run
+        reuse their cached results unless `full` is set."""
         if not self.data:
             return []
 
-        errors = []
+        from . import validation
+
         systems = self.data.get("systems", {})
+        log = validation.load_log(self.data)
+        results, checked = validation.validate_systems(self.data, log, full)
+        if log is not None:
+            with persistence.state_lock():
+                fresh = changes.ChangeLog.load()
+                fresh.results = results
+                fresh.dirty = True
+                fresh.checkpoint(changes.VALIDATE, self.data["metadata"]["state_version"])
+                fresh.save()
+        if checked < len(systems):
+            print(
+                f"{Colors.BLUE}🔎 Revalidated {checked} changed system(s); "
+                f"{len(systems) - checked} unchanged (use --full to recheck all){Colors.ENDC}"
+            )
 
-        for name, sys in systems.items():
-            if not sys.get("description") or sys["description"] == "TODO":
-                errors.append(f"{name}: Missing or placeholder description")
-            if not sys.get("key_files"):
-                errors.append(f"{name}: No key_files listed")
-            if not sys.get("insights"):
-                errors.append(f"{name}: No insights recorded")
-
-            insight_count = len(sys.get("insights", []))
-            completeness = sys.get("completeness", 0)
-
-            if completeness >= 50 and insight_count < 3:
-                errors.append(
-                    f"{name}: {completeness}% complete but only {insight_count} insights "
-                    f"(need 3+ for 50%+ completeness)"
-                )
+        errors = validation.field_errors(results)
 
-            if completeness >= 80 and insight_count < 5:
-                errors.append(
-                    f"{name}: {completeness}% complete but only {insight_count} insights "
-                    f"(need 5+ for 80%+ completeness)"
-                )
+        if strictness:
+            from ..metrics import quality_rules
 
-        for name, sys in systems.items():
-            for dep in sys.get("dependencies", []):
-                if dep["system"] not in systems:
+            for name, sys in systems.items():
+                failing = sum(
+                    not quality_rules.passes(t, strictness) for t in sys.get("insights", [])
+                )
+                if failing:
                     errors.append(
-                        f"{name}: References non-existent system '{dep['system']}'"
+                        f"{name}: {failing} insight(s) fail '{strictness}' quality rules"
                     )
 
+        errors.extend(validation.dangling(results))
+
         # Delegate to scanner
-        total, sig_total, sig_paths = self.scanner.scan_files()
-        mapped = set()
-        for sys in systems.values():
-            mapped.update(sys["key_files"])
+        total, sig_total, sig_paths = self.scan()
+        table = self.paths
+        orphan_ids = table.intern_many(sig_paths) - index_of(self.data).ids(table)
 
-        orphans = sig_paths - mapped
+        orphans = table.paths_for(sorted(orphan_ids))
         core_orphans = [
             f
             for f in orphans
@@ -407,53 +531,141 @@ class StateManager:
 
         return errors
 
+    def recompute_metrics(self, full=False):
+        """Rescore clarity/completeness in one batch: the systems changed
+        since the last recompute, or all of them with `full`."""
+        if not self.data:
+            return []
+        from . import validation
+
+        log = validation.load_log(self.data)
+        names = None
+        if log is not None and not full:
+            names = log.since(changes.METRICS)
+            if names is not None:
+                names = sorted(names)
+
+        started = time.perf_counter()
+        changed = self._apply(stats_ops.recompute_metrics, names)
+        elapsed = (time.perf_counter() - started) * 1000
+        scope = len(self.data["systems"]) if names is None else len(names)
+        print(
+            f"{Colors.BLUE}♻️  Recomputed metrics for {scope} systems "
+            f"in {elapsed:.1f} ms ({len(changed)} changed){Colors.ENDC}"
+        )
+        for name in changed:
+            s = self.data["systems"][name]
+            print(f"   • {name}: {s['completeness']}% ({s['clarity']} clarity)")
+        if changed:
+            self.save_state()
+        if log is not None:
+            with persistence.state_lock():
+                fresh = changes.ChangeLog.load()
+                fresh.checkpoint(changes.METRICS, self.data["metadata"]["state_version"])
+                fresh.save()
+        return changed
+
+    def verify_stats(self):
+        """Check the incrementally maintained aggregates against a full
+        recomputation. Read-only; returns the list of mismatches."""
+        if not self.data:
+            return []
+        total, sig_total, sig_paths = self.scan()
+        return stats_ops.verify_stats(self.data, sig_paths)
+
     # --- REPORTING ---
-    def print_status(self):
-        self.update_stats()
+    def status_summary(self, refresh=False):
+        """Project summary from the persisted scan_stats. Rescans (without
+        saving) only if `refresh` or the tree changed since they were taken."""
+        if not self.data:
+            return None
+        stale = refresh or self.stats_stale()
+        if stale:
+            self.update_stats(save=False)
         meta = self.data["metadata"]
         stats = meta["scan_stats"]
-        cov_color = (
-            Colors.GREEN if stats["coverage_percentage"] >= 90 else Colors.WARNING
-        )
+        prog = self.data["progress"]
+        return {
+            "project": meta.get("project_name"),
+            "project_type": meta.get("project_type", "Unknown"),
+            "phase": meta.get("phase", "survey"),
+            "sessions": meta.get("total_sessions", 0),
+            "coverage": stats["coverage_percentage"],
+            "quality": stats["coverage_quality"],
+            "mapped": stats["mapped_files_count"],
+            "significant": stats["significant_files_total"],
+            "systems_identified": prog["systems_identified"],
+            "systems_complete": prog["systems_complete"],
+            "gate_a": stats["coverage_percentage"] >= 90,
+            "gate_b": self._low_yield_streak() >= 3,
+            "rescanned": bool(stale),
+        }
+
+    def print_status(self, refresh=False):
+        summary = self.status_summary(refresh)
+        if summary is None:
+            return
+        cov_color = Colors.GREEN if summary["gate_a"] else Colors.WARNING
 
         print(f"\n{Colors.HEADER}=== 🏛️  PROJECT STATE ==={Colors.ENDC}")
         print(
-            f"Project:  {Colors.BOLD}{meta.get('project_name')}{Colors.ENDC} ({meta.get('project_type', 'Unknown')})"
+            f"Project:  {Colors.BOLD}{summary['project']}{Colors.ENDC} ({summary['project_type']})"
         )
-        print(f"Phase:    {meta.get('phase', 'survey')}")
-        print(f"Sessions: {meta.get('total_sessions', 0)}")
+        print(f"Phase:    {summary['phase']}")
+        print(f"Sessions: {summary['sessions']}")
         print(
-            f"Coverage: {cov_color}{stats['coverage_percentage']}%{Colors.ENDC} ({stats['mapped_files_count']}/{stats['significant_files_total']} significant files)"
+            f"Coverage: {cov_color}{summary['coverage']}%{Colors.ENDC} ({summary['mapped']}/{summary['significant']} significant files)"
         )
-        print(f"Quality:  {stats['coverage_quality']}% (excluding tests/docs)")
+        print(f"Quality:  {summary['quality']}% (excluding tests/docs)")
         print(
-            f"Systems:  {self.data['progress']['systems_identified']} identified, {self.data['progress']['systems_complete']} complete"
+            f"Systems:  {summary['systems_identified']} identified, {summary['systems_complete']} complete"
         )
 
-        if stats["coverage_percentage"] >= 90:
+        if summary["gate_a"]:
             print(
                 f"\n{Colors.GREEN}🎯 Gate A: Coverage threshold met (90%+){Colors.ENDC}"
             )
 
-        if len(meta.get("session_history", [])) >= 3:
-            last_3 = meta["session_history"][-3:]
-            if all(
-                s["new_systems_found"] == 0 and s["new_files_mapped"] < 3
-                for s in last_3
-            ):
-                print(
-                    f"\n{Colors.GREEN}🎯 Gate B: Diminishing returns detected (3 low-yield sessions){Colors.ENDC}"
-                )
+        if summary["gate_b"]:
+            print(
+                f"\n{Colors.GREEN}🎯 Gate B: Diminishing returns detected (3 low-yield sessions){Colors.ENDC}"
+            )
 
-    def list_systems(self):
-        print(f"\n{Colors.HEADER}=== 🗺️  SYSTEMS ==={Colors.ENDC}")
+    def _low_yield_streak(self):
+        """Trailing low-yield sessions, from the metrics time series; states
+        with fewer than 3 sessions recorded there fall back to
+        session_history."""
+        series = timeseries.Series()
+        if len(series.sessions()) >= 3:
+            return series.low_yield_streak()
+        streak = 0
+        for s in reversed(self.data["metadata"].get("session_history", [])):
+            if s["new_systems_found"] > 0 or s["new_files_mapped"] >= 3:
+                break
+            streak += 1
+        return streak
+
+    def systems_summary(self):
+        """One dict per system, most complete first; yielded lazily."""
         for name, s in sorted(
             self.data["systems"].items(),
             key=lambda x: x[1]["completeness"],
             reverse=True,
         ):
+            yield {
+                "name": name,
+                "completeness": s["completeness"],
+                "clarity": s.get("clarity"),
+                "files": len(s["key_files"]),
+                "insights": len(s["insights"]),
+                "dependencies": len(s.get("dependencies", ())),
+            }
+
+    def list_systems(self):
+        print(f"\n{Colors.HEADER}=== 🗺️  SYSTEMS ==={Colors.ENDC}")
+        for s in self.systems_summary():
             print(
-                f"{name:<30} | {s['completeness']:>3}% | {len(s['key_files']):>2} files | {len(s['insights']):>2} insights"
+                f"{s['name']:<30} | {s['completeness']:>3}% | {s['files']:>2} files | {s['insights']:>2} insights"
             )
 
     def show_system(self, name, summary=False):
@@ -472,56 +684,277 @@ class StateManager:
             }
             print(json.dumps(output, indent=2))
         else:
-            print(json.dumps(sys, indent=2))
+            print(json.dumps(sys, indent=2, default=models.to_json))
+
+    def print_duplicates(self, threshold=0.8):
+        if not self.data:
+            return []
+        clusters = insight_ops.duplicate_clusters(self.data, threshold)
+        systems = self.data["systems"]
+
+        print(f"\n{Colors.HEADER}=== 🔁 NEAR-DUPLICATE INSIGHTS (>{threshold:.0%} overlap) ==={Colors.ENDC}")
+        if not clusters:
+            print("  (none)")
+        for n, cluster in enumerate(clusters, 1):
+            names = sorted({name for name, _ in cluster})
+            print(f"\n{Colors.BOLD}Cluster {n}{Colors.ENDC} ({len(cluster)} insights, {', '.join(names)})")
+            for name, i in cluster:
+                print(f"  • [{name}] {systems[name]['insights'][i]}")
+        return clusters
+
+    def audit_report(self, corpus=None, workers=1, out=None, strictness="standard"):
+        """(results, source) of re-scoring the stored insights, or a JSONL
+        corpus, with the current rules; None if there is nothing to audit.
+        With `out`, the per-insight results are also written there."""
+        from ..metrics import audit, quality_rules
+
+        if corpus is not None:
+            if not os.path.exists(corpus):
+                print(f"{Colors.FAIL}❌ Corpus '{corpus}' not found.{Colors.ENDC}")
+                return None
+            records = audit.from_jsonl(corpus)
+            source = corpus
+            # Not the project's insights: keep its outcomes out of the sidecar
+            store = quality_rules.OutcomeCache()
+        elif self.data:
+            records = audit.from_state(self.data)
+            source = STATE_FILE
+            store = quality_rules.cache()
+        else:
+            return None
+
+        results = audit.audit(records, workers, strictness, store)
+        if corpus is None:
+            store.save()
+        if out:
+            with open(out, "w") as f:
+                for r in results:
+                    f.write(json.dumps(r) + "\n")
+        return results, source
+
+    def audit_insights(self, corpus=None, workers=1, show_all=False, out=None, strictness="standard"):
+        """Print audit_report() per insight and per system."""
+        from ..metrics import audit
+
+        report = self.audit_report(corpus, workers, out, strictness)
+        if report is None:
+            return None
+        results, source = report
+
+        print(
+            f"\n{Colors.HEADER}=== 🔍 INSIGHT AUDIT ({len(results)} from {source}, {strictness}) ==={Colors.ENDC}"
+        )
+        for r in results:
+            if r["codes"] or show_all:
+                codes = ", ".join(r["codes"]) or "ok"
+                print(f"  {r['id']:<40} {codes}")
+
+        print(f"\n{Colors.HEADER}=== 📋 QUALITY BY SYSTEM ==={Colors.ENDC}")
+        for name, s in audit.summarize(results).items():
+            color = Colors.GREEN if s["pass_rate"] >= 80 else Colors.WARNING
+            codes = ", ".join(f"{c} ×{n}" for c, n in s["codes"].items())
+            print(
+                f"{name:<30} | {color}{s['pass_rate']:>5}%{Colors.ENDC} | {s['passed']}/{s['insights']} pass"
+                + (f" | {codes}" if codes else "")
+            )
+        if out:
+            print(f"\n{Colors.BLUE}Per-insight results written to {out}{Colors.ENDC}")
+        return results
+
+    def print_owner(self, path):
+        if not self.data:
+            return
+        owners = index_of(self.data).owners_of(path)
+        if not owners:
+            print(f"{Colors.WARNING}⚠️  {path} is not mapped to any system.{Colors.ENDC}")
+            return
+        for name in owners:
+            print(name)
+
+    def print_owners(self, prefix=None, shared=False):
+        if not self.data:
+            return
+        index = index_of(self.data)
+        if shared:
+            entries = index.shared()
+            title = "FILES CLAIMED BY MULTIPLE SYSTEMS"
+        else:
+            entries = index.under(prefix or ".")
+            title = f"OWNERS UNDER {prefix or '.'}"
+
+        print(f"\n{Colors.HEADER}=== 🗂️  {title} ==={Colors.ENDC}")
+        if not entries:
+            print("  (none)")
+            return
+        for path, owners in entries.items():
+            print(f"  {path:<50} {', '.join(owners)}")
 
     def sanitize_for_mermaid(self, name):
-        return re.sub(r"[^\w]", "_", name)
-
-    def export_graph(self):
-        print(f"\n{Colors.HEADER}=== 🕸️  DEPENDENCY GRAPH (Mermaid) ==={Colors.ENDC}")
-        print("```mermaid")
-        print("graph TD")
-
-        for name in self.data["systems"].keys():
-            safe_name = self.sanitize_for_mermaid(name)
-            print(f'  {safe_name}["{name}"]')
-
-        for name, s in self.data["systems"].items():
-            source = self.sanitize_for_mermaid(name)
-            for dep in s.get("dependencies", []):
-                target = self.sanitize_for_mermaid(dep["system"])
-                reason = (
-                    (dep["reason"][:30] + "..")
-                    if len(dep["reason"]) > 30
-                    else dep["reason"]
-                )
-                print(f"  {source} -->|{reason}| {target}")
-        print("```")
+        from ..reporting.mermaid import sanitize
+
+        return sanitize(name)
 
-    def print_coverage_detail(self):
+    def export_graph(self, collapse_cycles=False, collapse_leaves=False, max_nodes=None, out_dir=None, out=None):
+        """Mermaid diagram of the dependencies (reporting.mermaid), sharded
+        above `max_nodes` nodes; into `out_dir` as index.md plus one file per
+        shard, or to `out` (stdout under a header by default). Returns the
+        number of diagrams."""
         if not self.data:
             return
 
-        # Delegate to scanner
-        total, sig_total, sig_paths = self.scanner.scan_files()
-        mapped = set()
-        for s in self.data["systems"].values():
-            mapped.update(s["key_files"])
+        from ..reporting import mermaid
+        from .graph import graph_of
+
+        if max_nodes is None:
+            max_nodes = mermaid.MAX_NODES
+        graph = graph_of(self.data)
+        if out_dir is None and out is None:
+            print(f"\n{Colors.HEADER}=== 🕸️  DEPENDENCY GRAPH (Mermaid) ==={Colors.ENDC}")
+            sys.stdout.flush()
+        diagrams = mermaid.export(graph, out, out_dir, collapse_cycles, collapse_leaves, max_nodes)
+        if out_dir is not None:
+            where = os.path.join(out_dir, "index.md")
+            print(f"{Colors.GREEN}✅ {diagrams} diagram(s) written; start at {where}{Colors.ENDC}")
+        return diagrams
+
+    def export_reports(self, formats, out_dir, workers=None):
+        """Write the graph in each of `formats` into `out_dir`
+        (reporting.reporters), all from one shared model."""
+        if not self.data:
+            return
+
+        from ..reporting.reporters import Model, render
+
+        try:
+            written = render(Model.from_state(self.data), formats, out_dir, workers)
+        except ValueError as e:
+            print(f"{Colors.FAIL}❌ {e}{Colors.ENDC}")
+            return
+        for fmt, paths in written.items():
+            print(f"{Colors.GREEN}✅ {fmt:<8}{Colors.ENDC} {', '.join(paths)}")
+        return written
+
+    def graph_summary(self, top=10, samples=32):
+        """Cycles, layering, fan-in/fan-out and betweenness of the dependency
+        graph (core.graph). Betweenness is estimated from `samples` source
+        systems on graphs larger than that."""
+        from .graph import graph_of
+
+        graph = graph_of(self.data)
+        estimated = len(graph) > samples
+        scores = graph.betweenness(samples if estimated else None)
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:top]
+        return {
+            "systems": len(graph),
+            "edges": graph.edge_count,
+            "missing": sorted(graph.missing),
+            "cycles": graph.cycles(),
+            "layers": graph.layers(),
+            "fan_in": [[n, d] for n, d in graph.top_degrees(top, reverse_edges=True) if d],
+            "fan_out": [[n, d] for n, d in graph.top_degrees(top) if d],
+            "betweenness": [[n, round(v, 2)] for n, v in ranked if v > 0],
+            "betweenness_samples": samples if estimated else None,
+        }
+
+    def dependency_path(self, source, target):
+        """Shortest dependency chain, None if there is none; raises KeyError
+        for an unknown system."""
+        from .graph import graph_of
 
-        dir_stats = defaultdict(lambda: {"total": 0, "mapped": 0, "files": []})
+        graph = graph_of(self.data)
+        for name in (source, target):
+            if name not in graph.ids:
+                raise KeyError(name)
+        return graph.shortest_path(source, target)
+
+    def print_graph_stats(self, top=10, path=None, samples=32):
+        """Graph stats (graph_summary), or with `path` a (source, target)
+        pair, the shortest dependency chain between them."""
+        if not self.data:
+            return
 
-        for path in sig_paths:
-            dir_name = os.path.dirname(path) or "."
-            dir_stats[dir_name]["total"] += 1
-            if path in mapped:
-                dir_stats[dir_name]["mapped"] += 1
+        if path:
+            source, target = path
+            try:
+                chain = self.dependency_path(source, target)
+            except KeyError as e:
+                print(f"{Colors.FAIL}❌ System '{e.args[0]}' not found.{Colors.ENDC}")
+                return
+            if chain is None:
+                print(f"{Colors.WARNING}⚠️  {source} does not depend on {target}, even indirectly.{Colors.ENDC}")
             else:
-                dir_stats[dir_name]["files"].append(path)
+                print(f"{Colors.BOLD}{len(chain) - 1} hop(s):{Colors.ENDC} {' → '.join(chain)}")
+            return
+
+        summary = self.graph_summary(top, samples)
+        print(f"\n{Colors.HEADER}=== 🕸️  DEPENDENCY GRAPH STATS ==={Colors.ENDC}")
+        print(f"Systems: {summary['systems']}  Edges: {summary['edges']}")
+        if summary["missing"]:
+            print(f"{Colors.WARNING}⚠️  Depended on but not defined: {', '.join(summary['missing'])}{Colors.ENDC}")
+
+        cycles = summary["cycles"]
+        if cycles:
+            print(f"\n{Colors.FAIL}🔁 Cycles ({len(cycles)}):{Colors.ENDC}")
+            for members in cycles[:top]:
+                print(f"  • {', '.join(members)}")
+        else:
+            print(f"{Colors.GREEN}✅ No dependency cycles.{Colors.ENDC}")
+
+        layers = summary["layers"]
+        print(f"\n{Colors.BOLD}Layers ({len(layers)}, dependencies first):{Colors.ENDC}")
+        for depth, members in enumerate(layers):
+            shown = ", ".join(members[:top]) + (f" (+{len(members) - top})" if len(members) > top else "")
+            print(f"  L{depth:<3} {shown}")
 
-        print(f"\n{Colors.HEADER}=== 📊 COVERAGE BY DIRECTORY ==={Colors.ENDC}")
-        for dir_name in sorted(dir_stats.keys()):
-            stat = dir_stats[dir_name]
-            pct = (stat["mapped"] / stat["total"] * 100) if stat["total"] > 0 else 0
+        for title, key in (
+            ("Most depended on (fan-in)", "fan_in"),
+            ("Most dependencies (fan-out)", "fan_out"),
+        ):
+            print(f"\n{Colors.BOLD}{title}:{Colors.ENDC}")
+            for name, degree in summary[key]:
+                print(f"  {name:<30} {degree}")
+
+        sampled = summary["betweenness_samples"]
+        label = f"estimated from {sampled} sources" if sampled else "exact"
+        print(f"\n{Colors.BOLD}Betweenness ({label}):{Colors.ENDC}")
+        for name, score in summary["betweenness"]:
+            print(f"  {name:<30} {score:.1f}")
+
+    def coverage_report(self, depth=None, min_files=1, rescan=False, top=10, rank="bytes"):
+        """([(directory, mapped, total)], [(file, bytes, lines, score)]) from
+        the coverage tree; see print_coverage_detail."""
+        from .dirtree import tree_of
+
+        snapshot = self.snapshot(rescan)
+        tree = tree_of(self.data, snapshot)
+        if tree.dirty:
+            tree.save(files_digest(self.data))
+
+        unmapped = []
+        if tree.unmapped:
+            from ..metrics.coverage import top_unmapped
+
+            unmapped = top_unmapped(snapshot, tree.unmapped, top, rank, tree)
+            if snapshot.dirty:
+                # Keep the line counts just read for the next report
+                snapshot.save()
+        return tree.rows(depth, min_files), unmapped
+
+    def print_coverage_detail(self, depth=None, min_files=1, rescan=False, top=10, rank="bytes"):
+        """Coverage per directory from the coverage tree (core.dirtree).
+
+        Answered from the last scan snapshot unless `rescan`; with `depth`,
+        subtree totals down to that many levels. Lists the `top` unmapped
+        files by `rank` (bytes, lines or priority).
+        """
+        if not self.data:
+            return
+
+        rows, unmapped = self.coverage_report(depth, min_files, rescan, top, rank)
+        title = "COVERAGE BY DIRECTORY" + (f" (depth {depth})" if depth is not None else "")
+        print(f"\n{Colors.HEADER}=== 📊 {title} ==={Colors.ENDC}")
+        for dir_name, mapped, total in rows:
+            pct = (mapped / total * 100) if total > 0 else 0
             bar_filled = int(pct / 10)
             bar = "█" * bar_filled + "░" * (10 - bar_filled)
 
@@ -533,47 +966,16 @@ class StateManager:
                 icon = "❌"
 
             print(
-                f"{icon} {dir_name:<30} [{bar}] {pct:>3.0f}% ({stat['mapped']}/{stat['total']})"
+                f"{icon} {dir_name:<30} [{bar}] {pct:>3.0f}% ({mapped}/{total})"
             )
 
-        all_unmapped = []
-        for stat in dir_stats.values():
-            all_unmapped.extend(stat["files"])
-
-        if all_unmapped:
-            print(f"\n{Colors.HEADER}=== 📄 TOP UNMAPPED FILES ==={Colors.ENDC}")
-            unmapped_with_size = []
-            for f in all_unmapped[:20]:
-                try:
-                    size = os.path.getsize(f)
-                    unmapped_with_size.append((f, size))
-                except OSError:
-                    pass
-
-            unmapped_with_size.sort(key=lambda x: x[1], reverse=True)
-            for i, (f, size) in enumerate(unmapped_with_size[:10], 1):
-                kb = size / 1024
-                print(f"  {i}. {f:<50} ({kb:.1f} KB)")
-
-    def validate_insight_quality(self, text):
-        errors = []
-        words = text.split()
+        if unmapped:
+            print(f"\n{Colors.HEADER}=== 📄 TOP UNMAPPED FILES (by {rank}) ==={Colors.ENDC}")
+            for i, (f, size, lines, score) in enumerate(unmapped, 1):
+                extra = f", priority {score:.1f}" if rank == "priority" else ""
+                print(f"  {i}. {f:<50} ({size / 1024:.1f} KB, {lines} lines{extra})")
 
-        if len(words) < MIN_WORD_COUNT:
-            errors.append(f"Too short ({len(words)} words, need 15+)")
-
-        action_verbs = ACTION_VERBS
-        has_action = any(verb in text.lower() for verb in action_verbs)
-        if not has_action:
-            errors.append("Missing [WHAT] - no clear action verb found")
-
-        impact_words = IMPACT_WORDS
-        text_lower = text.lower()
-        has_impact = any(
-            re.search(r"\b" + re.escape(word) + r"\b", text_lower)
-            for word in impact_words
-        )
-        if not has_impact:
-            errors.append("Missing [WHY/IMPACT] - no consequence or benefit stated")
+    def validate_insight_quality(self, text, strictness="standard"):
+        from ..metrics.insight_quality import check_insight
 
-        return errors
\ No newline at end of file
+        return check_insight(text, strictness)
@@ -0,0 +1,303 @@
+"""
+Append-only, columnar history of project metrics (SERIES_DIR).
+
+scan_stats and progress only hold the latest values. Here every stats update
+(and every session start/end) appends one row: coverage, quality, file and
+system counts, plus the completeness of each system. Each scalar column is
+its own binary file of fixed-width values, so a query reads only the columns
+it needs and never the main state.
+
+Per-system completeness is ragged and delta-encoded: a row stores only the
+systems whose value changed, as (system id, value) pairs in two columns,
+with `sys_end` marking where each row's pairs end. `sys_end` is written last
+and is the commit marker - a row exists once its `sys_end` entry does, and
+anything a crash left past that is truncated on the next append.
+"""
+import json
+import os
+import sys
+import time
+from array import array
+
+from .constants import SERIES_DIR
+
+# Row kinds
+STATS = 0
+SESSION_START = 1
+SESSION_END = 2
+
+# name -> typecode; sizes are the same on every platform CPython supports
+COLUMNS = {
+    "ts": "d",
+    "version": "q",
+    "session": "i",
+    "kind": "B",
+    "coverage": "d",
+    "quality": "d",
+    "significant": "q",
+    "mapped": "q",
+    "files": "q",
+    "systems": "i",
+    "complete": "i",
+    "overall": "d",
+    "insights": "q",
+}
+RAGGED = {"sys_id": "i", "sys_value": "B"}
+COMMIT = ("sys_end", "q")
+
+# Gate B: a session is low-yield below these
+LOW_YIELD_SYSTEMS = 1
+LOW_YIELD_FILES = 3
+
+
+def _file(path, name):
+    return os.path.join(path, name + ".col")
+
+
+def _read(path, name, code, count=None):
+    values = array(code)
+    filename = _file(path, name)
+    if not os.path.exists(filename):
+        return values
+    size = os.path.getsize(filename) // values.itemsize
+    if count is not None:
+        size = min(size, count)
+    with open(filename, "rb") as f:
+        values.fromfile(f, size)
+    if _swapped(path):
+        values.byteswap()
+    return values
+
+
+def _swapped(path):
+    meta = os.path.join(path, "meta.json")
+    if not os.path.exists(meta):
+        return False
+    with open(meta, "r") as f:
+        return json.load(f).get("byteorder", sys.byteorder) != sys.byteorder
+
+
+def _truncate(path, name, code, count):
+    filename = _file(path, name)
+    if not os.path.exists(filename):
+        return
+    size = count * array(code).itemsize
+    if os.path.getsize(filename) > size:
+        with open(filename, "r+b") as f:
+            f.truncate(size)
+
+
+def _append(path, name, code, values):
+    with open(_file(path, name), "ab") as f:
+        array(code, values).tofile(f)
+
+
+def snapshot(data, kind=STATS):
+    """(scalar row, {system: completeness}) for the current state."""
+    from .index import index_of
+
+    meta = data.get("metadata", {})
+    stats = meta.get("scan_stats", {})
+    prog = data.get("progress", {})
+    systems = data.get("systems", {})
+    row = {
+        "ts": time.time(),
+        "version": meta.get("state_version", 0),
+        "session": meta.get("total_sessions", 0),
+        "kind": kind,
+        "coverage": stats.get("coverage_percentage", 0.0),
+        "quality": stats.get("coverage_quality", 0.0),
+        "significant": stats.get("significant_files_total", 0),
+        "mapped": stats.get("mapped_files_count", 0),
+        "files": len(index_of(data).owners),
+        "systems": len(systems),
+        "complete": prog.get("systems_complete", 0),
+        "overall": float(prog.get("estimated_overall_completeness", 0)),
+        "insights": sum(len(s.get("insights", ())) for s in systems.values()),
+    }
+    completeness = {name: s.get("completeness", 0) for name, s in systems.items()}
+    return row, completeness
+
+
+class _Head:
+    """Names dictionary and latest per-system values, for delta encoding.
+
+    Cached in head.json; rebuilt from the columns if missing or stale.
+    """
+
+    def __init__(self, path, rows):
+        self.path = path
+        head = os.path.join(path, "head.json")
+        raw = None
+        if os.path.exists(head):
+            try:
+                with open(head, "r") as f:
+                    raw = json.load(f)
+            except json.JSONDecodeError:
+                raw = None
+        if raw is None or raw.get("rows") != rows:
+            raw = self._rebuild(rows)
+        self.names = raw["names"]
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.last = {int(k): v for k, v in raw["last"].items()}
+
+    def _rebuild(self, rows):
+        names = []
+        names_file = os.path.join(self.path, "names.txt")
+        if os.path.exists(names_file):
+            with open(names_file, "r") as f:
+                names = f.read().splitlines()
+        ends = _read(self.path, *COMMIT, count=rows)
+        count = ends[-1] if ends else 0
+        last = dict(
+            zip(
+                _read(self.path, "sys_id", RAGGED["sys_id"], count),
+                _read(self.path, "sys_value", RAGGED["sys_value"], count),
+            )
+        )
+        return {"rows": rows, "names": names, "last": last}
+
+    def id_of(self, name):
+        if name not in self.ids:
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+            with open(os.path.join(self.path, "names.txt"), "a") as f:
+                f.write(name + "\n")
+        return self.ids[name]
+
+    def save(self, rows):
+        head = os.path.join(self.path, "head.json")
+        temp = head + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"rows": rows, "names": self.names, "last": self.last}, f)
+        os.replace(temp, head)
+
+
+def _committed(path):
+    """(rows, ragged entries) that are fully written."""
+    ends = _read(path, *COMMIT)
+    return len(ends), (ends[-1] if ends else 0)
+
+
+def append(data, kind=STATS, path=SERIES_DIR):
+    """Append the state's current metrics as one row. Call under the lock."""
+    os.makedirs(path, exist_ok=True)
+    meta = os.path.join(path, "meta.json")
+    if not os.path.exists(meta):
+        with open(meta, "w") as f:
+            json.dump({"byteorder": sys.byteorder, "columns": {**COLUMNS, **RAGGED}}, f)
+
+    rows, entries = _committed(path)
+    # Drop whatever an interrupted append left behind
+    for name, code in COLUMNS.items():
+        _truncate(path, name, code, rows)
+    for name, code in RAGGED.items():
+        _truncate(path, name, code, entries)
+
+    row, completeness = snapshot(data, kind)
+    head = _Head(path, rows)
+    changed = []
+    for name, value in completeness.items():
+        sid = head.id_of(name)
+        value = max(0, min(int(value), 255))
+        if head.last.get(sid) != value:
+            changed.append((sid, value))
+            head.last[sid] = value
+
+    _append(path, "sys_id", RAGGED["sys_id"], [sid for sid, _ in changed])
+    _append(path, "sys_value", RAGGED["sys_value"], [v for _, v in changed])
+    for name, code in COLUMNS.items():
+        _append(path, name, code, [row[name]])
+    _append(path, *COMMIT, [entries + len(changed)])
+    head.save(rows + 1)
+
+
+class Series:
+    """Read-only view over the committed rows; columns load on demand."""
+
+    def __init__(self, path=SERIES_DIR):
+        self.path = path
+        self.rows, self.entries = _committed(path)
+        self._columns = {}
+
+    def __len__(self):
+        return self.rows
+
+    def column(self, name):
+        if name not in self._columns:
+            if name in COLUMNS:
+                self._columns[name] = _read(self.path, name, COLUMNS[name], self.rows)
+            elif name in RAGGED:
+                self._columns[name] = _read(self.path, name, RAGGED[name], self.entries)
+            else:
+                raise KeyError(f"Unknown series column '{name}' (choose from {', '.join(COLUMNS)})")
+        return self._columns[name]
+
+    def trend(self, field, last=None):
+        """[(timestamp, value)] for the last `last` rows (all by default)."""
+        start = 0 if last is None else max(0, self.rows - last)
+        ts, values = self.column("ts"), self.column(field)
+        return [(ts[i], values[i]) for i in range(start, self.rows)]
+
+    def sessions(self):
+        """[(session, start row, end row)] for sessions recorded end to end."""
+        kinds, ids = self.column("kind"), self.column("session")
+        spans, opened = [], {}
+        for i in range(self.rows):
+            if kinds[i] == SESSION_START:
+                opened[ids[i]] = i
+            elif kinds[i] == SESSION_END and ids[i] in opened:
+                spans.append((ids[i], opened.pop(ids[i]), i))
+        return spans
+
+    def session_deltas(self, field, sessions=None):
+        """[(session, change in `field`)] per recorded session, oldest first."""
+        values = self.column(field)
+        spans = self.sessions()
+        if sessions is not None:
+            spans = spans[-sessions:] if sessions else []
+        return [(sid, values[end] - values[start]) for sid, start, end in spans]
+
+    def velocity(self, field="coverage", sessions=5):
+        """Mean change in `field` per session over the last `sessions`."""
+        deltas = self.session_deltas(field, sessions)
+        if not deltas:
+            return None
+        return sum(d for _, d in deltas) / len(deltas)
+
+    def low_yield_streak(self):
+        """Trailing run of recorded sessions that added < LOW_YIELD_SYSTEMS
+        systems and < LOW_YIELD_FILES files. None if no session is recorded."""
+        spans = self.sessions()
+        if not spans:
+            return None
+        systems, files = self.column("systems"), self.column("files")
+        streak = 0
+        for _, start, end in reversed(spans):
+            if (
+                systems[end] - systems[start] >= LOW_YIELD_SYSTEMS
+                or files[end] - files[start] >= LOW_YIELD_FILES
+            ):
+                break
+            streak += 1
+        return streak
+
+    def system_history(self, name):
+        """[(timestamp, completeness)] at each row where `name` changed."""
+        names_file = os.path.join(self.path, "names.txt")
+        if not os.path.exists(names_file):
+            return []
+        with open(names_file, "r") as f:
+            names = f.read().splitlines()
+        if name not in names:
+            return []
+        sid = names.index(name)
+        ids, values = self.column("sys_id"), self.column("sys_value")
+        ends, ts = _read(self.path, *COMMIT, count=self.rows), self.column("ts")
+        out, start = [], 0
+        for row, end in enumerate(ends):
+            for i in range(start, end):
+                if ids[i] == sid:
+                    out.append((ts[row], values[i]))
+            start = end
+        return out
@@ -0,0 +1,93 @@
+"""
+Per-system schema checks, cached between runs.
+
+A system's result depends only on its own fields and on whether its
+dependency targets exist, so results are kept in the change log (see
+core.changes) and a run only rechecks systems changed since the last one,
+plus any whose missing dependency target has since appeared.
+"""
+from .changes import VALIDATE, ChangeLog, unsaved
+from .models import State
+
+
+def system_errors(name, sys, systems):
+    """{"errors": [...], "missing": [dependency targets not in systems]}."""
+    errors = []
+    if not sys.get("description") or sys["description"] == "TODO":
+        errors.append(f"{name}: Missing or placeholder description")
+    if not sys.get("key_files"):
+        errors.append(f"{name}: No key_files listed")
+    if not sys.get("insights"):
+        errors.append(f"{name}: No insights recorded")
+
+    insight_count = len(sys.get("insights", []))
+    completeness = sys.get("completeness", 0)
+
+    if completeness >= 50 and insight_count < 3:
+        errors.append(
+            f"{name}: {completeness}% complete but only {insight_count} insights "
+            f"(need 3+ for 50%+ completeness)"
+        )
+
+    if completeness >= 80 and insight_count < 5:
+        errors.append(
+            f"{name}: {completeness}% complete but only {insight_count} insights "
+            f"(need 5+ for 80%+ completeness)"
+        )
+
+    missing = [
+        dep["system"] for dep in sys.get("dependencies", []) if dep["system"] not in systems
+    ]
+    return {"errors": errors, "missing": missing}
+
+
+def validate_systems(data, log=None, full=False):
+    """(results by system, number of systems actually checked).
+
+    With a ChangeLog, cached results are reused for systems unchanged since
+    its validate checkpoint; the caller persists the log afterwards.
+    """
+    systems = data.get("systems", {})
+    pending = None
+    if log is not None and not full:
+        pending = log.since(VALIDATE)
+    if pending is not None:
+        pending |= unsaved(data)
+
+    results = {}
+    checked = 0
+    for name, sys in systems.items():
+        cached = None
+        if pending is not None and name not in pending:
+            cached = log.results.get(name)
+        if cached is not None and not any(t in systems for t in cached["missing"]):
+            results[name] = cached
+            continue
+        results[name] = system_errors(name, sys, systems)
+        checked += 1
+    return results, checked
+
+
+def cacheable(data):
+    """Only saved, hydrated states can be tracked by the change log."""
+    return (
+        isinstance(data, State)
+        and not data.dirty
+        and data.get("metadata", {}).get("state_version") is not None
+    )
+
+
+def load_log(data):
+    return ChangeLog.load() if cacheable(data) else None
+
+
+def field_errors(results):
+    return [e for r in results.values() for e in r["errors"]]
+
+
+def dangling(results):
+    return [
+        f"{name}: References non-existent system '{target}'"
+        for name, r in results.items()
+        for target in r["missing"]
+    ]
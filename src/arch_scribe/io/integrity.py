@@ -0,0 +1,252 @@
+"""
+Checksummed serialization of the state file, and salvage of damaged ones.
+
+The file is the usual indent=2 JSON with one extra, last member:
+
+      ...,
+      "integrity": {"algorithm": "blake2b-128", "content": "...", "systems": {...}}
+    }
+
+`content` hashes the text before that line (i.e. the document without
+`integrity`, exactly as json.dumps(indent=2) writes it), so verifying a load
+costs one hash over the bytes, no re-serialization. `systems` holds a
+checksum per system, over the system's own serialized text, which is what
+salvage uses to tell intact systems from damaged ones.
+
+A file that parses but fails its checksums was edited by hand, not torn:
+adopt() keeps its content, and only a file that doesn't parse is salvaged.
+"""
+import copy
+import hashlib
+import io
+import json
+import os
+
+from ..core import progress
+from ..core.constants import DEFAULT_STATE
+from ..core.models import to_json
+
+ALGORITHM = "blake2b-128"
+_MARKER = '\n  "integrity": '
+
+
+class ChecksumMismatch(json.JSONDecodeError):
+    """The state parsed, but doesn't match its checksums.
+
+    `data` is the parsed document, `damaged` the systems whose checksum
+    failed.
+    """
+
+    def __init__(self, doc, data, damaged):
+        super().__init__("State checksum mismatch", doc, 0)
+        self.data = data
+        self.damaged = damaged
+
+
+def digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _indented(value, depth):
+    """json.dumps(indent=2) for a value nested `depth` levels deep."""
+    return json.dumps(value, indent=2, default=to_json).replace("\n", "\n" + "  " * depth)
+
+
+def dumps(data):
+    """Serialize like json.dumps(data, indent=2), plus the integrity header."""
+    members = []
+    sums = {}
+    for key, value in data.items():
+        if key == "integrity":
+            continue
+        if key == "systems" and isinstance(value, dict) and value:
+            parts = []
+            for name, sys in value.items():
+                text = _indented(sys, 2)
+                sums[name] = digest(text)
+                parts.append("\n    " + json.dumps(name) + ": " + text)
+            text = "{" + ",".join(parts) + "\n  }"
+        else:
+            text = _indented(value, 1)
+        members.append("\n  " + json.dumps(key) + ": " + text)
+    if not members:
+        return "{}"
+    body = "{" + ",".join(members) + "\n}"
+    header = {"algorithm": ALGORITHM, "content": digest(body), "systems": sums}
+    return body[:-2] + "," + _MARKER + json.dumps(header, separators=(",", ":")) + "\n}"
+
+
+def _split(text):
+    """(header, body) for a checksummed text, (None, text) otherwise."""
+    start = text.rfind(_MARKER)
+    if start < 0 or not text.endswith("\n}") or text[start - 1] != ",":
+        return None, text
+    try:
+        header = json.loads(text[start + len(_MARKER):-2])
+    except json.JSONDecodeError:
+        return None, text
+    if not isinstance(header, dict) or header.get("algorithm") != ALGORITHM:
+        return None, text
+    return header, text[: start - 1] + "\n}"
+
+
+def loads(text):
+    """Parse a state text, verifying its checksums if it has them.
+
+    Raises json.JSONDecodeError if it doesn't parse, ChecksumMismatch if it
+    parses but was altered.
+    """
+    header, body = _split(text)
+    if header is None:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data.pop("integrity", None)
+        return data
+    if digest(body) == header.get("content"):
+        return json.loads(body)
+
+    data = json.loads(body)
+    sums = header.get("systems", {})
+    damaged = [
+        name
+        for name, sys in data.get("systems", {}).items()
+        if sums.get(name) != digest(_indented(sys, 2))
+    ]
+    raise ChecksumMismatch(text, data, damaged)
+
+
+def _forget_derived(data):
+    """Drop what the state keeps to avoid recomputing it from its content:
+    the running progress totals are recomputed, the sidecar stamps are
+    dropped so they are taken afresh."""
+    data.totals = progress.recompute(data["systems"])
+    progress.publish(data, data.totals)
+    data["metadata"].pop("insights_digest", None)
+    data["metadata"].pop("files_digest", None)
+
+
+def adopt(data):
+    """A state that parsed but failed its checksums (ChecksumMismatch.data),
+    taken as it is: the edits are the newest content."""
+    from ..core import models
+    from . import migrations
+
+    migrations.migrate(data)
+    data = models.hydrate(data)
+    _forget_derived(data)
+    return data
+
+
+# --- salvage ---
+def _partial(text):
+    """Whatever parses from a damaged state text.
+
+    Returns (members, systems, header): top-level values that decoded, every
+    system decoded before the damage, and the integrity header if readable.
+    """
+    from .migrations import _Reader
+
+    header, body = _split(text)
+    members, systems = {}, {}
+    reader = _Reader(io.StringIO(body))
+    try:
+        for key in reader.members():
+            if key == "systems" and reader.peek() == "{":
+                for name in reader.members():
+                    systems[name] = reader.value()
+            else:
+                members[key] = reader.value()
+    except json.JSONDecodeError:
+        pass
+    return members, systems, header
+
+
+def _read(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return loads(f.read())
+    except ChecksumMismatch as e:
+        return e.data
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def salvage(path, backup_path, journal_path=None):
+    """Rebuild a state from a damaged file, its backup and the journal.
+
+    Base is the backup (or a blank state); journal entries newer than it are
+    replayed on top; then every system from the damaged file that still
+    parses and matches its checksum overrides the rebuilt one, as it is the
+    most recent copy. Returns (data, report) or (None, None) if nothing
+    could be recovered.
+    """
+    from ..core import models
+    from . import journal, migrations
+
+    with open(path, "r", errors="replace") as f:
+        members, systems, header = _partial(f.read())
+    sums = (header or {}).get("systems")
+
+    intact, damaged = {}, {}
+    for name, sys in systems.items():
+        if not isinstance(sys, dict):
+            continue
+        if sums is None or sums.get(name) == digest(_indented(sys, 2)):
+            intact[name] = sys
+        else:
+            damaged[name] = sys
+
+    base = _read(backup_path)
+    if base is None and not members and not intact:
+        return None, None
+
+    data = base if base is not None else copy.deepcopy(DEFAULT_STATE)
+    migrations.migrate(data)
+    data = models.hydrate(data)
+    base_version = data["metadata"].get("state_version", 0) if base is not None else -1
+    kwargs = {"path": journal_path} if journal_path else {}
+    entries = journal.entries(base_version, **kwargs)
+    replayed = journal.replay(data, entries)
+
+    # What survived in the damaged file is the newest copy; bring it up to
+    # the current schema the same way a load would.
+    has_meta = isinstance(members.get("metadata"), dict)
+    current = dict(members)
+    current.setdefault("schema_version", data.get("schema_version"))
+    current["systems"] = dict(intact)
+    # A system whose checksum fails but which exists nowhere else is kept,
+    # unverified, rather than dropped.
+    unverified = [n for n in damaged if n not in data["systems"]]
+    for name in unverified:
+        current["systems"][name] = damaged[name]
+    migrations.migrate(current)
+
+    if has_meta:
+        meta = current["metadata"]
+        if meta.get("state_version", 0) >= data["metadata"].get("state_version", 0):
+            data["metadata"] = meta
+    if entries:
+        meta = data["metadata"]
+        meta["state_version"] = max(meta.get("state_version", 0), entries[-1]["v"])
+    for name, sys in current["systems"].items():
+        data["systems"][name] = sys
+
+    data = models.hydrate(data)
+    data.index = None
+    data.minhash = None
+    data.dirtree = None
+    # Progress and the sidecar stamps may come from a different copy than
+    # the systems
+    _forget_derived(data)
+
+    report = {
+        "from_file": len(intact),
+        "rebuilt": len(data["systems"]) - len(current["systems"]),
+        "replayed": replayed,
+        "damaged": sorted(damaged),
+        "unverified": sorted(unverified),
+        "systems": len(data["systems"]),
+    }
+    return data, report
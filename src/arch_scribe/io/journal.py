@@ -0,0 +1,102 @@
+"""
+On-disk operation journal (.arch_scribe/journal.jsonl).
+
+Every save appends the operations it committed, tagged with the state
+version they produced, before the state file itself is written. If the
+state file is later found damaged, the backup plus the journal entries newer
+than it rebuild what was lost (see io.integrity.salvage).
+
+Only the pure, replayable mutations are journaled; stats refreshes are
+derived data and are recomputed instead.
+"""
+import json
+import os
+
+from ..core.constants import JOURNAL_FILE
+
+# Trim to the newer half once the file grows past this
+JOURNAL_MAX_BYTES = 1 << 20
+
+_registry = None
+
+
+def op_name(op):
+    return f"{op.__module__.rsplit('.', 1)[-1]}.{op.__name__}"
+
+
+def replayable():
+    """{name: function} for operations that can be journaled."""
+    global _registry
+    if _registry is None:
+        from ..core import session
+        from ..operations import dependency_ops, insight_ops, system_ops
+
+        ops = [
+            system_ops.add_system,
+            system_ops.update_system,
+            system_ops.map_files,
+            insight_ops.add_insight,
+            dependency_ops.add_dependency,
+            session.open_session,
+            session.close_session,
+        ]
+        _registry = {op_name(op): op for op in ops}
+    return _registry
+
+
+def append(version, ops, path=JOURNAL_FILE):
+    """Record the (op, args) pairs committed as `version`. Call under the lock."""
+    known = replayable()
+    lines = [
+        json.dumps({"v": version, "op": op_name(op), "args": list(args)})
+        for op, args in ops
+        if op_name(op) in known
+    ]
+    if not lines:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a") as f:
+        f.write("\n".join(lines) + "\n")
+    if os.path.getsize(path) > JOURNAL_MAX_BYTES:
+        _trim(path)
+
+
+def _trim(path):
+    with open(path, "r") as f:
+        lines = f.readlines()
+    temp = path + ".tmp"
+    with open(temp, "w") as f:
+        f.writelines(lines[len(lines) // 2:])
+    os.replace(temp, path)
+
+
+def entries(since, path=JOURNAL_FILE):
+    """Journal entries for versions after `since`, oldest first.
+
+    Unreadable lines (e.g. a torn final append) are skipped.
+    """
+    if not os.path.exists(path):
+        return []
+    out = []
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("v", 0) > since:
+                out.append(entry)
+    return out
+
+
+def replay(data, entries):
+    """Apply journal entries to a hydrated state. Returns how many ran."""
+    ops = replayable()
+    count = 0
+    for entry in entries:
+        op = ops.get(entry.get("op"))
+        if op is None:
+            continue
+        op(data, *entry.get("args", []))
+        count += 1
+    return count
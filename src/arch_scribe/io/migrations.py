@@ -0,0 +1,298 @@
+"""
+Schema migrations for architecture.json.
+
+Each Migration upgrades one schema version to the next. A step has a
+document part (everything except `systems`) and a per-system part. The file
+migration streams: systems are read, upgraded and written one at a time, so
+a large state is never held in memory as several full copies. The original
+file is kept under MIGRATION_BACKUP_DIR before it is replaced.
+
+Steps only fill in what is missing or normalize shapes, so running them on
+an already-migrated state changes nothing.
+"""
+import json
+import os
+import re
+import shutil
+import tempfile
+
+from ..core.constants import (
+    DEFAULT_STATE,
+    MIGRATION_BACKUP_DIR,
+    SCHEMA_VERSION,
+    STATE_FILE,
+)
+from ..core.models import System
+from .integrity import _indented
+
+_HEAD_BYTES = 4096
+_VERSION_RE = re.compile(r'"schema_version"\s*:\s*"([^"\\]*)"')
+
+
+class Migration:
+    __slots__ = ("source", "target", "document", "system")
+
+    def __init__(self, source, target, document=None, system=None):
+        self.source = source
+        self.target = target
+        self.document = document
+        self.system = system
+
+
+# --- steps ---
+def _stamp_legacy(doc):
+    """Files written before schema_version existed: same layout as 2.2."""
+    doc.setdefault("metadata", {})
+    doc.setdefault("systems", {})
+    doc.setdefault("progress", {})
+
+
+def _fill_metadata(doc):
+    """2.3 adds the concurrency counters; 2.2 files may lack whole sections."""
+    meta = doc.setdefault("metadata", {})
+    for key, default in DEFAULT_STATE["metadata"].items():
+        if key == "scan_stats":
+            stats = meta.get("scan_stats")
+            if not isinstance(stats, dict):
+                stats = meta["scan_stats"] = {}
+            for field, value in default.items():
+                stats.setdefault(field, value)
+        elif key not in meta:
+            meta[key] = [] if isinstance(default, list) else default
+    doc.setdefault("systems", {})
+    prog = doc.setdefault("progress", {})
+    for field, value in DEFAULT_STATE["progress"].items():
+        prog.setdefault(field, value)
+
+
+def _fill_system(name, sys):
+    for field in System.FIELDS:
+        if field not in sys:
+            default = System.DEFAULTS[field]
+            sys[field] = default() if callable(default) else default
+    # Older versions could map the same file twice
+    sys["key_files"] = list(dict.fromkeys(sys["key_files"]))
+    sys["dependencies"] = [
+        {"system": d, "reason": ""} if isinstance(d, str) else d
+        for d in sys["dependencies"]
+    ]
+    return sys
+
+
+MIGRATIONS = [
+    Migration(None, "2.2", document=_stamp_legacy),
+    Migration("2.2", "2.3", document=_fill_metadata, system=_fill_system),
+]
+_BY_SOURCE = {m.source: m for m in MIGRATIONS}
+
+
+def plan(version):
+    """Steps taking `version` to SCHEMA_VERSION; [] if current or unknown."""
+    steps = []
+    while version != SCHEMA_VERSION and version in _BY_SOURCE:
+        step = _BY_SOURCE[version]
+        steps.append(step)
+        version = step.target
+    if version != SCHEMA_VERSION:
+        return []  # written by a newer (or unrecognized) version; leave it
+    return steps
+
+
+def _run(steps, doc):
+    for step in steps:
+        if step.document:
+            step.document(doc)
+        doc["schema_version"] = step.target
+
+
+def _run_system(steps, name, sys):
+    for step in steps:
+        if step.system and isinstance(sys, dict):
+            sys = step.system(name, sys)
+    return sys
+
+
+def migrate(data):
+    """Upgrade an in-memory state dict in place. Returns the steps applied."""
+    steps = plan(data.get("schema_version"))
+    if not steps:
+        return steps
+    data.pop("integrity", None)
+    systems = data.get("systems")
+    if isinstance(systems, dict):
+        for name, sys in systems.items():
+            systems[name] = _run_system(steps, name, sys)
+    _run(steps, data)
+    return steps
+
+
+# --- streaming ---
+_decoder = json.JSONDecoder()
+_WS = re.compile(r"[ \t\n\r]*")
+
+
+class _Reader:
+    """Incremental reader over a JSON text, one value at a time."""
+
+    def __init__(self, f, chunk=1 << 16):
+        self.f = f
+        self.chunk = chunk
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        if self.eof:
+            return False
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        data = self.f.read(max(self.chunk, len(self.buf)))
+        if not data:
+            self.eof = True
+            return False
+        self.buf += data
+        return True
+
+    def _error(self, msg):
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+    def peek(self):
+        while True:
+            self.pos = _WS.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch):
+        if self.peek() != ch:
+            raise self._error(f"Expecting '{ch}'")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def members(self):
+        """Yield the keys of an object; the caller consumes each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self._error("Expecting property name enclosed in double quotes")
+            key = self.value()
+            self.expect(":")
+            yield key
+            ch = self.peek()
+            self.pos += 1
+            if ch == "}":
+                return
+            if ch != ",":
+                self.pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def end(self):
+        if self.peek() != "":
+            raise self._error("Extra data")
+
+
+def detect_version(path=STATE_FILE):
+    """schema_version of a state file, reading as little of it as possible."""
+    with open(path, "r") as f:
+        head = f.read(_HEAD_BYTES)
+    match = _VERSION_RE.search(head)
+    if match:
+        return match.group(1)
+
+    # Not near the top: walk the top level, a system at a time
+    with open(path, "r") as f:
+        reader = _Reader(f)
+        version = None
+        for key in reader.members():
+            if key == "systems" and reader.peek() == "{":
+                for _ in reader.members():
+                    reader.value()
+            else:
+                value = reader.value()
+                if key == "schema_version":
+                    version = value
+        return version
+
+
+_STREAMED = object()
+
+
+def migrate_file(path=STATE_FILE, backup_dir=MIGRATION_BACKUP_DIR):
+    """Upgrade a state file in place, streaming its systems.
+
+    Returns (old_version, new_version), or None if nothing needed doing.
+    Raises json.JSONDecodeError for a malformed file. Call under the state
+    lock; the result replaces `path` atomically.
+    """
+    version = detect_version(path)
+    steps = plan(version)
+    if not steps:
+        return None
+
+    directory = os.path.dirname(os.path.abspath(path))
+    shell = {}
+    with open(path, "r") as f, tempfile.TemporaryFile("w+", dir=directory) as spool:
+        reader = _Reader(f)
+        count = 0
+        for key in reader.members():
+            if key == "systems" and reader.peek() == "{":
+                shell[key] = _STREAMED
+                for name in reader.members():
+                    sys = _run_system(steps, name, reader.value())
+                    spool.write(
+                        ("," if count else "")
+                        + "\n    "
+                        + json.dumps(name)
+                        + ": "
+                        + _indented(sys, 2)
+                    )
+                    count += 1
+            else:
+                shell[key] = reader.value()
+        reader.end()
+
+        # Checksums describe the old text; the next save writes new ones
+        shell.pop("integrity", None)
+        _run(steps, shell)
+        # schema_version first, as in freshly initialized files
+        shell = {"schema_version": shell.pop("schema_version"), **shell}
+
+        temp = path + ".migrating"
+        with open(temp, "w") as out:
+            out.write("{")
+            for i, (key, value) in enumerate(shell.items()):
+                out.write(("," if i else "") + "\n  " + json.dumps(key) + ": ")
+                if value is _STREAMED:
+                    out.write("{")
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, out)
+                    out.write("\n  }" if count else "}")
+                else:
+                    out.write(_indented(value, 1))
+            out.write("\n}" if shell else "}")
+
+    os.makedirs(backup_dir, exist_ok=True)
+    name = os.path.basename(path)
+    stem, ext = os.path.splitext(name)
+    shutil.copy2(path, os.path.join(backup_dir, f"{stem}.v{version or 'legacy'}{ext}"))
+    os.replace(temp, path)
+    return version, SCHEMA_VERSION
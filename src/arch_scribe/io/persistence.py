@@ -1 +1,80 @@
-# persistence.py - placeholder
+import json
+import os
+import time
+from contextlib import contextmanager
+
+from ..core.constants import STATE_FILE, BACKUP_FILE, LOCK_FILE
+from . import integrity
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def state_lock(path=LOCK_FILE):
+    """Advisory, exclusive lock serializing writers of the state file.
+
+    Readers don't take it: os.replace() keeps the state file whole.
+    """
+    with open(path, "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10s of contention; keep waiting
+                    time.sleep(0.05)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def state_version(data):
+    """Optimistic-concurrency version stored in the state (0 if absent)."""
+    if not data:
+        return 0
+    return data.get("metadata", {}).get("state_version", 0)
+
+
+def read_state(path=STATE_FILE):
+    """Load and checksum-verify a state file.
+
+    Raises json.JSONDecodeError (or its subclass integrity.ChecksumMismatch).
+    """
+    with open(path, "r") as f:
+        return integrity.loads(f.read())
+
+
+def read_version(path=STATE_FILE):
+    """Version of the state currently on disk, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return state_version(read_state(path))
+    except json.JSONDecodeError:
+        return None
+
+
+def write_state(data, path=STATE_FILE, backup=BACKUP_FILE):
+    """Atomic write: back up the current file, write a temp file, rename."""
+    if os.path.exists(path):
+        import shutil
+
+        shutil.copy(path, backup)
+    temp = path + ".tmp"
+    with open(temp, "w") as f:
+        f.write(integrity.dumps(data))
+    os.replace(temp, path)
@@ -0,0 +1,142 @@
+"""
+Bulk insight audit: re-score every insight against the current quality rules.
+
+Records come from the state (every system's insights) or from an external
+JSONL corpus. Validation is a pure function of the text, so it can be spread
+over a process pool; results are returned in input order, which makes a
+pooled run identical to a serial one. Outcomes already in the quality_rules
+cache are not rescored; only the misses go to the pool. An external corpus
+is audited against a cache of its own, so it never touches the project's.
+"""
+import json
+import functools
+import os
+from collections import Counter
+
+from .insight_quality import insight_codes
+
+UNREADABLE = "unreadable"
+UNASSIGNED = "(unassigned)"
+
+# Below this many records a pool costs more than it saves
+MIN_POOL_RECORDS = 500
+
+
+def from_state(data):
+    """Audit records for every insight in the state, in state order."""
+    return [
+        {"system": name, "id": f"{name}#{i}", "text": text}
+        for name, s in data.get("systems", {}).items()
+        for i, text in enumerate(s.get("insights", []))
+    ]
+
+
+def from_jsonl(path):
+    """Audit records from a JSONL corpus.
+
+    Each line is an object with "text" and optionally "system" and "id", or
+    a bare JSON string. Lines that can't be read become records with the
+    `unreadable` code instead of aborting the audit.
+    """
+    records = []
+    with open(path, "r") as f:
+        for n, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError:
+                raw = None
+            if isinstance(raw, str):
+                raw = {"text": raw}
+            if not isinstance(raw, dict) or not isinstance(raw.get("text"), str):
+                records.append({"system": UNASSIGNED, "id": f"line {n}", "text": None})
+                continue
+            records.append(
+                {
+                    "system": raw.get("system") or UNASSIGNED,
+                    "id": str(raw.get("id", f"line {n}")),
+                    "text": raw["text"],
+                }
+            )
+    return records
+
+
+def _score(texts, level="standard"):
+    return [insight_codes(t, level) if t is not None else [UNREADABLE] for t in texts]
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def score(records, workers=1, level="standard", store=None):
+    """Error codes per record, in input order.
+
+    workers=1 runs serially; workers=0 means one per CPU. Small inputs are
+    always scored serially. `store` is the OutcomeCache to consult and fill;
+    the process-wide one by default.
+    """
+    from .quality_rules import OutcomeCache, cache
+
+    if store is None:
+        store = cache()
+    codes = [None] * len(records)
+    keys = {}
+    for i, r in enumerate(records):
+        if r["text"] is None:
+            codes[i] = [UNREADABLE]
+            continue
+        key = OutcomeCache.key(r["text"], level)
+        found = store.get(key)
+        if found is not None:
+            codes[i] = list(found)
+        else:
+            keys[i] = key
+
+    misses = list(keys)
+    texts = [records[i]["text"] for i in misses]
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(texts) < MIN_POOL_RECORDS:
+        scored = _score(texts, level)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # A few chunks per worker keeps them busy without per-item IPC
+        size = max(1, -(-len(texts) // (workers * 4)))
+        scored = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(functools.partial(_score, level=level), _chunks(texts, size)):
+                scored.extend(part)
+
+    for i, found in zip(misses, scored):
+        store.put(keys[i], found)
+        codes[i] = list(found)
+    return codes
+
+
+def audit(records, workers=1, level="standard", store=None):
+    """[{"system", "id", "codes"}] per record, in input order."""
+    return [
+        {"system": r["system"], "id": r["id"], "codes": codes}
+        for r, codes in zip(records, score(records, workers, level, store))
+    ]
+
+
+def summarize(results):
+    """Per-system quality summary: counts, pass rate and code frequencies."""
+    systems = {}
+    for result in results:
+        s = systems.setdefault(
+            result["system"], {"insights": 0, "passed": 0, "codes": Counter()}
+        )
+        s["insights"] += 1
+        if not result["codes"]:
+            s["passed"] += 1
+        s["codes"].update(result["codes"])
+    for s in systems.values():
+        s["pass_rate"] = round(s["passed"] / s["insights"] * 100, 1)
+        s["codes"] = dict(sorted(s["codes"].items()))
+    return dict(sorted(systems.items()))
@@ -0,0 +1,121 @@
+"""
+Clarity and completeness for every system in one pass.
+
+Both scores depend only on (key file count, insight count, has dependencies),
+and only up to FILE_TARGET files and INSIGHT_TARGET insights - past those the
+points are capped. So there are just (FILE_TARGET + 1) x (INSIGHT_TARGET + 1)
+x 2 distinct outcomes. They are tabulated once with the scalar formulas, and
+a batch is scored by clamping the count columns into a table index: a
+handful of array operations with NumPy, one list comprehension without it.
+Results are exactly those of compute_clarity/compute_completeness.
+"""
+import functools
+from array import array
+
+from .clarity import clarity_level
+from .completeness import CLARITY_BONUS, FILE_TARGET, INSIGHT_TARGET, base_completeness
+
+CLARITY_LEVELS = ("low", "medium", "high")
+
+_DEP_STRIDE = 2
+_INSIGHT_STRIDE = _DEP_STRIDE * (INSIGHT_TARGET + 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@functools.lru_cache(maxsize=None)
+def _table():
+    """(clarity codes, completeness) per clamped (files, insights, deps)."""
+    clarity, completeness = [], []
+    for files in range(FILE_TARGET + 1):
+        for insights in range(INSIGHT_TARGET + 1):
+            for deps in (False, True):
+                base = base_completeness(files, insights, deps)
+                level = clarity_level(insights, int(base), deps)
+                clarity.append(CLARITY_LEVELS.index(level))
+                completeness.append(int(min(base + CLARITY_BONUS[level], 100)))
+    return clarity, completeness
+
+
+def _slot(files, insights, deps):
+    return (
+        min(files, FILE_TARGET) * _INSIGHT_STRIDE
+        + min(insights, INSIGHT_TARGET) * _DEP_STRIDE
+        + (1 if deps else 0)
+    )
+
+
+def score(files, insights, deps):
+    """(clarity, completeness) for one system's counts."""
+    clarity, completeness = _table()
+    i = _slot(files, insights, deps)
+    return CLARITY_LEVELS[clarity[i]], completeness[i]
+
+
+def columns(systems):
+    """(names, files, insights, deps) count columns for a systems dict."""
+    names = list(systems)
+    values = systems.values()
+    files = array("l", [len(s.get("key_files", ())) for s in values])
+    insights = array("l", [len(s.get("insights", ())) for s in values])
+    deps = array("l", [len(s.get("dependencies", ())) for s in values])
+    return names, files, insights, deps
+
+
+def compute(files, insights, deps, use_numpy=None):
+    """Clarity codes (indexes into CLARITY_LEVELS) and completeness per row.
+
+    Takes equal-length integer columns. Uses NumPy when it is installed
+    (or as forced by use_numpy); returns lists either way.
+    """
+    clarity, completeness = _table()
+    np = _numpy() if use_numpy is not False else None
+    if use_numpy and np is None:
+        raise ImportError("NumPy is not installed")
+
+    if np is not None:
+        slots = (
+            np.minimum(np.asarray(files), FILE_TARGET) * _INSIGHT_STRIDE
+            + np.minimum(np.asarray(insights), INSIGHT_TARGET) * _DEP_STRIDE
+            + (np.asarray(deps) > 0)
+        )
+        return (
+            np.asarray(clarity)[slots].tolist(),
+            np.asarray(completeness)[slots].tolist(),
+        )
+
+    ft, it, stride = FILE_TARGET, INSIGHT_TARGET, _INSIGHT_STRIDE
+    slots = [
+        (f if f < ft else ft) * stride + (i if i < it else it) * _DEP_STRIDE + (d > 0)
+        for f, i, d in zip(files, insights, deps)
+    ]
+    return [clarity[i] for i in slots], [completeness[i] for i in slots]
+
+
+def recompute(systems, use_numpy=None):
+    """Rescore every system in place; returns the names whose scores changed."""
+    names, files, insights, deps = columns(systems)
+    clarity, completeness = compute(files, insights, deps, use_numpy)
+    levels = [CLARITY_LEVELS[c] for c in clarity]
+    changed = []
+    rows = zip(names, systems.values(), levels, completeness)
+    for row, (name, s, level, points) in enumerate(rows):
+        if hasattr(s, "_metrics_key"):
+            # models.System: also mark the cached inputs as current
+            s._metrics_key = (files[row], insights[row], deps[row] > 0)
+            if s.clarity != level or s.completeness != points:
+                s.clarity = level
+                s.completeness = points
+                changed.append(name)
+        elif s.get("clarity") != level or s.get("completeness") != points:
+            s["clarity"] = level
+            s["completeness"] = points
+            changed.append(name)
+    return changed
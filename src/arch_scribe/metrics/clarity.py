@@ -1,3 +1,17 @@
+from .completeness import base_completeness
+
+
+def clarity_level(insight_count, base, has_deps):
+    """Clarity rubric given the base completeness (see compute_clarity)."""
+    if insight_count >= 5 and base >= 70 and has_deps:
+        return "high"
+
+    if insight_count >= 3 and base >= 40:
+        return "medium"
+
+    return "low"
+
+
 def compute_clarity(sys):
     """Auto-compute clarity from objective rubric
 
@@ -16,18 +30,7 @@ def compute_clarity(sys):
     """
     insight_count = len(sys.get("insights", []))
     has_deps = len(sys.get("dependencies", [])) > 0
-
-    # Calculate BASE completeness (without clarity bonus)
-    file_count = len(sys.get("key_files", []))
-    file_score = min(file_count / 10.0, 1.0) * 40
-    insight_score = min(insight_count / 5.0, 1.0) * 35
-    dep_score = 15 if has_deps else 0
-    base_completeness = int(file_score + insight_score + dep_score)
-
-    if insight_count >= 5 and base_completeness >= 70 and has_deps:
-        return "high"
-
-    if insight_count >= 3 and base_completeness >= 40:
-        return "medium"
-
-    return "low"
\ No newline at end of file
+    base = int(
+        base_completeness(len(sys.get("key_files", [])), insight_count, has_deps)
+    )
+    return clarity_level(insight_count, base, has_deps)
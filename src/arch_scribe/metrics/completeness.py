@@ -1,3 +1,20 @@
+# Completeness weights (100 points total)
+FILE_POINTS = 40
+FILE_TARGET = 10
+INSIGHT_POINTS = 35
+INSIGHT_TARGET = 5
+DEPENDENCY_POINTS = 15
+CLARITY_BONUS = {"high": 10, "medium": 5, "low": 0}
+
+
+def base_completeness(file_count, insight_count, has_deps):
+    """Completeness before the clarity bonus (what clarity is judged on)."""
+    file_score = min(file_count / float(FILE_TARGET), 1.0) * FILE_POINTS
+    insight_score = min(insight_count / float(INSIGHT_TARGET), 1.0) * INSIGHT_POINTS
+    dep_score = DEPENDENCY_POINTS if has_deps else 0
+    return file_score + insight_score + dep_score
+
+
 def compute_completeness(sys):
     """Calculate completeness from objective metrics
 
@@ -7,23 +24,12 @@ def compute_completeness(sys):
     - Dependency mapping: 15 points
     - Clarity bonus: up to 10 points
     """
-    # 1. File coverage (40 points max)
-    file_count = len(sys.get("key_files", []))
-    file_score = min(file_count / 10.0, 1.0) * 40
-
-    # 2. Insight depth (35 points max)
-    insight_count = len(sys.get("insights", []))
-    insight_score = min(insight_count / 5.0, 1.0) * 35
-
-    # 3. Dependency mapping (15 points)
-    has_deps = len(sys.get("dependencies", [])) > 0
-    dep_score = 15 if has_deps else 0
-
-    # 4. Clarity bonus (10 points)
-    clarity = sys.get("clarity", "low")
-    clarity_map = {"high": 10, "medium": 5, "low": 0}
-    clarity_score = clarity_map.get(clarity, 0)
+    base = base_completeness(
+        len(sys.get("key_files", [])),
+        len(sys.get("insights", [])),
+        len(sys.get("dependencies", [])) > 0,
+    )
+    clarity_score = CLARITY_BONUS.get(sys.get("clarity", "low"), 0)
 
     # Total score (capped at 100)
-    total = file_score + insight_score + dep_score + clarity_score
-    return int(min(total, 100))
\ No newline at end of file
+    return int(min(base + clarity_score, 100))
@@ -1,3 +1,8 @@
+import heapq
+import math
+import posixpath
+
+
 def calculate_coverage_quality(sig_paths, mapped):
     """Coverage quality: what % of significant files are mapped?
 
@@ -13,4 +18,80 @@ def calculate_coverage_quality(sig_paths, mapped):
 
     # Only count files that exist in BOTH sets
     mapped_sig = sig_paths.intersection(mapped)
-    return round(len(mapped_sig) / len(sig_paths) * 100, 1)
\ No newline at end of file
+    return round(len(mapped_sig) / len(sig_paths) * 100, 1)
+
+# --- ranking unmapped files ---
+RANKINGS = ("bytes", "lines", "priority")
+
+# Names that tend to be entry points or hubs worth mapping first
+ENTRY_POINT_STEMS = {
+    "main", "app", "index", "server", "cli", "__init__", "__main__", "manage",
+    "routes", "router", "api", "core", "config", "settings", "wsgi", "asgi",
+}
+TYPE_WEIGHTS = {"code": 1.0, "config": 0.5, "unknown": 0.3, "data": 0.1}
+# Line-based rankings estimate lines from size, then read the real counts of
+# the best POOL * k candidates only
+BYTES_PER_LINE = 32
+POOL = 4
+
+
+def priority(path, lines, file_type, dir_unmapped_ratio=1.0):
+    """Exploration priority: bigger, shallower, code, entry-point-like files in
+    directories nobody has mapped yet come first."""
+    stem = posixpath.splitext(posixpath.basename(path))[0].lower()
+    depth = path.count("/")
+    score = TYPE_WEIGHTS.get(file_type, 0.3) * math.log2(2 + lines)
+    if stem in ENTRY_POINT_STEMS:
+        score *= 1.5
+    return score * (1 + dir_unmapped_ratio) / (1 + 0.25 * depth)
+
+
+def top_unmapped(snapshot, unmapped, k=10, rank="bytes", tree=None):
+    """The k highest-ranked unmapped files as (path, size, lines, score).
+
+    A heap selection over every unmapped file, using only what the scan
+    snapshot carries (no stat calls). Files are only read for their line
+    count when they are shown or, for the line-based rankings, among the
+    POOL * k best by an estimate: the line count if the snapshot already
+    has it, else one from the size. Ties go to the path that sorts first.
+    """
+    if rank not in RANKINGS:
+        raise ValueError(f"Unknown ranking '{rank}' (choose from {', '.join(RANKINGS)})")
+    if k <= 0:
+        return []
+    files = snapshot.files
+    candidates = [p for p in unmapped if p in files]
+
+    if rank == "bytes":
+        best = heapq.nsmallest(k, candidates, key=lambda p: (-snapshot.size(p), p))
+        return [(p, snapshot.size(p), snapshot.lines(p), snapshot.size(p)) for p in best]
+
+    if rank == "lines":
+        def score(path, lines):
+            return lines
+    else:
+        from ..scanning.classifier import FileClassifier
+
+        classify = FileClassifier().classify_by_extension
+        ratios = {}
+
+        def score(path, lines):
+            directory = path.rpartition("/")[0] or "."
+            ratio = ratios.get(directory)
+            if ratio is None:
+                ratio = tree.unmapped_ratio(directory) if tree is not None else 1.0
+                ratios[directory] = ratio
+            return priority(path, lines, classify(path), ratio)
+
+    def estimate(path):
+        lines = files[path][2]
+        if lines is None:
+            lines = snapshot.size(path) // BYTES_PER_LINE
+        return (-score(path, lines), path)
+
+    def exact(path):
+        return (-score(path, snapshot.lines(path)), path)
+
+    pool = heapq.nsmallest(POOL * k, candidates, key=estimate)
+    best = heapq.nsmallest(k, pool, key=exact)
+    return [(p, snapshot.size(p), snapshot.lines(p), score(p, snapshot.lines(p))) for p in best]
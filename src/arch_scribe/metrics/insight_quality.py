@@ -0,0 +1,122 @@
+"""
+Insight quality check: [WHAT] using [HOW], which [WHY/IMPACT].
+
+ACTION_VERBS and IMPACT_WORDS are compiled once into a single regex - a
+prefix trie written as nested alternations, so each position in the text
+costs a walk down shared prefixes rather than a try per word. Matches are
+whole words (or whole phrases): 'logs' does not match inside 'catalogs', nor
+'limits' inside 'rate-limits'.
+"""
+import functools
+import re
+
+# Letters, digits, '_' and in-word hyphens are part of a word
+_BEFORE = r"(?<![\w-])"
+_AFTER = r"(?![\w-])"
+
+
+def _trie(phrases):
+    root = {}
+    for phrase in phrases:
+        node = root
+        for ch in " ".join(phrase.lower().split()):
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return root
+
+
+def _pattern(node):
+    """Regex for the strings in a trie node, shared prefixes factored out."""
+    optional = "" in node
+    branches = []
+    for ch in sorted(k for k in node if k):
+        atom = r"\s+" if ch == " " else re.escape(ch)
+        branches.append(atom + _pattern(node[ch]))
+    if not branches:
+        return ""
+    if len(branches) == 1 and not optional:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if optional else body
+
+
+@functools.lru_cache(maxsize=None)
+def matcher():
+    """Compiled (action|impact) regex; built on first use."""
+    from ..config.insight_quality import ACTION_VERBS, IMPACT_WORDS
+
+    action = set(ACTION_VERBS)
+    impact = set(IMPACT_WORDS) - action
+    return re.compile(
+        f"{_BEFORE}(?:(?P<action>{_pattern(_trie(action))})"
+        f"|(?P<impact>{_pattern(_trie(impact))})){_AFTER}"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _dual_use():
+    """Action verbs that are also impact words (match as both)."""
+    from ..config.insight_quality import ACTION_VERBS, IMPACT_WORDS
+
+    return frozenset(ACTION_VERBS) & frozenset(IMPACT_WORDS)
+
+
+@functools.lru_cache(maxsize=None)
+def how_matcher():
+    """Compiled HOW_WORDS regex (the [HOW] part of the template)."""
+    from ..config.insight_quality import HOW_WORDS
+
+    return re.compile(f"{_BEFORE}{_pattern(_trie(HOW_WORDS))}{_AFTER}")
+
+
+def scan(text):
+    """(has_action, has_impact) in a single pass over the lowercased text."""
+    has_action = has_impact = False
+    dual = _dual_use()
+    for m in matcher().finditer(text.lower()):
+        if m.lastgroup == "action":
+            has_action = True
+            if dual and " ".join(m.group().split()) in dual:
+                has_impact = True
+        else:
+            has_impact = True
+        if has_action and has_impact:
+            break
+    return has_action, has_impact
+
+
+# Error codes, in the order checks report them
+TOO_SHORT = "too_short"
+MISSING_ACTION = "missing_action"
+MISSING_IMPACT = "missing_impact"
+MISSING_HOW = "missing_how"
+
+
+def insight_codes(text, level="standard"):
+    """Error codes for an insight at a strictness level (empty if it passes)."""
+    from .quality_rules import pipeline
+
+    return pipeline(level).codes(text)
+
+
+def describe(code, text, level="standard"):
+    """Human-readable message for an error code."""
+    from ..config.insight_quality import STRICTNESS_LEVELS
+
+    if code == TOO_SHORT:
+        need = STRICTNESS_LEVELS[level]["min_words"]
+        return f"Too short ({len(text.split())} words, need {need}+)"
+    if code == MISSING_ACTION:
+        return "Missing [WHAT] - no clear action verb found"
+    if code == MISSING_IMPACT:
+        return "Missing [WHY/IMPACT] - no consequence or benefit stated"
+    if code == MISSING_HOW:
+        return "Missing [HOW] - no mechanism ('using', 'via', 'backed by', ...)"
+    return code
+
+
+def check_insight(text, level="standard"):
+    """List of template violations for an insight (empty if it passes)."""
+    from .quality_rules import codes
+
+    return [describe(code, text, level) for code in codes(text, level)]
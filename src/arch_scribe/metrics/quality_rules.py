@@ -0,0 +1,257 @@
+"""
+STRICTNESS_LEVELS compiled into rule pipelines, with cached outcomes.
+
+A level ('lenient', 'standard', 'strict') becomes a Pipeline of Rule objects
+sorted by cost: the word count first, then the action/impact matcher (one
+shared scan), then the HOW matcher. `codes()` runs every rule; `passes()`
+stops at the first failure.
+
+Outcomes are cached under (text hash, level, rules version). The rules
+version is a hash of the word lists and level definitions, so editing
+config/insight_quality.py invalidates old entries on its own. The cache is
+persisted to a sidecar by the commands that validate in bulk.
+"""
+import functools
+import hashlib
+import json
+import os
+
+from ..core.constants import QUALITY_CACHE_FILE
+from .insight_quality import (
+    MISSING_ACTION,
+    MISSING_HOW,
+    MISSING_IMPACT,
+    TOO_SHORT,
+    how_matcher,
+    scan,
+)
+
+DEFAULT_LEVEL = "standard"
+
+# Bump when rule logic (not just configuration) changes
+RULES_REVISION = 1
+
+# Codes are reported in this order regardless of evaluation order
+_REPORT_ORDER = {c: i for i, c in enumerate([TOO_SHORT, MISSING_ACTION, MISSING_IMPACT, MISSING_HOW])}
+
+
+class _Subject:
+    """The text under validation, with lazily computed shared work."""
+
+    __slots__ = ("text", "_scan")
+
+    def __init__(self, text):
+        self.text = text
+        self._scan = None
+
+    def scan(self):
+        if self._scan is None:
+            self._scan = scan(self.text)
+        return self._scan
+
+
+class Rule:
+    __slots__ = ()
+    code = None
+    cost = 0
+
+    def check(self, subject):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class MinWords(Rule):
+    __slots__ = ("min_words",)
+    code = TOO_SHORT
+    cost = 1
+
+    def __init__(self, min_words):
+        self.min_words = min_words
+
+    def check(self, subject):
+        return len(subject.text.split()) >= self.min_words
+
+    def __repr__(self):
+        return f"MinWords({self.min_words})"
+
+
+class RequireAction(Rule):
+    __slots__ = ()
+    code = MISSING_ACTION
+    cost = 10
+
+    def check(self, subject):
+        return subject.scan()[0]
+
+
+class RequireImpact(Rule):
+    __slots__ = ()
+    code = MISSING_IMPACT
+    cost = 10
+
+    def check(self, subject):
+        return subject.scan()[1]
+
+
+class RequireHow(Rule):
+    __slots__ = ()
+    code = MISSING_HOW
+    cost = 5
+
+    def check(self, subject):
+        return how_matcher().search(subject.text.lower()) is not None
+
+
+class Pipeline:
+    __slots__ = ("level", "rules")
+
+    def __init__(self, level, rules):
+        self.level = level
+        self.rules = sorted(rules, key=lambda r: r.cost)
+
+    def codes(self, text):
+        subject = _Subject(text)
+        failed = [r.code for r in self.rules if not r.check(subject)]
+        return sorted(failed, key=_REPORT_ORDER.get)
+
+    def passes(self, text):
+        subject = _Subject(text)
+        return all(r.check(subject) for r in self.rules)
+
+    def __repr__(self):
+        return f"Pipeline({self.level!r}, {self.rules!r})"
+
+
+def levels():
+    from ..config.insight_quality import STRICTNESS_LEVELS
+
+    return list(STRICTNESS_LEVELS)
+
+
+@functools.lru_cache(maxsize=None)
+def pipeline(level=DEFAULT_LEVEL):
+    """Compile a strictness level; ValueError for unknown levels."""
+    from ..config.insight_quality import STRICTNESS_LEVELS
+
+    if level not in STRICTNESS_LEVELS:
+        raise ValueError(f"Unknown strictness level '{level}' (choose from {', '.join(STRICTNESS_LEVELS)})")
+    spec = STRICTNESS_LEVELS[level]
+    rules = [MinWords(spec.get("min_words", 0))]
+    if spec.get("require_action"):
+        rules.append(RequireAction())
+    if spec.get("require_impact"):
+        rules.append(RequireImpact())
+    if spec.get("require_how"):
+        rules.append(RequireHow())
+    return Pipeline(level, rules)
+
+
+@functools.lru_cache(maxsize=None)
+def rules_version():
+    from ..config import insight_quality as cfg
+
+    blob = json.dumps(
+        [
+            RULES_REVISION,
+            cfg.ACTION_VERBS,
+            cfg.IMPACT_WORDS,
+            cfg.HOW_WORDS,
+            cfg.STRICTNESS_LEVELS,
+        ],
+        sort_keys=True,
+    )
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=8).hexdigest()
+
+
+# --- outcome cache ---
+class OutcomeCache:
+    """{"<text hash>:<level>:<rules version>": [codes]}, bounded, persistable."""
+
+    __slots__ = ("entries", "dirty", "limit")
+
+    def __init__(self, entries=None, limit=200_000):
+        self.entries = entries if entries is not None else {}
+        self.dirty = False
+        self.limit = limit
+
+    @staticmethod
+    def key(text, level):
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{digest}:{level}:{rules_version()}"
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def put(self, key, codes):
+        self.entries[key] = codes
+        self.dirty = True
+
+    @classmethod
+    def load(cls, path=QUALITY_CACHE_FILE):
+        if not os.path.exists(path):
+            return cls()
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+        except json.JSONDecodeError:
+            return cls()
+        if raw.get("rules_version") != rules_version():
+            return cls()
+        return cls(raw.get("entries", {}))
+
+    def save(self, path=QUALITY_CACHE_FILE):
+        """Persist the current rules version's entries, newest `limit` kept."""
+        if not self.dirty:
+            return
+        suffix = ":" + rules_version()
+        current = [(k, v) for k, v in self.entries.items() if k.endswith(suffix)]
+        self.entries = dict(current[-self.limit:])
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp = path + ".tmp"
+        with open(temp, "w") as f:
+            json.dump({"rules_version": rules_version(), "entries": self.entries}, f)
+        os.replace(temp, path)
+        self.dirty = False
+
+
+_cache = None
+
+
+def cache():
+    """Process-wide outcome cache, loaded from the sidecar on first use."""
+    global _cache
+    if _cache is None:
+        _cache = OutcomeCache.load()
+    return _cache
+
+
+def codes(text, level=DEFAULT_LEVEL):
+    """Error codes for `text` at `level`.
+
+    Goes through the outcome cache only if a bulk command already loaded
+    it: a single check costs less than reading the sidecar.
+    """
+    store = _cache
+    if store is None:
+        return pipeline(level).codes(text)
+    key = OutcomeCache.key(text, level)
+    found = store.get(key)
+    if found is None:
+        found = pipeline(level).codes(text)
+        store.put(key, found)
+    return list(found)
+
+
+def passes(text, level=DEFAULT_LEVEL):
+    """Pass/fail only: stops at the first failing rule."""
+    key = OutcomeCache.key(text, level)
+    store = cache()
+    found = store.get(key)
+    if found is not None:
+        return not found
+    ok = pipeline(level).passes(text)
+    if ok:
+        store.put(key, [])
+    return ok
@@ -1 +1,11 @@
-# dependency_ops.py - placeholder
+from ..core import changes, models, progress
+
+
+def add_dependency(data, name, target, reason):
+    sys = models.system(data, name)
+    if sys is None or target not in data["systems"]:
+        return False
+    sys.add_dependency(target, reason)
+    changes.mark(data, name)
+    progress.refresh_metrics(data, sys)
+    return True
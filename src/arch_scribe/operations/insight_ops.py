@@ -1 +1,113 @@
-# insight_ops.py - placeholder
+from ..core import changes, minhash, models, progress, session
+
+
+def similar_words(words_a, words_b, threshold=0.8):
+    if not words_a or not words_b:
+        return False
+    overlap = len(words_a & words_b) / max(len(words_a), len(words_b))
+    return overlap > threshold
+
+
+def similar_text(a, b, threshold=0.8):
+    return similar_words(set(a.lower().split()), set(b.lower().split()), threshold)
+
+
+def find_similar(data, text, threshold=0.8, system=None):
+    """(system, position) of existing insights similar to `text`.
+
+    Uses the project's MinHash/LSH index when the state has one; plain dicts
+    are compared pairwise. Limited to one system if `system` is given.
+    """
+    words = models.Insight(text).words
+    index = minhash.minhash_of(data)
+    systems = data["systems"]
+    if index is None or threshold < minhash.LSH_MIN_THRESHOLD:
+        names = [system] if system is not None else list(systems)
+        keys = [
+            (name, i)
+            for name in names
+            for i in range(len(systems[name].get("insights", [])))
+        ]
+    else:
+        keys = [k for k in index.candidates(text) if system is None or k[0] == system]
+
+    found = []
+    for name, i in keys:
+        insights = systems[name]["insights"] if name in systems else ()
+        if i >= len(insights):
+            continue
+        existing = insights[i]
+        if similar_words(words, models.Insight(existing).words, threshold):
+            found.append((name, i))
+    return found
+
+
+def has_similar(data, name, text):
+    return bool(find_similar(data, text, system=name))
+
+
+def add_insight(data, name, text):
+    """Append an insight unless a similar one exists. Returns True if added."""
+    sys = models.system(data, name)
+    if sys is None or has_similar(data, name, text):
+        return False
+    position = len(sys.insights)
+    minhash.record_insight(data, name, position, text)
+    sys.insights.append(text)
+    index = minhash.minhash_of(data)
+    if index is not None:
+        index.add(name, position, text)
+    session.record_insight_added(data)
+    changes.mark(data, name)
+    progress.refresh_metrics(data, sys)
+    return True
+
+
+def duplicate_clusters(data, threshold=0.8):
+    """Groups of near-duplicate insights across the whole project.
+
+    Each cluster is a list of (system, position), in state order; singletons
+    are left out. Pairs are linked when similar_words() holds, so clusters
+    are connected components of the usual similarity relation.
+    """
+    systems = data["systems"]
+    index = minhash.minhash_of(data)
+    if index is None or threshold < minhash.LSH_MIN_THRESHOLD:
+        keys = [
+            (name, i)
+            for name, s in systems.items()
+            for i in range(len(s.get("insights", [])))
+        ]
+        pairs = [(i, j) for i in range(len(keys)) for j in range(i + 1, len(keys))]
+    else:
+        keys = index.keys
+        pairs = index.candidate_pairs()
+
+    words = {}
+
+    def words_of(entry):
+        if entry not in words:
+            name, i = keys[entry]
+            words[entry] = models.Insight(systems[name]["insights"][i]).words
+        return words[entry]
+
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j in pairs:
+        if similar_words(words_of(i), words_of(j), threshold):
+            parent[find(i)] = find(j)
+
+    groups = {}
+    for entry in parent:
+        groups.setdefault(find(entry), []).append(entry)
+    return sorted(
+        ([keys[e] for e in sorted(members)] for members in groups.values() if len(members) > 1),
+        key=lambda c: c[0],
+    )
@@ -0,0 +1,90 @@
+from ..core import changes, progress
+from ..core.index import index_of
+from ..core.models import State
+from ..core.paths import PathTable, bitmap, canonical, popcount
+from ..metrics.coverage import calculate_coverage_quality
+
+
+def refresh_stats(data, total, sig_total, sig_paths, table=None, tree=None):
+    """Write scan_stats from a scan result and republish progress.
+
+    Progress comes from the running totals (core.progress); nothing here
+    walks the systems. `tree` is the tree fingerprint (core.fingerprint)
+    taken before the scan, kept so readers can tell when it went stale.
+    """
+    if table is None:
+        table = PathTable()
+
+    # Integer/bitset arithmetic over interned paths instead of string sets
+    sig_bits = bitmap(table.intern_many(sig_paths))
+    mapped_sig = popcount(sig_bits & bitmap(index_of(data).ids(table)))
+    cov = (mapped_sig / sig_total * 100) if sig_total > 0 else 0.0
+
+    # Same ratio as calculate_coverage_quality(sig_paths, mapped)
+    quality = round(mapped_sig / len(sig_paths) * 100, 1) if sig_paths else 0.0
+
+    stats = data["metadata"]["scan_stats"]
+    stats.update(
+        {
+            "total_files_scanned": total,
+            "significant_files_total": sig_total,
+            "mapped_files_count": mapped_sig,
+            "coverage_percentage": round(cov, 1),
+            "coverage_quality": quality,
+        }
+    )
+    if tree is not None:
+        stats["tree_fingerprint"] = tree
+
+    progress.publish(data, progress.totals_of(data))
+
+
+def recompute_metrics(data, names=None, use_numpy=None):
+    """Rescore clarity/completeness in one batch - every system, or just
+    `names` - and update the progress totals. Returns the names whose
+    scores changed."""
+    from ..metrics import batch
+
+    systems = data.get("systems", {})
+    if names is None:
+        changed = batch.recompute(systems, use_numpy)
+        totals = progress.recompute(systems)
+        if isinstance(data, State):
+            data.totals = totals
+    else:
+        subset = {n: systems[n] for n in names if n in systems}
+        totals = progress.totals_of(data)
+        before = {n: s["completeness"] for n, s in subset.items()}
+        changed = batch.recompute(subset, use_numpy)
+        for n in changed:
+            totals.change(before[n], systems[n]["completeness"])
+    for n in changed:
+        changes.mark(data, n)
+    progress.publish(data, totals)
+    return changed
+
+
+def verify_stats(data, sig_paths=None):
+    """Recompute progress (and, given a scan, coverage) from scratch.
+
+    Independent of the incremental/bitmap paths: plain string sets, a walk
+    over every system. Returns a list of mismatch descriptions.
+    """
+    errors = progress.verify(data)
+    if sig_paths is None:
+        return errors
+
+    mapped = set()
+    for s in data.get("systems", {}).values():
+        mapped.update(canonical(p) for p in s.get("key_files", []))
+    stats = data["metadata"].get("scan_stats", {})
+    expected = {
+        "mapped_files_count": len(set(sig_paths) & mapped),
+        "coverage_quality": calculate_coverage_quality(set(sig_paths), mapped),
+    }
+    for field, value in expected.items():
+        if stats.get(field) != value:
+            errors.append(
+                f"scan_stats.{field}: stored {stats.get(field)}, expected {value}"
+            )
+    return errors
@@ -1 +1,56 @@
-# system_ops.py - placeholder
+"""System mutations as pure functions on the state dict.
+
+StateManager validates input and prompts the user, then applies one of these.
+They never print or prompt, so they can be replayed on a fresher copy of the
+state when another writer saved first (see StateManager.save_state).
+"""
+from ..core import changes, dirtree, models, progress, session
+from ..core.index import index_of, record_files
+from ..core.paths import canonical
+
+
+def add_system(data, name):
+    if name in data["systems"]:
+        return False
+    totals = progress.totals_of(data)
+    data["systems"][name] = models.System()
+    changes.mark(data, name)
+    totals.add()
+    progress.publish(data, totals)
+    session.record_system_added(data, name)
+    return True
+
+
+def update_system(data, name, desc=None):
+    sys = models.system(data, name)
+    if sys is None:
+        return False
+    if desc:
+        sys.description = desc
+        changes.mark(data, name)
+    progress.refresh_metrics(data, sys)
+    return True
+
+
+def map_files(data, name, files):
+    sys = models.system(data, name)
+    if sys is None:
+        return False
+    files = [canonical(f) for f in files]
+    index = index_of(data)
+    if session.active(data) is not None:
+        session.record_files_mapped(
+            data, [f for f in files if not index.is_mapped(f)]
+        )
+    # Before the files are added: a saved tree is stamped with the digest
+    # of the mapped files as they were
+    tree = dirtree.tree_of(data)
+    added = sys.add_files(files)
+    if added:
+        if tree is not None:
+            tree.map(added)
+        index.add(name, added)
+        record_files(data, name, added)
+        changes.mark(data, name)
+    progress.refresh_metrics(data, sys)
+    return True
@@ -0,0 +1,322 @@
+"""
+Mermaid export of the dependency graph (core.graph).
+
+Edges come from the deduplicated graph, so repeated `dep` calls draw once
+with their reasons joined. Big graphs can be simplified before drawing:
+cycles (SCCs) collapse into one node, and leaves hanging off the same
+system in the same direction fold into one counted node. Whatever is left
+over `max_nodes` is split into shards - clusters of neighbouring systems,
+one diagram each - plus an index diagram of the shards and the edges
+between them. Lines are produced lazily and written in one pass per
+diagram.
+"""
+import os
+import re
+import sys
+from collections import deque
+
+REASON_WIDTH = 30
+MAX_NODES = 200
+# Names listed on a collapsed node before "+N more"
+LABEL_NAMES = 3
+
+
+def sanitize(name):
+    node_id = re.sub(r"[^\w]", "_", name)
+    # Mermaid keywords can't be node ids
+    return node_id + "_" if node_id.lower() in ("end", "graph", "subgraph") else node_id
+
+
+def _label(text):
+    return text.replace('"', "#quot;")
+
+
+def _reason(text):
+    text = text.replace("|", "/").replace('"', "'")
+    return (text[:REASON_WIDTH] + "..") if len(text) > REASON_WIDTH else text
+
+
+def _names(names):
+    shown = ", ".join(names[:LABEL_NAMES])
+    return shown + (f" +{len(names) - LABEL_NAMES} more" if len(names) > LABEL_NAMES else "")
+
+
+class View:
+    """The graph as drawn: nodes are groups of systems.
+
+    `ids`/`labels`/`shapes` per node, `edges` {(a, b): label}.
+    """
+
+    __slots__ = ("ids", "labels", "shapes", "edges", "_taken")
+
+    def __init__(self):
+        self.ids, self.labels, self.shapes = [], [], []
+        self.edges = {}
+        self._taken = set()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, key, label, shape="rect"):
+        node_id = sanitize(key)
+        if node_id in self._taken:
+            suffix = 2
+            while f"{node_id}_{suffix}" in self._taken:
+                suffix += 1
+            node_id = f"{node_id}_{suffix}"
+        self._taken.add(node_id)
+        self.ids.append(node_id)
+        self.labels.append(label)
+        self.shapes.append(shape)
+        return len(self.ids) - 1
+
+    def neighbours(self):
+        adj = [[] for _ in self.ids]
+        for a, b in self.edges:
+            if a != b:
+                adj[a].append(b)
+                adj[b].append(a)
+        return adj
+
+
+def view(graph, collapse_cycles=False, collapse_leaves=False):
+    """Build the View for a core.graph.Graph."""
+    group = list(range(len(graph)))
+    members = [[n] for n in range(len(graph))]
+    cyclic = set()
+    if collapse_cycles:
+        components, comp = graph.scc()
+        group = comp
+        members = components
+        cyclic = {c for c, m in enumerate(components) if len(m) > 1}
+
+    # Group-level edges: {(ga, gb): [underlying edges]}
+    grouped = {}
+    for a, b in graph.edges():
+        ga, gb = group[a], group[b]
+        if ga == gb and ga in cyclic:
+            continue
+        grouped.setdefault((ga, gb), []).append((a, b))
+
+    folded = {}
+    if collapse_leaves:
+        degree = [0] * len(members)
+        touching = [None] * len(members)
+        for ga, gb in grouped:
+            if ga == gb:
+                degree[ga] += 2
+                continue
+            degree[ga] += 1
+            degree[gb] += 1
+            # A leaf is keyed by its one neighbour and which side it hangs on
+            touching[ga] = (gb, "dependents")
+            touching[gb] = (ga, "deps")
+        bundles = {}
+        for g in range(len(members)):
+            if degree[g] == 1 and g not in cyclic:
+                bundles.setdefault(touching[g], []).append(g)
+        for key, leaves in bundles.items():
+            if len(leaves) > 1:
+                for g in leaves:
+                    folded[g] = key
+
+    out = View()
+    node_of = {}
+    for g, group_members in enumerate(members):
+        if g in folded:
+            continue
+        names = sorted(graph.names[m] for m in group_members)
+        if g in cyclic:
+            node_of[g] = out.add("cycle_" + names[0], f"🔁 {_names(names)} ({len(names)})", "hex")
+        else:
+            name = names[0]
+            missing = name in graph.missing
+            node_of[g] = out.add(name, name + (" (missing)" if missing else ""), "dashed" if missing else "rect")
+
+    bundle_of = {}
+    for g, (anchor, side) in folded.items():
+        bundle_of.setdefault((anchor, side), []).append(g)
+    for (anchor, side), leaves in bundle_of.items():
+        names = sorted(graph.names[members[g][0]] for g in leaves)
+        anchor_id = out.ids[node_of[anchor]]
+        node = out.add(f"{anchor_id}_{side}_leaves", f"{len(names)} systems: {_names(names)}", "stadium")
+        for g in leaves:
+            node_of[g] = node
+
+    for (ga, gb), underlying in grouped.items():
+        key = (node_of[ga], node_of[gb])
+        if key[0] == key[1] and (ga != gb):
+            continue
+        edges = out.edges.setdefault(key, [])
+        edges.extend(underlying)
+    for key, underlying in out.edges.items():
+        if len(underlying) == 1:
+            out.edges[key] = _reason("; ".join(graph.reasons[underlying[0]]))
+        else:
+            out.edges[key] = f"{len(underlying)} deps"
+    return out
+
+
+def shards(v, max_nodes=MAX_NODES):
+    """Partition the View's nodes into clusters of at most `max_nodes`.
+
+    Grows each cluster breadth-first from the best-connected node left, so
+    neighbours land together and few edges cross shards. One shard (all
+    nodes) when the graph fits or max_nodes is falsy.
+    """
+    if not max_nodes or len(v) <= max_nodes:
+        return [list(range(len(v)))]
+    adj = v.neighbours()
+    order = sorted(range(len(v)), key=lambda n: (-len(adj[n]), v.ids[n]))
+    assigned = [False] * len(v)
+    result = []
+    for seed in order:
+        if assigned[seed]:
+            continue
+        cluster = []
+        queue = deque([seed])
+        assigned[seed] = True
+        while queue and len(cluster) < max_nodes:
+            node = queue.popleft()
+            cluster.append(node)
+            for other in adj[node]:
+                if not assigned[other]:
+                    assigned[other] = True
+                    queue.append(other)
+        # Whatever didn't fit goes back for a later shard
+        for node in queue:
+            assigned[node] = False
+        # Fragments left once their neighbours are taken share a shard
+        if result and len(result[-1]) + len(cluster) <= max_nodes:
+            result[-1].extend(cluster)
+        else:
+            result.append(cluster)
+    return result
+
+
+_SHAPES = {
+    "rect": '{}["{}"]',
+    "hex": '{}{{{{"{}"}}}}',
+    "stadium": '{}(["{}"])',
+    "dashed": '{}["{}"]:::missing',
+}
+
+
+def _node(v, n, label=None):
+    return "  " + _SHAPES[v.shapes[n]].format(v.ids[n], _label(label or v.labels[n])) + "\n"
+
+
+def _edge(a, b, label):
+    return f"  {a} -->|{label}| {b}\n" if label else f"  {a} --> {b}\n"
+
+
+def diagram(v, nodes=None, edges=None, shard_of=None, link=None):
+    """Lines of one fenced Mermaid diagram: all nodes, or the shard `nodes`
+    and its `edges`, those leaving it drawn to stubs named after their
+    shard."""
+    yield "```mermaid\n"
+    yield "graph TD\n"
+    yield "  classDef missing stroke-dasharray: 5 5\n"
+    inside = None if nodes is None else set(nodes)
+    for n in range(len(v)) if nodes is None else nodes:
+        yield _node(v, n)
+    stubs = set()
+    for (a, b), label in v.edges.items() if edges is None else edges:
+        if inside is None or (a in inside and b in inside):
+            yield _edge(v.ids[a], v.ids[b], label)
+            continue
+        other = b if a in inside else a
+        stub = f"ext_{v.ids[other]}"
+        if stub not in stubs:
+            stubs.add(stub)
+            yield f'  {stub}>"{_label(v.labels[other])} · shard {shard_of[other] + 1}"]\n'
+            if link:
+                yield f'  click {stub} "{link(shard_of[other])}"\n'
+        if a in inside:
+            yield _edge(v.ids[a], stub, label)
+        else:
+            yield _edge(stub, v.ids[b], label)
+    yield "```\n"
+
+
+def index(v, parts, link=None):
+    """Lines of the index: one node per shard, edges counted between them."""
+    shard_of = _shard_of(parts)
+    crossing = {}
+    for a, b in v.edges:
+        sa, sb = shard_of[a], shard_of[b]
+        if sa != sb:
+            crossing[(sa, sb)] = crossing.get((sa, sb), 0) + 1
+    yield "```mermaid\n"
+    yield "graph TD\n"
+    for i, part in enumerate(parts):
+        names = [v.labels[n] for n in part[:LABEL_NAMES]]
+        yield f'  shard_{i + 1}["Shard {i + 1}: {len(part)} nodes<br/>{_label(", ".join(names))}"]\n'
+        if link:
+            yield f'  click shard_{i + 1} "{link(i)}"\n'
+    for (sa, sb), count in sorted(crossing.items()):
+        yield _edge(f"shard_{sa + 1}", f"shard_{sb + 1}", f"{count} deps")
+    yield "```\n"
+    for i, part in enumerate(parts):
+        target = link(i) if link else f"#shard-{i + 1}"
+        yield f"- [Shard {i + 1}]({target}): {len(part)} nodes\n"
+
+
+def _shard_of(parts):
+    shard_of = {}
+    for i, part in enumerate(parts):
+        for n in part:
+            shard_of[n] = i
+    return shard_of
+
+
+def _edges_by_shard(v, shard_of, count):
+    """Each shard's edges (crossing ones in both), in one pass."""
+    buckets = [[] for _ in range(count)]
+    for edge in v.edges.items():
+        a, b = edge[0]
+        buckets[shard_of[a]].append(edge)
+        if shard_of[b] != shard_of[a]:
+            buckets[shard_of[b]].append(edge)
+    return buckets
+
+
+def shard_file(i):
+    return f"shard-{i + 1:03d}.md"
+
+
+def export(graph, out=None, directory=None, collapse_cycles=False, collapse_leaves=False, max_nodes=MAX_NODES):
+    """Write the graph as Mermaid; returns the number of diagrams written
+    (index excluded).
+
+    Without `directory`, everything streams to `out` (stdout by default);
+    with one, each shard goes to its own file next to an index.md.
+    """
+    out = out or sys.stdout
+    v = view(graph, collapse_cycles, collapse_leaves)
+    parts = shards(v, max_nodes)
+    if directory is None and len(parts) == 1:
+        out.writelines(diagram(v))
+        return 1
+
+    shard_of = _shard_of(parts)
+    buckets = _edges_by_shard(v, shard_of, len(parts))
+    if directory is None:
+        out.writelines(index(v, parts))
+        for i, part in enumerate(parts):
+            out.write(f"\n## Shard {i + 1}\n\n")
+            out.writelines(diagram(v, part, buckets[i], shard_of))
+        return len(parts)
+
+    os.makedirs(directory, exist_ok=True)
+    if len(parts) == 1:
+        with open(os.path.join(directory, "index.md"), "w", encoding="utf-8") as f:
+            f.writelines(diagram(v))
+        return 1
+    with open(os.path.join(directory, "index.md"), "w", encoding="utf-8") as f:
+        f.writelines(index(v, parts, shard_file))
+    for i, part in enumerate(parts):
+        with open(os.path.join(directory, shard_file(i)), "w", encoding="utf-8") as f:
+            f.write("[← Index](index.md)\n\n")
+            f.writelines(diagram(v, part, buckets[i], shard_of, shard_file))
+    return len(parts)
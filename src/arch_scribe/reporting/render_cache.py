@@ -0,0 +1,120 @@
+"""
+On-disk cache of what read-only commands print (RENDER_CACHE_DIR).
+
+`status`, `list`, `graph` and `coverage` are called over and over between
+mutations and used to re-render the same report each time. Their output is
+kept per command and arguments, keyed by the state file's stamp (it moves
+with every save) plus whatever else the command reads: the tree
+fingerprint for `status`, the scan snapshot for `coverage`. A call whose
+key matches is answered from that one file, without loading the state.
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+
+from ..core import fingerprint
+from ..core.constants import RENDER_CACHE_DIR, SCAN_FILE, STATE_FILE
+
+# command -> what it reads besides the state ("" for nothing; None means
+# this call can't be cached)
+INPUTS = {
+    "status": lambda args: None if args.refresh else fingerprint.tree(),
+    "list": lambda args: "",
+    "graph": lambda args: None if args.out else "",
+    "coverage": lambda args: None if args.rescan else fingerprint.stamp(SCAN_FILE) or "",
+}
+
+
+def key(args):
+    """Cache key for a parsed command line, or None if it isn't cacheable."""
+    inputs = INPUTS.get(args.cmd)
+    if inputs is None:
+        return None
+    state = fingerprint.stamp(STATE_FILE)
+    if state is None:
+        return None
+    extra = inputs(args)
+    if extra is None:
+        return None
+    return f"{state}|{extra}"
+
+
+def _entry(args, directory):
+    options = json.dumps(sorted(vars(args).items()), default=str)
+    digest = hashlib.blake2b(options.encode(), digest_size=8).hexdigest()
+    return os.path.join(directory, f"{args.cmd}-{digest}.txt")
+
+
+def load(args, cache_key, directory=RENDER_CACHE_DIR):
+    """The output stored for this command line under `cache_key`, or None."""
+    try:
+        with open(_entry(args, directory), "r", encoding="utf-8") as f:
+            if f.readline().rstrip("\n") != cache_key:
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def store(args, cache_key, text, directory=RENDER_CACHE_DIR):
+    os.makedirs(directory, exist_ok=True)
+    path = _entry(args, directory)
+    temp = path + ".tmp"
+    with open(temp, "w", encoding="utf-8") as f:
+        f.write(cache_key + "\n")
+        f.write(text)
+    os.replace(temp, path)
+
+
+class _Tee:
+    """Writes through to the real stdout and into a buffer."""
+
+    def __init__(self, out, buffer):
+        self.out = out
+        self.buffer = buffer
+
+    def write(self, text):
+        self.buffer.write(text)
+        return self.out.write(text)
+
+    def writelines(self, lines):
+        lines = list(lines)
+        self.buffer.writelines(lines)
+        self.out.writelines(lines)
+
+    def flush(self):
+        self.out.flush()
+
+
+@contextlib.contextmanager
+def capture():
+    """Tee stdout for the duration; yields the buffer."""
+    buffer = io.StringIO()
+    real = sys.stdout
+    sys.stdout = _Tee(real, buffer)
+    try:
+        yield buffer
+    finally:
+        sys.stdout = real
+
+
+def run(call, args):
+    """Answer `args` from the cache, or make `call()` and keep what it
+    printed. Returns True if the command was cacheable."""
+    before = key(args)
+    if before is None:
+        return False
+    cached = load(args, before)
+    if cached is not None:
+        sys.stdout.write(cached)
+        return True
+    with capture() as out:
+        call()
+    # The command itself may have saved
+    after = key(args)
+    if after is not None:
+        store(args, after, out.getvalue())
+    return True
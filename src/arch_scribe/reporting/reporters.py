@@ -1 +1,222 @@
-# reporters.py - placeholder
+"""
+Graph and state exporters: Graphviz DOT, GraphML, JSON Graph Format, CSV
+node/edge lists and Mermaid.
+
+Every reporter renders from one precomputed Model - the deduplicated
+dependency graph (core.graph) plus per-system attributes - so the state is
+walked once however many formats are asked for. Reporters yield text a
+line (or CSV row) at a time straight into their files; `render` runs them
+side by side in a thread pool, since they only read the shared Model.
+"""
+import csv
+import json
+import os
+from xml.sax.saxutils import escape, quoteattr
+
+from ..core.graph import graph_of
+
+# Per-node attributes, in column order
+ATTRIBUTES = ("completeness", "clarity", "files", "insights", "missing")
+
+
+class Model:
+    """What every reporter draws from: the graph and node attributes."""
+
+    __slots__ = ("project", "graph", "attrs")
+
+    def __init__(self, project, graph, attrs):
+        self.project = project
+        self.graph = graph
+        # attrs[node id] -> {attribute: value}
+        self.attrs = attrs
+
+    @classmethod
+    def from_state(cls, data):
+        graph = graph_of(data)
+        systems = data.get("systems", {})
+        attrs = []
+        for name in graph.names:
+            s = systems.get(name)
+            if s is None:
+                attrs.append({"completeness": 0, "clarity": "", "files": 0, "insights": 0, "missing": True})
+                continue
+            attrs.append(
+                {
+                    "completeness": s.get("completeness", 0),
+                    "clarity": s.get("clarity", ""),
+                    "files": len(s.get("key_files", ())),
+                    "insights": len(s.get("insights", ())),
+                    "missing": False,
+                }
+            )
+        project = data.get("metadata", {}).get("project_name", "")
+        return cls(project, graph, attrs)
+
+    @property
+    def title(self):
+        return self.project or "architecture"
+
+    def nodes(self):
+        """(id, name, attrs) per system."""
+        return zip(range(len(self.graph)), self.graph.names, self.attrs)
+
+    def edges(self):
+        """(source id, target id, reasons) per distinct dependency."""
+        for (a, b), reasons in self.graph.reasons.items():
+            yield a, b, reasons
+
+
+def _text(value):
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class Reporter:
+    """Writes `lines(model)` to `<directory>/<filename>`."""
+
+    name = None
+    filename = None
+
+    def lines(self, model):
+        raise NotImplementedError
+
+    def write(self, model, directory):
+        """Render into `directory`; returns the paths written."""
+        path = os.path.join(directory, self.filename)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.writelines(self.lines(model))
+        return [path]
+
+
+def _dot(text):
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+class DotReporter(Reporter):
+    name = "dot"
+    filename = "graph.dot"
+
+    def lines(self, model):
+        yield f"digraph {_dot(model.title)} {{\n"
+        yield "  rankdir=LR;\n"
+        yield "  node [shape=box];\n"
+        for _, name, attrs in model.nodes():
+            style = ", style=dashed" if attrs["missing"] else ""
+            yield f"  {_dot(name)} [completeness={attrs['completeness']}{style}];\n"
+        names = model.graph.names
+        for a, b, reasons in model.edges():
+            label = f" [label={_dot('; '.join(reasons))}]" if reasons else ""
+            yield f"  {_dot(names[a])} -> {_dot(names[b])}{label};\n"
+        yield "}\n"
+
+
+class GraphMLReporter(Reporter):
+    name = "graphml"
+    filename = "graph.graphml"
+
+    _TYPES = {"completeness": "int", "clarity": "string", "files": "int", "insights": "int", "missing": "boolean"}
+
+    def lines(self, model):
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        yield '  <key id="name" for="node" attr.name="name" attr.type="string"/>\n'
+        for attr in ATTRIBUTES:
+            yield f'  <key id="{attr}" for="node" attr.name="{attr}" attr.type="{self._TYPES[attr]}"/>\n'
+        yield '  <key id="reason" for="edge" attr.name="reason" attr.type="string"/>\n'
+        yield f'  <graph id={quoteattr(model.title)} edgedefault="directed">\n'
+        for nid, name, attrs in model.nodes():
+            data = "".join(f'<data key="{attr}">{escape(_text(attrs[attr]))}</data>' for attr in ATTRIBUTES)
+            yield f'    <node id="n{nid}"><data key="name">{escape(name)}</data>{data}</node>\n'
+        for i, (a, b, reasons) in enumerate(model.edges()):
+            data = f'<data key="reason">{escape("; ".join(reasons))}</data>' if reasons else ""
+            yield f'    <edge id="e{i}" source="n{a}" target="n{b}">{data}</edge>\n'
+        yield "  </graph>\n"
+        yield "</graphml>\n"
+
+
+class JsonGraphReporter(Reporter):
+    """JSON Graph Format v2: nodes keyed by system name."""
+
+    name = "jgf"
+    filename = "graph.json"
+
+    def lines(self, model):
+        yield '{"graph": {"directed": true, "label": ' + json.dumps(model.title) + ', "nodes": {\n'
+        sep = ""
+        for _, name, attrs in model.nodes():
+            yield sep + json.dumps(name) + ": " + json.dumps({"label": name, "metadata": attrs})
+            sep = ",\n"
+        yield '\n}, "edges": [\n'
+        sep = ""
+        names = model.graph.names
+        for a, b, reasons in model.edges():
+            edge = {"source": names[a], "target": names[b], "relation": "depends_on"}
+            if reasons:
+                edge["metadata"] = {"reasons": reasons}
+            yield sep + json.dumps(edge)
+            sep = ",\n"
+        yield "\n]}}\n"
+
+
+class CsvReporter(Reporter):
+    """nodes.csv and edges.csv, with a header row each."""
+
+    name = "csv"
+
+    def write(self, model, directory):
+        nodes_path = os.path.join(directory, "nodes.csv")
+        edges_path = os.path.join(directory, "edges.csv")
+        with open(nodes_path, "w", encoding="utf-8", newline="") as f:
+            rows = csv.writer(f)
+            rows.writerow(("id", "name") + ATTRIBUTES)
+            rows.writerows(
+                (nid, name) + tuple(_text(attrs[a]) for a in ATTRIBUTES)
+                for nid, name, attrs in model.nodes()
+            )
+        with open(edges_path, "w", encoding="utf-8", newline="") as f:
+            rows = csv.writer(f)
+            rows.writerow(("source", "target", "reason"))
+            names = model.graph.names
+            rows.writerows((names[a], names[b], "; ".join(reasons)) for a, b, reasons in model.edges())
+        return [nodes_path, edges_path]
+
+
+class MermaidReporter(Reporter):
+    """One unsharded diagram; `arch_state graph` shards and simplifies."""
+
+    name = "mermaid"
+    filename = "graph.md"
+
+    def lines(self, model):
+        from . import mermaid
+
+        return mermaid.diagram(mermaid.view(model.graph))
+
+
+REPORTERS = {
+    r.name: r for r in (DotReporter(), GraphMLReporter(), JsonGraphReporter(), CsvReporter(), MermaidReporter())
+}
+
+
+def render(model, formats, directory, workers=None):
+    """Write each format into `directory`, concurrently.
+
+    Returns {format: [paths]}. Unknown formats raise ValueError before
+    anything is written. Repeated formats are written once: two writers
+    would race on the same files.
+    """
+    formats = list(dict.fromkeys(formats))
+    unknown = [f for f in formats if f not in REPORTERS]
+    if unknown:
+        raise ValueError(f"Unknown format(s): {', '.join(unknown)} (choose from {', '.join(REPORTERS)})")
+    os.makedirs(directory, exist_ok=True)
+    workers = workers or len(formats)
+    if workers <= 1 or len(formats) == 1:
+        return {f: REPORTERS[f].write(model, directory) for f in formats}
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {f: pool.submit(REPORTERS[f].write, model, directory) for f in formats}
+        return {f: future.result() for f, future in futures.items()}
@@ -1,5 +1,4 @@
 import os
-import statistics
 from ..core.constants import SIGNIFICANT_SIZE_KB, CLASSIFICATION_CONFIG
 
 class FileClassifier:
@@ -1,12 +1,14 @@
 import os
 import fnmatch
-from ..core.constants import IGNORE_DIRS, IGNORE_EXTS
+from ..core.constants import IGNORE_DIRS, IGNORE_EXTS, TOOL_FILES
 from .classifier import FileClassifier
 
 class FileScanner:
     def __init__(self):
         self.ignore_patterns = self.load_gitignore()
         self.classifier = FileClassifier()
+        # (size, mtime_ns) of the significant files found by the last scan
+        self.stats = {}
 
     def load_gitignore(self):
         """Parses .gitignore to augment IGNORE_DIRS"""
@@ -25,7 +27,7 @@ class FileScanner:
         return patterns
 
     def is_ignored(self, path, name):
-        if name in IGNORE_DIRS:
+        if name in IGNORE_DIRS or name in TOOL_FILES:
             return True
         if os.path.splitext(name)[1] in IGNORE_EXTS:
             return True
@@ -55,19 +57,21 @@ class FileScanner:
 
                 total += 1
                 try:
-                    size = os.path.getsize(path)
-                    valid_files.append((rel, size))
-                    self.classifier.size_samples.append(size)
+                    st = os.stat(path)
                 except OSError:
-                    pass
+                    continue
+                valid_files.append((rel, st.st_size, st.st_mtime_ns))
+                self.classifier.size_samples.append(st.st_size)
         
         # Pass 2: Classify with statistical context
         # Calculate threshold once after collecting all samples
         self.classifier._outlier_threshold = self.classifier.calculate_outlier_threshold()
         
-        for rel, size in valid_files:
+        self.stats = {}
+        for rel, size, mtime in valid_files:
             if self.classifier.is_significant(rel, size):
                 sig_total += 1
                 sig_paths.add(rel)
+                self.stats[rel] = (size, mtime)
                 
         return total, sig_total, sig_paths
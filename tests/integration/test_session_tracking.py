@@ -4,10 +4,12 @@ Integration tests for session tracking.
 import pytest
 import sys
 import os
+import json
+import shutil
 from unittest.mock import patch
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from src.arch_scribe.arch_state import StateManager
+from src.arch_scribe.arch_state import StateManager, STATE_FILE, SESSION_FILE
 
 class TestSessionLifecycle:
     """Test session start/end tracking."""
@@ -92,4 +94,64 @@ class TestStoppingCriteria:
         mgr.print_status()
         
         captured = capsys.readouterr()
-        assert "Gate B: Diminishing returns detected" in captured.out
\ No newline at end of file
+        assert "Gate B: Diminishing returns detected" in captured.out
+
+class TestSessionBaseline:
+    """Test compact session baselines and incremental deltas."""
+
+    @pytest.fixture
+    def mgr(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        m = StateManager()
+        m.init_project("BaselineTest")
+        m.add_system("Core")
+        m.map_files("Core", ["core.py"])
+        return m
+
+    def test_session_file_is_fingerprint(self, mgr):
+        """session-start writes a fingerprint, not a state dump."""
+        mgr.start_session()
+
+        with open(SESSION_FILE) as f:
+            baseline = json.load(f)
+        assert "metadata" not in baseline
+        assert baseline["systems"]["Core"]["files"] == 1
+        assert "files_hash" in baseline["systems"]["Core"]
+
+    def test_delta_survives_reload(self, mgr):
+        """Deltas are persisted, so session-end in a new process still works."""
+        mgr.start_session()
+        mgr.add_system("Api")
+        mgr.map_files("Api", ["api.py"])
+
+        reloaded = StateManager()
+        reloaded.end_session()
+
+        entry = reloaded.data["metadata"]["session_history"][-1]
+        assert entry["new_systems_found"] == 1
+        assert entry["new_files_mapped"] == 1
+        assert "active_session" not in reloaded.data["metadata"]
+
+    def test_files_already_mapped_not_counted(self, mgr):
+        """Mapping a file that another system owns is not a new file."""
+        mgr.start_session()
+        mgr.add_system("Api")
+        mgr.map_files("Api", ["core.py", "api.py"])
+        mgr.map_files("Api", ["api.py"])
+        mgr.end_session()
+
+        entry = mgr.data["metadata"]["session_history"][-1]
+        assert entry["new_files_mapped"] == 1
+
+    def test_legacy_full_dump_baseline(self, mgr):
+        """A .session_start written by older versions is still honoured."""
+        # Older versions dumped the whole state at session-start
+        shutil.copy(STATE_FILE, SESSION_FILE)
+        mgr.add_system("Api")
+        mgr.map_files("Api", ["api.py"])
+
+        mgr.end_session()
+
+        entry = mgr.data["metadata"]["session_history"][-1]
+        assert entry["new_systems_found"] == 1
+        assert entry["new_files_mapped"] == 1
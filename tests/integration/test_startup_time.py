@@ -0,0 +1,115 @@
+"""
+Integration tests for CLI startup cost (lazy imports).
+"""
+import pytest
+import os
+import sys
+import json
+import time
+import subprocess
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../src'))
+
+# Budgets are deliberately generous so slow CI machines don't flake; a
+# regression that eagerly imports the scanner or word lists still shows up
+# in the module checks below.
+IMPORT_BUDGET_US = 50_000
+STARTUP_BUDGET_S = 1.0
+
+HEAVY_MODULES = [
+    "arch_scribe.core.state_manager",
+    "arch_scribe.scanning.file_scanner",
+    "arch_scribe.config.insight_quality",
+]
+
+
+def run_python(code, cwd, *flags):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def parse_importtime(stderr):
+    """Return {module: cumulative_us} from `python -X importtime` output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestImportBudget:
+    """Test that importing the CLI stays cheap."""
+
+    def test_cli_import_skips_heavy_modules(self, temp_dir):
+        """Importing the entry point must not load scanner/metrics/word lists."""
+        result = run_python("import arch_scribe.arch_state", temp_dir, "-X", "importtime")
+        modules = parse_importtime(result.stderr)
+
+        assert "arch_scribe.arch_state" in modules
+        for heavy in HEAVY_MODULES:
+            assert heavy not in modules
+
+    def test_cli_import_within_budget(self, temp_dir):
+        """Cumulative import time of the entry point stays under budget."""
+        result = run_python("import arch_scribe.arch_state", temp_dir, "-X", "importtime")
+        modules = parse_importtime(result.stderr)
+
+        assert modules["arch_scribe.arch_state"] < IMPORT_BUDGET_US
+
+    def test_package_exports_resolve_lazily(self, temp_dir):
+        """`arch_scribe.StateManager` still works, but only when accessed."""
+        code = (
+            "import sys, arch_scribe\n"
+            "before = 'arch_scribe.core.state_manager' in sys.modules\n"
+            "arch_scribe.StateManager\n"
+            "after = 'arch_scribe.core.state_manager' in sys.modules\n"
+            "print(before, after)"
+        )
+        result = run_python(code, temp_dir)
+        assert result.stdout.split() == ["False", "True"]
+
+
+class TestCommandImports:
+    """Test that each command only loads what it uses."""
+
+    def _loaded_after(self, argv, cwd):
+        code = (
+            "import sys, json\n"
+            "from arch_scribe.arch_state import main\n"
+            f"sys.argv = ['arch_state'] + {argv!r}\n"
+            "main()\n"
+            "print(json.dumps(sorted(m for m in sys.modules if m.startswith('arch_scribe'))))"
+        )
+        result = run_python(code, cwd)
+        return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    def test_list_does_not_build_scanner(self, temp_dir):
+        """`list` reads state only; no scanner, no insight rules."""
+        run_python(
+            "import sys\n"
+            "from arch_scribe.arch_state import main\n"
+            "sys.argv = ['arch_state', 'init', 'Fast']\n"
+            "main()",
+            temp_dir,
+        )
+        loaded = self._loaded_after(["list"], temp_dir)
+
+        assert "arch_scribe.scanning.file_scanner" not in loaded
+        assert "arch_scribe.config.insight_quality" not in loaded
+
+    def test_help_startup_within_budget(self, temp_dir):
+        """A bare invocation prints help well within the startup budget."""
+        start = time.perf_counter()
+        run_python(
+            "import sys\n"
+            "from arch_scribe.arch_state import main\n"
+            "sys.argv = ['arch_state']\n"
+            "main()",
+            temp_dir,
+        )
+        assert time.perf_counter() - start < STARTUP_BUDGET_S
@@ -0,0 +1,108 @@
+import pytest
+import json
+from src.arch_scribe.metrics import audit
+from src.arch_scribe.metrics.quality_rules import OutcomeCache, pipeline
+from src.arch_scribe.metrics.insight_quality import (
+    MISSING_ACTION, MISSING_IMPACT, TOO_SHORT,
+)
+
+GOOD = (
+    "Caches session tokens using Redis with a sliding TTL window, "
+    "which reduces database load for every authenticated request today"
+)
+
+
+def _corpus(n):
+    texts = [GOOD, "Uses JWT", "The catalogs module is big", GOOD.replace("Caches", "Has")]
+    return [
+        {"system": f"S{i % 7}", "id": str(i), "text": texts[i % len(texts)] + f" {i}"}
+        for i in range(n)
+    ]
+
+
+class TestAudit:
+    def test_codes_per_record(self):
+        results = audit.audit(_corpus(4))
+        assert [r["codes"] for r in results] == [
+            [],
+            [TOO_SHORT, MISSING_ACTION, MISSING_IMPACT],
+            [TOO_SHORT, MISSING_ACTION, MISSING_IMPACT],
+            [MISSING_ACTION],
+        ]
+
+    def test_pool_identical_to_serial(self):
+        records = _corpus(audit.MIN_POOL_RECORDS * 2)
+        # Separate caches, so neither run can reuse the other's outcomes
+        pooled_cache, serial_cache = OutcomeCache(), OutcomeCache()
+        pooled = audit.audit(records, workers=3, store=pooled_cache)
+        serial = audit.audit(records, workers=1, store=serial_cache)
+
+        rules = pipeline("standard")
+        assert [r["codes"] for r in pooled] == [rules.codes(r["text"]) for r in records]
+        assert pooled == serial
+        assert len(pooled_cache.entries) == len(serial_cache.entries) == len(records)
+
+    def test_cached_outcomes_are_reused(self):
+        records = _corpus(3)
+        store = OutcomeCache()
+        store.put(OutcomeCache.key(records[0]["text"], "standard"), ["sentinel"])
+        assert audit.audit(records, store=store)[0]["codes"] == ["sentinel"]
+
+    def test_summary(self):
+        summary = audit.summarize(audit.audit(_corpus(8)))
+        assert summary["S0"] == {
+            "insights": 2,
+            "passed": 1,
+            "codes": {MISSING_ACTION: 1},
+            "pass_rate": 50.0,
+        }
+
+    def test_from_state(self):
+        data = {"systems": {"A": {"insights": ["x", "y"]}, "B": {"insights": []}}}
+        assert [r["id"] for r in audit.from_state(data)] == ["A#0", "A#1"]
+
+    def test_from_jsonl(self, temp_dir):
+        path = temp_dir / "corpus.jsonl"
+        path.write_text(
+            json.dumps({"text": GOOD, "system": "Auth", "id": "a1"}) + "\n"
+            + json.dumps("Uses JWT") + "\n"
+            + "\n"
+            + "{broken\n"
+        )
+        records = audit.from_jsonl(str(path))
+        results = audit.audit(records)
+        assert [(r["system"], r["id"]) for r in results] == [
+            ("Auth", "a1"), (audit.UNASSIGNED, "line 2"), (audit.UNASSIGNED, "line 4"),
+        ]
+        assert results[2]["codes"] == [audit.UNREADABLE]
+
+
+class TestAuditCommand:
+    def test_state_audit_output(self, temp_dir, monkeypatch, capsys):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        monkeypatch.chdir(temp_dir)
+        mgr = StateManager()
+        mgr.init_project("Audit")
+        mgr.add_system("Auth")
+        mgr.add_insight("Auth", GOOD, force=True)
+        mgr.add_insight("Auth", "Uses JWT", force=True)
+        capsys.readouterr()
+
+        results = mgr.audit_insights(out="audit.jsonl")
+        out = capsys.readouterr().out
+        assert "Auth#1" in out and "Auth#0" not in out
+        assert "50.0%" in out
+        with open("audit.jsonl") as f:
+            assert [json.loads(line) for line in f] == results
+
+    def test_corpus_audit_leaves_project_cache_alone(self, temp_dir, monkeypatch, capsys):
+        from src.arch_scribe.core.constants import QUALITY_CACHE_FILE
+        from src.arch_scribe.core.state_manager import StateManager
+
+        monkeypatch.chdir(temp_dir)
+        path = temp_dir / "corpus.jsonl"
+        path.write_text(json.dumps(GOOD) + "\n" + json.dumps("Uses JWT") + "\n")
+        results = StateManager().audit_insights(corpus=str(path))
+        assert [r["codes"] == [] for r in results] == [True, False]
+        assert not (temp_dir / QUALITY_CACHE_FILE).exists()
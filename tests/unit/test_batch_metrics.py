@@ -0,0 +1,59 @@
+import pytest
+from src.arch_scribe.core import models
+from src.arch_scribe.metrics import batch
+from src.arch_scribe.metrics.clarity import compute_clarity
+from src.arch_scribe.metrics.completeness import compute_completeness
+from src.arch_scribe.operations import stats_ops
+
+
+def _system(files, insights, deps):
+    clarity, completeness = batch.score(files, insights, deps)
+    return {
+        "key_files": [f"f{i}.py" for i in range(files)],
+        "insights": [f"insight {i}" for i in range(insights)],
+        "dependencies": [{"system": "X", "reason": ""}] * deps,
+        "clarity": clarity,
+        "completeness": completeness,
+    }
+
+
+def _scalar(sys):
+    sys = dict(sys, clarity=compute_clarity(sys), completeness=None)
+    return sys["clarity"], compute_completeness(sys)
+
+
+COUNTS = [(f, i, d) for f in range(14) for i in range(8) for d in (0, 2)]
+
+
+class TestBatchMetrics:
+    def test_score_matches_scalar_formulas(self):
+        for f, i, d in COUNTS:
+            assert batch.score(f, i, d) == _scalar(_system(f, i, d)), (f, i, d)
+
+    @pytest.mark.parametrize("use_numpy", [False, None])
+    def test_compute_columns(self, use_numpy):
+        files, insights, deps = zip(*COUNTS)
+        clarity, completeness = batch.compute(files, insights, deps, use_numpy)
+        expected = [batch.score(*c) for c in COUNTS]
+        assert [batch.CLARITY_LEVELS[c] for c in clarity] == [e[0] for e in expected]
+        assert completeness == [e[1] for e in expected]
+
+    def test_numpy_matches_pure_python(self):
+        pytest.importorskip("numpy")
+        files, insights, deps = zip(*COUNTS)
+        assert batch.compute(files, insights, deps, True) == batch.compute(files, insights, deps, False)
+
+    def test_recompute_op_updates_systems_and_progress(self):
+        data = models.hydrate(
+            {
+                "metadata": {},
+                "systems": {"A": _system(10, 5, 1), "B": _system(1, 0, 0)},
+                "progress": {},
+            }
+        )
+        data["systems"]["A"].completeness = 0  # stale
+        changed = stats_ops.recompute_metrics(data)
+        assert changed == ["A"]
+        assert data["systems"]["A"]["completeness"] == 100
+        assert data["progress"]["systems_complete"] == 1
+        assert stats_ops.verify_stats(data) == []
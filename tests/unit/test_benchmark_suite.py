@@ -0,0 +1,45 @@
+import contextlib
+import io
+import os
+
+from benchmarks.suite import STEPS, compare, run
+from benchmarks.synthetic_tree import generate, plan
+
+
+class TestSyntheticTree:
+    def test_plan_is_deterministic(self):
+        assert list(plan(500, seed=3)) == list(plan(500, seed=3))
+        assert list(plan(500, seed=3)) != list(plan(500, seed=4))
+
+    def test_depth_and_categories(self):
+        entries = list(plan(1000, depth=3, patterns=9, ignored=0.2, data=0.2))
+        assert len(entries) == 1000
+        assert all(path.count("/") == 4 for _, path, _ in entries)
+        assert {c for c, _, _ in entries} == {"source", "data", "gitignored", "vendor"}
+
+    def test_generate_matches_manifest(self, temp_dir):
+        manifest = generate(str(temp_dir), 300, seed=1)
+        assert sum(manifest["categories"].values()) == 300
+        assert manifest == {**generate(str(temp_dir / "again"), 300, seed=1),
+                            "generate_s": manifest["generate_s"]}
+        assert os.path.exists(temp_dir / ".gitignore")
+
+
+class TestSuite:
+    def test_small_run(self, temp_dir):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = run(400, systems=5, insights=2, directory=str(temp_dir))
+
+        assert set(result["timings_ms"]) == set(STEPS)
+        tree = result["tree"]["categories"]
+        # Gitignored and vendored files are never scanned
+        assert result["scanned"]["total"] <= tree["source"] + tree["data"]
+        assert result["insights"] > 0
+        assert result["state_bytes"] > 0
+
+    def test_compare_flags_slower_steps(self):
+        baseline = {"timings_ms": {"scan_files": 100.0, "load_state": 1.0}}
+        result = {"timings_ms": {"scan_files": 150.0, "load_state": 3.0, "save_state": 9.0}}
+        assert compare(result, baseline) == [
+            {"step": "scan_files", "baseline_ms": 100.0, "ms": 150.0, "ratio": 1.5}
+        ]
@@ -0,0 +1,68 @@
+import pytest
+from unittest.mock import patch
+from src.arch_scribe.core import changes, validation
+from src.arch_scribe.core.state_manager import StateManager
+from src.arch_scribe.metrics import batch
+
+
+@pytest.fixture
+def mgr(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+    manager = StateManager()
+    manager.init_project("Test")
+    for name in ("A", "B", "C"):
+        manager.add_system(name)
+    return manager
+
+
+def _validate(full=False):
+    # A fresh process-like manager, so only on-disk tracking is used
+    m = StateManager()
+    with patch.object(m.scanner, "scan_files", return_value=(0, 0, set())), \
+            patch.object(validation, "system_errors", wraps=validation.system_errors) as spy:
+        errors = m.validate_schema(full=full)
+    return errors, sorted(call.args[0] for call in spy.call_args_list)
+
+
+class TestChangeTracking:
+    def test_saves_stamp_changed_systems(self, mgr):
+        log = changes.ChangeLog.load()
+        assert set(log.changed) == {"A", "B", "C"}
+        assert mgr.data.dirty == set()
+
+    def test_validate_only_rechecks_changed(self, mgr):
+        first, checked = _validate()
+        assert checked == ["A", "B", "C"]
+
+        again, checked = _validate()
+        assert checked == [] and again == first
+
+        StateManager().update_system("B", desc="Handles billing")
+        errors, checked = _validate()
+        assert checked == ["B"]
+        assert "B: Missing or placeholder description" not in errors
+        assert "A: Missing or placeholder description" in errors
+
+    def test_full_rechecks_everything(self, mgr):
+        _validate()
+        _, checked = _validate(full=True)
+        assert checked == ["A", "B", "C"]
+
+    def test_dangling_dependency_rechecked_when_target_appears(self, mgr):
+        mgr.data["systems"]["A"].add_dependency("D", "calls")
+        mgr.data.dirty.add("A")
+        mgr.save_state()
+        errors, _ = _validate()
+        assert "A: References non-existent system 'D'" in errors
+
+        StateManager().add_system("D")
+        errors, checked = _validate()
+        assert checked == ["A", "D"]
+        assert not any("non-existent" in e for e in errors)
+
+    def test_recompute_only_changed_systems(self, mgr):
+        StateManager().recompute_metrics()
+        StateManager().map_files("C", ["c.py"])
+        with patch.object(batch, "recompute", wraps=batch.recompute) as spy:
+            StateManager().recompute_metrics()
+        assert list(spy.call_args.args[0]) == ["C"]
@@ -0,0 +1,95 @@
+import pytest
+from src.arch_scribe.core.dirtree import DirTree
+from src.arch_scribe.core.index import files_digest
+from src.arch_scribe.core.state_manager import StateManager
+
+FILES = [
+    "main.py",
+    "src/app.py",
+    "src/api/users.py",
+    "src/api/orders.py",
+    "src/api/v2/items.py",
+    "tests/test_app.py",
+]
+
+
+def _tree(mapped=()):
+    return DirTree.build(FILES, lambda p: p in mapped)
+
+
+class TestDirTree:
+    def test_direct_rows(self):
+        tree = _tree({"src/api/users.py"})
+        assert tree.rows() == [
+            (".", 0, 1),
+            ("src", 0, 1),
+            ("src/api", 1, 2),
+            ("src/api/v2", 0, 1),
+            ("tests", 0, 1),
+        ]
+
+    def test_subtree_rollup_by_depth(self):
+        tree = _tree({"src/api/users.py", "main.py"})
+        assert tree.rows(depth=1) == [(".", 2, 6), ("src", 1, 4), ("tests", 0, 1)]
+        assert tree.rows(depth=2, min_files=2) == [(".", 2, 6), ("src", 1, 4), ("src/api", 1, 3)]
+
+    def test_map_updates_ancestors_once(self):
+        tree = _tree()
+        tree.map(["src/api/v2/items.py", "src/api/v2/items.py", "not/significant.py"])
+        assert tree.rows(depth=3, min_files=1)[:4] == [
+            (".", 1, 6), ("src", 1, 4), ("src/api", 1, 3), ("src/api/v2", 1, 1),
+        ]
+        assert "src/api/v2/items.py" not in tree.unmapped
+
+    def test_round_trip(self, temp_dir):
+        path = str(temp_dir / "tree.json")
+        tree = _tree({"src/app.py"})
+        tree.snapshot_id = "abc"
+        tree.save("d7", path)
+        assert DirTree.load("d8", path=path) is None
+        assert DirTree.load("d7", "other", path) is None
+        loaded = DirTree.load("d7", "abc", path)
+        assert loaded.rows(depth=5) == tree.rows(depth=5)
+        loaded.map(["src/api/users.py"])
+        assert loaded.rows(depth=1)[1] == ("src", 2, 4)
+
+
+class TestCoverageFromSnapshot:
+    def test_mapping_updates_saved_tree_without_rescan(self, temp_dir, monkeypatch, capsys):
+        monkeypatch.chdir(temp_dir)
+        (temp_dir / "pkg").mkdir()
+        for name in ("a.py", "b.py"):
+            (temp_dir / "pkg" / name).write_text("x = 1\n" * 300)
+        StateManager().init_project("Tree")
+        StateManager().add_system("Core")
+        StateManager().print_coverage_detail(depth=1)
+
+        StateManager().map_files("Core", ["pkg/a.py"])
+        mgr = StateManager()
+        monkeypatch.setattr(mgr.scanner, "scan_files", pytest.fail)
+        # The stamp is read from the state, not rehashed from key_files
+        monkeypatch.setattr("src.arch_scribe.core.index._pair_hash", pytest.fail)
+        capsys.readouterr()
+        mgr.print_coverage_detail(depth=1)
+        assert "pkg" in capsys.readouterr().out
+        assert mgr.data.dirtree.rows(depth=1)[1] == ("pkg", 1, 2)
+        saved = DirTree.load(files_digest(mgr.data))
+        assert saved is not None and saved.rows(depth=1)[1] == ("pkg", 1, 2)
+
+    def test_tree_of_another_state_is_rebuilt(self, temp_dir, monkeypatch, capsys):
+        monkeypatch.chdir(temp_dir)
+        (temp_dir / "pkg").mkdir()
+        for name in ("a.py", "b.py"):
+            (temp_dir / "pkg" / name).write_text("x = 1\n" * 300)
+        StateManager().init_project("Tree")
+        StateManager().add_system("Core")
+        StateManager().map_files("Core", ["pkg/a.py"])
+        StateManager().print_coverage_detail(depth=1)
+
+        # Another branch's state: different mapping, and its own digest
+        mgr = StateManager()
+        mgr.data["systems"]["Core"]["key_files"][:] = ["pkg/b.py"]
+        del mgr.data["metadata"]["files_digest"]
+        rows, _ = mgr.coverage_report(depth=1)
+        assert ("pkg", 1, 2) in rows
+        assert "pkg/a.py" in mgr.data.dirtree.unmapped
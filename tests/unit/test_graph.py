@@ -0,0 +1,93 @@
+import pytest
+from src.arch_scribe.core.graph import Graph
+from src.arch_scribe.core.state_manager import StateManager
+
+
+def _graph(edges, extra=()):
+    systems = {}
+    for name in extra:
+        systems.setdefault(name, {"dependencies": []})
+    for a, b in edges:
+        systems.setdefault(a, {"dependencies": []})
+        systems.setdefault(b, {"dependencies": []})
+    for a, b in edges:
+        systems[a]["dependencies"].append({"system": b, "reason": "uses"})
+    return Graph.from_systems(systems)
+
+
+class TestGraph:
+    def test_duplicate_edges_collapse(self):
+        systems = {
+            "API": {
+                "dependencies": [
+                    {"system": "DB", "reason": "reads"},
+                    {"system": "DB", "reason": "writes"},
+                    {"system": "DB", "reason": "reads"},
+                    {"system": "Cache", "reason": ""},
+                ]
+            },
+            "DB": {"dependencies": []},
+        }
+        graph = Graph.from_systems(systems)
+        assert graph.edge_count == 2
+        assert graph.reasons[(graph.ids["API"], graph.ids["DB"])] == ["reads", "writes"]
+        assert graph.missing == {"Cache"}
+        assert graph.fan_in(graph.ids["DB"]) == 1
+        assert graph.fan_out(graph.ids["API"]) == 2
+
+    def test_cycles_and_self_loops(self):
+        graph = _graph([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D"), ("E", "E")])
+        assert graph.cycles() == [["A", "B", "C"], ["E"]]
+
+    def test_layers_put_dependencies_first(self):
+        graph = _graph([("UI", "API"), ("API", "DB"), ("API", "Auth"), ("Auth", "DB"), ("Jobs", "DB")])
+        assert graph.layers() == [["DB"], ["Auth", "Jobs"], ["API"], ["UI"]]
+
+    def test_cycle_members_share_a_layer(self):
+        graph = _graph([("A", "B"), ("B", "A"), ("B", "Core"), ("Top", "A")])
+        assert graph.layers() == [["Core"], ["A", "B"], ["Top"]]
+
+    def test_shortest_path(self):
+        graph = _graph([("A", "B"), ("B", "C"), ("C", "D"), ("A", "C")])
+        assert graph.shortest_path("A", "D") == ["A", "C", "D"]
+        assert graph.shortest_path("D", "A") is None
+        assert graph.shortest_path("A", "Nope") is None
+
+    def test_betweenness_on_a_chain(self):
+        graph = _graph([("A", "B"), ("B", "C"), ("C", "D")])
+        scores = graph.betweenness()
+        assert scores == {"A": 0.0, "B": 2.0, "C": 2.0, "D": 0.0}
+
+    def test_sampled_betweenness_is_scaled(self):
+        graph = _graph([("A", "Hub")] + [("Hub", f"L{i}") for i in range(8)])
+        exact = graph.betweenness()
+        assert exact["Hub"] == 8.0
+        sampled = graph.betweenness(samples=len(graph) - 1, seed=1)
+        assert max(sampled, key=sampled.get) == "Hub"
+
+    def test_deep_chain_does_not_recurse(self):
+        n = 50_000
+        graph = _graph([(f"S{i}", f"S{i + 1}") for i in range(n)])
+        assert len(graph.layers()) == n + 1
+        assert graph.cycles() == []
+
+
+class TestGraphStats:
+    def test_command_output(self, temp_dir, monkeypatch, capsys):
+        monkeypatch.chdir(temp_dir)
+        StateManager().init_project("Graph")
+        for name in ("API", "DB", "Auth"):
+            StateManager().add_system(name)
+        StateManager().add_dependency("API", "DB", "queries")
+        StateManager().add_dependency("API", "Auth", "checks tokens")
+        StateManager().add_dependency("Auth", "DB", "reads users")
+        capsys.readouterr()
+
+        StateManager().print_graph_stats()
+        out = capsys.readouterr().out
+        assert "Edges: 3" in out
+        assert "No dependency cycles" in out
+        assert "L2" in out
+
+        StateManager().print_graph_stats(path=("API", "DB"))
+        assert "API → DB" in capsys.readouterr().out
@@ -0,0 +1,148 @@
+import pytest
+import os
+import json
+from src.arch_scribe.core.index import FileIndex, files_digest, index_of
+from src.arch_scribe.core.constants import OWNERS_FILE
+from src.arch_scribe.core import models
+from src.arch_scribe.operations import system_ops
+
+
+def _systems():
+    return {
+        "Auth": {"key_files": ["src/auth/login.py", "./src/shared.py"]},
+        "API": {"key_files": ["src/api/routes.py", "src/shared.py"]},
+    }
+
+
+class TestFileIndex:
+    def test_build_and_lookup(self):
+        index = FileIndex.build(_systems())
+        assert index.owners_of("src/auth/login.py") == ["Auth"]
+        assert index.owners_of("./src/shared.py") == ["Auth", "API"]
+        assert index.owners_of("missing.py") == []
+        assert index.is_mapped("src/api/routes.py")
+
+    def test_add_is_idempotent(self):
+        index = FileIndex()
+        index.add("Core", ["a.py"])
+        index.dirty = False
+        index.add("Core", ["a.py"])
+        assert not index.dirty
+        index.add("Other", ["a.py"])
+        assert index.owners_of("a.py") == ["Core", "Other"]
+
+    def test_under_respects_directory_boundary(self):
+        index = FileIndex.build({
+            "A": {"key_files": ["src/auth/x.py", "src/auth/sub/y.py",
+                                "src/auth_old/z.py", "src/auth.py"]},
+        })
+        assert list(index.under("src/auth")) == ["src/auth/sub/y.py", "src/auth/x.py"]
+        assert list(index.under("./src/auth/")) == ["src/auth/sub/y.py", "src/auth/x.py"]
+        assert len(index.under(".")) == 4
+
+    def test_under_sees_later_additions(self):
+        index = FileIndex.build(_systems())
+        assert list(index.under("src/api")) == ["src/api/routes.py"]
+        index.add("API", ["src/api/views.py"])
+        assert list(index.under("src/api")) == ["src/api/routes.py", "src/api/views.py"]
+
+    def test_shared(self):
+        index = FileIndex.build(_systems())
+        assert index.shared() == {"src/shared.py": ["Auth", "API"]}
+
+
+class TestSidecar:
+    def test_load_requires_matching_stamp(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        FileIndex.build(_systems()).save("d1")
+
+        assert FileIndex.load("d1").owners_of("src/shared.py") == ["Auth", "API"]
+        assert FileIndex.load("d2") is None
+        assert FileIndex.load(None) is None
+
+    def test_digest_tracks_content(self):
+        data = {"metadata": {}, "systems": _systems()}
+        other = {"metadata": {}, "systems": {"Auth": {"key_files": ["x.py"]}}}
+        assert files_digest(data) == files_digest({"metadata": {}, "systems": _systems()})
+        assert files_digest(data) != files_digest(other)
+
+    def test_digest_kept_incrementally(self, monkeypatch):
+        data = {"metadata": {}, "systems": {"Auth": {"key_files": []}, "API": {"key_files": []}}}
+        system_ops.map_files(data, "Auth", ["a.py", "b.py"])
+        system_ops.map_files(data, "API", ["b.py"])
+        system_ops.map_files(data, "Auth", ["a.py"])  # already mapped: no change
+        stamp = files_digest(data)
+
+        # Read from metadata, not recomputed
+        with monkeypatch.context() as m:
+            m.setattr("src.arch_scribe.core.index._pair_hash", lambda *a: pytest.fail("rehashed"))
+            assert files_digest(data) == stamp
+        data["metadata"].clear()
+        assert files_digest(data) == stamp
+
+    def test_corrupted_sidecar_ignored(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        os.makedirs(os.path.dirname(OWNERS_FILE))
+        with open(OWNERS_FILE, "w") as f:
+            f.write("{broken")
+        assert FileIndex.load(1) is None
+
+    def test_index_of_state_is_cached(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        data = models.hydrate({"metadata": {}, "systems": _systems()})
+        index = index_of(data)
+        assert index is index_of(data)
+        assert index.dirty  # rebuilt, so it will be written on next save
+
+    def test_index_of_plain_dict_is_transient(self):
+        data = {"systems": _systems()}
+        assert index_of(data) is not index_of(data)
+
+
+class TestStateManagerIndex:
+    @pytest.fixture
+    def mgr(self, temp_dir, monkeypatch):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        monkeypatch.chdir(temp_dir)
+        mgr = StateManager()
+        mgr.init_project("Index")
+        mgr.add_system("Core")
+        mgr.add_system("Web")
+        return mgr
+
+    def test_map_updates_sidecar(self, mgr):
+        mgr.map_files("Core", ["a.py", "b.py"])
+        mgr.map_files("Web", ["b.py"])
+
+        with open(OWNERS_FILE) as f:
+            raw = json.load(f)
+        assert raw["files_digest"] == files_digest(mgr.data)
+        assert raw["owners"]["b.py"] == ["Core", "Web"]
+
+    def test_stale_sidecar_rebuilt(self, mgr):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        mgr.map_files("Core", ["a.py"])
+        # Written for another branch's state
+        other = {"metadata": {}, "systems": {"Core": {"key_files": ["bogus.py"]}}}
+        FileIndex({"bogus.py": ["Core"]}).save(files_digest(other))
+
+        fresh = StateManager()
+        assert index_of(fresh.data).owners_of("a.py") == ["Core"]
+        assert not index_of(fresh.data).is_mapped("bogus.py")
+
+    def test_owner_commands(self, mgr, capsys):
+        mgr.map_files("Core", ["src/a.py", "src/b.py"])
+        mgr.map_files("Web", ["src/b.py"])
+        capsys.readouterr()
+
+        mgr.print_owner("./src/b.py")
+        assert capsys.readouterr().out.split() == ["Core", "Web"]
+
+        mgr.print_owners(shared=True)
+        out = capsys.readouterr().out
+        assert "src/b.py" in out and "src/a.py" not in out
+
+        mgr.print_owner("nowhere.py")
+        assert "not mapped" in capsys.readouterr().out
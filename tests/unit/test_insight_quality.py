@@ -0,0 +1,61 @@
+import pytest
+import re
+from src.arch_scribe.metrics.insight_quality import check_insight, matcher, scan
+from src.arch_scribe.config.insight_quality import ACTION_VERBS, IMPACT_WORDS
+
+
+class TestMatcher:
+    def test_compiled_once(self):
+        assert matcher() is matcher()
+
+    @pytest.mark.parametrize("word", ACTION_VERBS)
+    def test_every_action_verb_matches_whole(self, word):
+        assert scan(f"It {word.upper()} things") == (True, False)
+
+    @pytest.mark.parametrize("word", IMPACT_WORDS)
+    def test_every_impact_word_matches_whole(self, word):
+        assert scan(f"It does, {word}.")[1]
+
+    def test_no_match_inside_words(self):
+        assert scan("Keeps product catalogs in sync") == (False, False)
+        assert scan("Applies rate-limits per client") == (True, False)
+        assert scan("Applies sublimits per client") == (False, False)
+        assert scan("Applies non-limits per client") == (False, False)
+
+    def test_phrase_whitespace_is_flexible(self):
+        assert scan("done so  that\nclients wait less")[1]
+
+    def test_agrees_with_reference_whole_word_search(self):
+        words = sorted(ACTION_VERBS)
+        for i, word in enumerate(words):
+            text = f"x{word} {words[i - 1]}y {word}-z"
+            expected = any(
+                re.search(r"(?<![\w-])" + re.escape(w) + r"(?![\w-])", text)
+                for w in ACTION_VERBS
+            )
+            assert scan(text)[0] == expected, text
+
+
+class TestCheckInsight:
+    def test_single_pass_messages(self):
+        errors = check_insight("Catalogs are stored")
+        assert errors[0] == "Too short (3 words, need 15+)"
+        assert "Missing [WHAT] - no clear action verb found" in errors
+        assert "Missing [WHY/IMPACT] - no consequence or benefit stated" in errors
+
+    def test_good_insight(self):
+        text = (
+            "Caches session tokens using Redis with a sliding TTL window, "
+            "which reduces database load for every authenticated request today"
+        )
+        assert check_insight(text) == []
+
+
+class TestBenchmark:
+    def test_small_run(self):
+        from benchmarks.insight_quality import run
+
+        result = run(300)
+        assert result["insights"] == 300
+        assert result["compiled_per_s"] > 0
+        assert result["differing_verdicts"] >= 0
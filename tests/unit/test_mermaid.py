@@ -0,0 +1,65 @@
+import io
+
+from src.arch_scribe.core.graph import Graph
+from src.arch_scribe.reporting import mermaid
+
+
+def _graph(edges):
+    systems = {}
+    for a, b, *reason in edges:
+        systems.setdefault(a, {"dependencies": []})
+        systems.setdefault(b, {"dependencies": []})
+        systems[a]["dependencies"].append({"system": b, "reason": reason[0] if reason else "uses"})
+    return Graph.from_systems(systems)
+
+
+def _render(graph, **kwargs):
+    out = io.StringIO()
+    mermaid.export(graph, out, **kwargs)
+    return out.getvalue()
+
+
+class TestMermaid:
+    def test_repeated_deps_draw_once(self):
+        text = _render(_graph([("Auth", "DB", "Stores users"), ("Auth", "DB", "Stores users"), ("Auth", "DB", "Audit")]))
+        assert text.count("-->") == 1
+        assert "Auth -->|Stores users; Audit| DB" in text
+        assert text.startswith("```mermaid\ngraph TD\n")
+
+    def test_ids_are_unique_and_safe(self):
+        text = _render(_graph([("Data Layer", "Data_Layer"), ("end", "Data Layer")]))
+        assert 'Data_Layer["Data Layer"]' in text
+        assert 'Data_Layer_2["Data_Layer"]' in text
+        assert 'end_["end"]' in text
+
+    def test_collapse_cycles(self):
+        graph = _graph([("A", "B"), ("B", "C"), ("C", "A"), ("C", "Core")])
+        v = mermaid.view(graph, collapse_cycles=True)
+        assert len(v) == 2
+        assert list(v.edges.values()) == ["uses"]
+        assert "🔁 A, B, C (3)" in v.labels
+
+    def test_collapse_leaves(self):
+        edges = [(f"Client{i}", "API") for i in range(5)] + [("API", "DB"), ("DB", "Disk")]
+        v = mermaid.view(_graph(edges), collapse_leaves=True)
+        # Five clients fold into one node; DB and Disk are a chain, kept
+        assert len(v) == 4
+        assert "5 systems: Client0, Client1, Client2 +2 more" in v.labels
+        assert "5 deps" in v.edges.values()
+
+    def test_shards_bound_size_and_cover_every_node(self):
+        edges = [(f"S{i}", f"S{(i * 7 + 3) % 60}") for i in range(60)]
+        v = mermaid.view(_graph(edges))
+        parts = mermaid.shards(v, max_nodes=10)
+        assert all(len(p) <= 10 for p in parts)
+        assert sorted(n for p in parts for n in p) == list(range(len(v)))
+
+    def test_sharded_export_writes_index_and_links(self, temp_dir):
+        edges = [(f"S{i}", f"S{i + 1}") for i in range(25)]
+        written = mermaid.export(_graph(edges), directory=str(temp_dir), max_nodes=10)
+        assert written == 3
+        index = (temp_dir / "index.md").read_text()
+        assert "shard_1 -->|1 deps| shard_2" in index or "shard_2 -->|1 deps| shard_1" in index
+        assert "(shard-003.md)" in index
+        shard = (temp_dir / "shard-001.md").read_text()
+        assert "ext_" in shard and 'click ext_' in shard
@@ -0,0 +1,139 @@
+import pytest
+import io
+import os
+import json
+import shutil
+from pathlib import Path
+from src.arch_scribe.io import migrations
+from src.arch_scribe.core.constants import (
+    DEFAULT_STATE, MIGRATION_BACKUP_DIR, SCHEMA_VERSION, STATE_FILE,
+)
+
+FIXTURES = Path(__file__).parent.parent / "fixtures" / "state_files"
+
+
+@pytest.fixture
+def project(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+    return temp_dir
+
+
+def _install(name):
+    shutil.copy(FIXTURES / name, STATE_FILE)
+
+
+def _load():
+    with open(STATE_FILE) as f:
+        return json.load(f)
+
+
+class TestPlan:
+    def test_plan_chains_steps(self):
+        assert [s.target for s in migrations.plan(None)] == ["2.2", SCHEMA_VERSION]
+        assert [s.target for s in migrations.plan("2.2")] == [SCHEMA_VERSION]
+        assert migrations.plan(SCHEMA_VERSION) == []
+
+    def test_unknown_version_left_alone(self):
+        data = {"schema_version": "9.0", "metadata": {}}
+        assert migrations.migrate(data) == []
+        assert data == {"schema_version": "9.0", "metadata": {}}
+
+
+class TestMigrate:
+    def test_fills_missing_sections(self):
+        with open(FIXTURES / "partial_state.json") as f:
+            data = json.load(f)
+        migrations.migrate(data)
+
+        meta = data["metadata"]
+        assert data["schema_version"] == SCHEMA_VERSION
+        assert meta["session_history"] == []
+        assert meta["scan_stats"] == DEFAULT_STATE["metadata"]["scan_stats"]
+        assert meta["total_sessions"] == 2  # existing values kept
+        auth = data["systems"]["Auth System"]
+        assert auth["dependencies"] == [] and auth["clarity"] == "low"
+        assert data["progress"]["systems_identified"] == 0
+
+    def test_normalizes_legacy_shapes(self):
+        data = {
+            "metadata": {},
+            "systems": {"A": {"key_files": ["a.py", "a.py"], "dependencies": ["B"]}},
+        }
+        migrations.migrate(data)
+        assert data["systems"]["A"]["key_files"] == ["a.py"]
+        assert data["systems"]["A"]["dependencies"] == [{"system": "B", "reason": ""}]
+
+    def test_idempotent(self):
+        with open(FIXTURES / "partial_state.json") as f:
+            data = json.load(f)
+        migrations.migrate(data)
+        snapshot = json.dumps(data)
+        assert migrations.migrate(data) == []
+        assert json.dumps(data) == snapshot
+
+
+class TestMigrateFile:
+    @pytest.mark.parametrize("fixture", ["partial_state.json", "empty_state.json", "complete_state.json"])
+    def test_file_matches_in_memory_migration(self, project, fixture):
+        _install(fixture)
+        with open(STATE_FILE) as f:
+            expected = json.load(f)
+        migrations.migrate(expected)
+
+        assert migrations.migrate_file(STATE_FILE) == ("2.2", SCHEMA_VERSION)
+        assert _load() == expected
+        with open(STATE_FILE) as f:
+            assert f.read() == json.dumps(expected, indent=2)
+        assert os.path.exists(os.path.join(MIGRATION_BACKUP_DIR, "architecture.v2.2.json"))
+
+    def test_second_run_is_noop(self, project):
+        _install("partial_state.json")
+        migrations.migrate_file(STATE_FILE)
+        before = _load()
+        assert migrations.migrate_file(STATE_FILE) is None
+        assert _load() == before
+
+    def test_corrupted_file_raises(self, project):
+        with open(STATE_FILE, "w") as f:
+            f.write('{"schema_version": "2.2", "systems": {"A": {"x": }}')
+        with pytest.raises(json.JSONDecodeError):
+            migrations.migrate_file(STATE_FILE)
+        assert not os.path.exists(STATE_FILE + ".migrating")
+
+    def test_version_found_after_systems(self, project):
+        systems = {f"S{i}": {"description": "x" * 100} for i in range(100)}
+        with open(STATE_FILE, "w") as f:
+            json.dump({"systems": systems, "schema_version": "2.2"}, f)
+        assert migrations.detect_version(STATE_FILE) == "2.2"
+        migrations.migrate_file(STATE_FILE)
+        data = _load()
+        assert list(data)[0] == "schema_version"
+        assert data["systems"]["S99"]["completeness"] == 0
+
+
+class TestReader:
+    def test_small_chunks(self):
+        text = json.dumps({"a": 12345678, "systems": {"x": [1, 2.5, "s"], "y": None}, "z": "é"})
+        reader = migrations._Reader(io.StringIO(text), chunk=3)
+        out = {}
+        for key in reader.members():
+            if key == "systems":
+                out[key] = {name: reader.value() for name in reader.members()}
+            else:
+                out[key] = reader.value()
+        reader.end()
+        assert out == json.loads(text)
+
+
+class TestAutoUpgrade:
+    def test_load_state_migrates(self, project, capsys):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        _install("partial_state.json")
+        mgr = StateManager()
+        assert mgr.data["schema_version"] == SCHEMA_VERSION
+        assert "Migrated" in capsys.readouterr().out
+        assert _load()["schema_version"] == SCHEMA_VERSION
+
+        StateManager()
+        assert "Migrated" not in capsys.readouterr().out
@@ -0,0 +1,182 @@
+import pytest
+import random
+from src.arch_scribe.core import minhash, models
+from src.arch_scribe.core.constants import MINHASH_FILE
+from src.arch_scribe.operations import insight_ops
+
+VOCAB = [f"w{i}" for i in range(400)]
+
+
+def _text(rng, n=15):
+    return " ".join(rng.sample(VOCAB, n))
+
+
+def _state(systems):
+    return models.hydrate({
+        "metadata": {},
+        "progress": {},
+        "systems": {name: {"insights": list(ins)} for name, ins in systems.items()},
+    })
+
+
+class TestSignatures:
+    def test_deterministic(self):
+        words = frozenset("uses redis for caching".split())
+        assert minhash.signature(words) == minhash.signature(set(words))
+        assert len(minhash.signature(words)) == minhash.NUM_PERM
+        assert minhash.signature(frozenset()) is None
+
+    def test_near_duplicates_are_always_candidates(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            base = rng.sample(VOCAB, 20)
+            variant = base[:17] + rng.sample(VOCAB, 3)  # overlap >= 0.85
+            index = minhash.MinHashIndex()
+            index.add("A", 0, " ".join(base))
+            assert insight_ops.similar_text(" ".join(base), " ".join(variant)) == (
+                len(set(base) & set(variant)) / 20 > 0.8
+            )
+            if insight_ops.similar_text(" ".join(base), " ".join(variant)):
+                assert index.candidates(" ".join(variant)) == [("A", 0)]
+
+    def test_unrelated_text_rarely_candidate(self):
+        rng = random.Random(3)
+        index = minhash.MinHashIndex.build({"A": {"insights": [_text(rng) for _ in range(500)]}})
+        assert len(index.candidates(_text(rng))) < 10
+
+
+class TestSimilarity:
+    def test_same_verdicts_as_pairwise(self):
+        rng = random.Random(11)
+        corpus = [_text(rng) for _ in range(200)]
+        data = _state({"A": corpus})
+        plain = {"systems": {"A": {"insights": corpus}}}
+        for _ in range(100):
+            probe = rng.choice(corpus).split()
+            probe = " ".join(probe[:13] + rng.sample(VOCAB, rng.randint(1, 4)))
+            assert insight_ops.has_similar(data, "A", probe) == insight_ops.has_similar(plain, "A", probe)
+
+    def test_check_is_sublinear(self, monkeypatch):
+        rng = random.Random(5)
+        data = _state({"A": [_text(rng) for _ in range(1000)]})
+        minhash.minhash_of(data)
+        calls = []
+        real = insight_ops.similar_words
+        monkeypatch.setattr(insight_ops, "similar_words", lambda *a: calls.append(1) or real(*a))
+        insight_ops.has_similar(data, "A", _text(rng))
+        assert len(calls) < 100
+
+    def test_add_insight_updates_index(self):
+        data = _state({"A": [], "B": []})
+        text = "Caches session tokens in redis which reduces database load considerably"
+        assert insight_ops.add_insight(data, "A", text)
+        assert not insight_ops.add_insight(data, "A", text + " now")
+        assert insight_ops.add_insight(data, "B", text)
+        assert insight_ops.find_similar(data, text) == [("A", 0), ("B", 0)]
+        stamp = data["metadata"].pop("insights_digest")
+        assert minhash.insights_digest(data) == stamp
+
+
+class TestClusters:
+    def test_clusters_across_systems(self):
+        a = "Validates tokens using JWT signatures which prevents forged sessions reaching handlers"
+        data = _state({
+            "Auth": [a, "Stores users in postgres"],
+            "API": ["Routes requests by path prefix", a.replace("handlers", "routes")],
+            "Web": [a],
+        })
+        assert insight_ops.duplicate_clusters(data) == [[("Auth", 0), ("API", 1), ("Web", 0)]]
+
+    def test_low_threshold_is_exhaustive(self):
+        data = _state({"A": ["one two three four"], "B": ["one two five six"]})
+        assert insight_ops.duplicate_clusters(data, threshold=0.4) == [[("A", 0), ("B", 0)]]
+        assert insight_ops.duplicate_clusters(data) == []
+
+
+class TestSidecar:
+    def test_persisted_and_checked(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        systems = {"A": {"insights": ["alpha beta gamma", "delta"]}}
+        index = minhash.MinHashIndex.build(systems)
+        index.save("s1")
+
+        loaded = minhash.MinHashIndex.load(systems, "s1")
+        assert loaded.keys == index.keys
+        assert loaded.bands == index.bands
+        assert not loaded.dirty
+        assert loaded.candidates("alpha beta gamma") == [("A", 0)]
+
+    def test_foreign_sidecar_is_repaired(self, temp_dir, monkeypatch):
+        """A sidecar stamped for another state."""
+        monkeypatch.chdir(temp_dir)
+        minhash.MinHashIndex.build(
+            {"A": {"insights": ["alpha beta gamma", "delta", "epsilon zeta"]}}
+        ).save("other")
+
+        systems = {"A": {"insights": ["alpha beta gamma", "theta iota"]}}
+        loaded = minhash.MinHashIndex.load(systems, "mine")
+        assert sorted(loaded.keys) == [("A", 0), ("A", 1)]
+        assert loaded.candidates("theta iota") == [("A", 1)]
+        assert loaded.candidates("epsilon zeta") == []
+        assert loaded.rewrite
+
+    def test_find_similar_after_state_swap(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        text = "Caches session tokens in redis which reduces database load considerably"
+        big = _state({"A": [f"note {i} {text}" for i in range(5)]})
+        minhash.minhash_of(big).save(minhash.insights_digest(big))
+
+        small = _state({"A": [text]})
+        assert insight_ops.find_similar(small, f"note 4 {text}") == [("A", 0)]
+
+    def test_stamped_sidecar_is_not_rehashed(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        rng = random.Random(2)
+        data = _state({"A": [_text(rng) for _ in range(300)]})
+        minhash.minhash_of(data).save(minhash.insights_digest(data))
+        size = (temp_dir / MINHASH_FILE).stat().st_size
+
+        fresh = _state({"A": list(data["systems"]["A"]["insights"])})
+        signed, digested = [], []
+        keys_for, text_digest = minhash._keys_for, minhash.text_digest
+        with monkeypatch.context() as m:
+            m.setattr(minhash, "_keys_for", lambda t: signed.append(t) or keys_for(t))
+            m.setattr(minhash, "text_digest", lambda t: digested.append(t) or text_digest(t))
+            assert insight_ops.add_insight(fresh, "A", "delta epsilon")
+        # The probe and the new insight, nothing already in the sidecar
+        assert signed == ["delta epsilon", "delta epsilon"]
+        assert digested == ["delta epsilon"]
+        fresh.minhash.save(minhash.insights_digest(fresh))
+
+        assert (temp_dir / MINHASH_FILE).stat().st_size > size
+        loaded = minhash.MinHashIndex.load(fresh["systems"], minhash.insights_digest(fresh))
+        assert len(loaded) == 301 and not loaded.dirty
+        assert loaded.candidates("delta epsilon") == [("A", 300)]
+
+    def test_stale_stamp_after_torn_append(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        data = _state({"A": ["alpha beta gamma"]})
+        minhash.minhash_of(data).save(minhash.insights_digest(data))
+        with open(temp_dir / MINHASH_FILE, "a") as f:
+            f.write('["A", 1, "00')
+        insight_ops.add_insight(data, "A", "delta epsilon")  # never saved
+        loaded = minhash.MinHashIndex.load(data["systems"], minhash.insights_digest(data))
+        assert loaded.keys == [("A", 0), ("A", 1)] and loaded.rewrite
+
+    def test_state_manager_saves_sidecar(self, temp_dir, monkeypatch, capsys):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        monkeypatch.chdir(temp_dir)
+        mgr = StateManager()
+        mgr.init_project("Dedupe")
+        mgr.add_system("Auth")
+        mgr.add_system("API")
+        text = "Validates tokens using JWT signatures which prevents forged sessions reaching handlers"
+        mgr.add_insight("Auth", text, force=True)
+        mgr.add_insight("API", text, force=True)
+        assert "also recorded in: Auth" in capsys.readouterr().out
+
+        fresh = StateManager()
+        stamp = minhash.insights_digest(fresh.data)
+        assert not minhash.MinHashIndex.load(fresh.data["systems"], stamp).dirty
+        assert fresh.print_duplicates() == [[("Auth", 0), ("API", 0)]]
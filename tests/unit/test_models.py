@@ -0,0 +1,124 @@
+import pytest
+import json
+from src.arch_scribe.core import models
+from src.arch_scribe.core.models import System, Dependency, Insight, SessionRecord
+
+
+FULL_SYSTEM = {
+    "description": "Handles authentication",
+    "completeness": 69,
+    "clarity": "medium",
+    "key_files": ["src/auth/login.py", "src/auth/tokens.py"],
+    "dependencies": [{"system": "Core", "reason": "Uses Redis"}],
+    "insights": ["Implements JWT auth, which enables stateless checks"],
+    "complexities": ["Middleware order is implicit"],
+    "owner_notes": {"custom": True},
+}
+
+
+class TestRoundTrip:
+    """Test lossless conversion to and from the JSON schema."""
+
+    def test_system_round_trip(self):
+        sys = System.from_json(json.loads(json.dumps(FULL_SYSTEM)))
+        assert sys.to_json() == FULL_SYSTEM
+
+    def test_state_round_trip_through_json(self):
+        state = {
+            "metadata": {
+                "session_history": [{
+                    "session_id": 1, "timestamp": "t", "new_systems_found": 1,
+                    "new_files_mapped": 2, "insights_added": 3,
+                }],
+            },
+            "systems": {"Auth": dict(FULL_SYSTEM)},
+        }
+        original = json.dumps(state, sort_keys=True)
+        hydrated = models.hydrate(json.loads(original))
+
+        assert isinstance(hydrated["systems"]["Auth"], System)
+        assert isinstance(hydrated["metadata"]["session_history"][0], SessionRecord)
+        assert json.dumps(hydrated, sort_keys=True, default=models.to_json) == original
+
+    def test_partial_system_gets_defaults(self):
+        sys = System.from_json({"key_files": ["a.py"]})
+        assert sys.description == "TODO"
+        assert sys.insights == []
+        assert sys.to_json()["key_files"] == ["a.py"]
+
+
+class TestMappingCompatibility:
+    """Models still read like the dicts they replace."""
+
+    def test_system_item_access(self):
+        sys = System.from_json(FULL_SYSTEM)
+        assert sys["description"] == "Handles authentication"
+        assert sys.get("missing", 0) == 0
+        assert sys["dependencies"][0]["system"] == "Core"
+        assert sys["owner_notes"] == {"custom": True}
+
+    def test_system_item_assignment(self):
+        sys = System()
+        sys["description"] = "New"
+        sys["flag"] = 1
+        assert sys.description == "New"
+        assert sys.to_json()["flag"] == 1
+
+    def test_models_are_slotted(self):
+        for obj in (System(), Dependency("A"), Insight("x"), SessionRecord.from_json({})):
+            assert not hasattr(obj, "__dict__")
+
+
+class TestSystemBehaviour:
+    """Test set-backed membership and cached metrics."""
+
+    def test_add_files_keeps_order_and_dedupes(self):
+        sys = System()
+        assert sys.add_files(["b.py", "a.py", "b.py"]) == ["b.py", "a.py"]
+        assert sys.add_files(["a.py", "c.py"]) == ["c.py"]
+        assert sys.key_files == ["b.py", "a.py", "c.py"]
+        assert sys.has_file("c.py")
+
+    def test_legacy_duplicates_dropped_on_first_use(self):
+        sys = System.from_json({"key_files": ["a.py", "a.py", "b.py"]})
+        assert sys.has_file("b.py")
+        assert sys.key_files == ["a.py", "b.py"]
+
+    def test_membership_tracks_direct_list_edits(self):
+        sys = System()
+        sys.add_files(["a.py"])
+        sys.key_files.append("b.py")
+        assert sys.has_file("b.py")
+
+    def test_refresh_metrics(self):
+        sys = System()
+        sys.add_files([f"f{i}.py" for i in range(10)])
+        sys.insights.extend(f"insight {i}" for i in range(5))
+        sys.add_dependency("Core", "reason")
+        sys.refresh_metrics()
+        assert sys.clarity == "high"
+        assert sys.completeness == 100
+
+    def test_insight_words_cached_incrementally(self):
+        sys = System()
+        sys.insights.append("Alpha beta")
+        first = sys.insight_words()
+        sys.insights.append("Gamma")
+        words = sys.insight_words()
+        assert words is first
+        assert words == [frozenset({"alpha", "beta"}), frozenset({"gamma"})]
+
+    def test_system_helper_converts_in_place(self):
+        data = {"systems": {"A": {"key_files": []}}}
+        sys = models.system(data, "A")
+        assert isinstance(sys, System)
+        assert data["systems"]["A"] is sys
+        assert models.system(data, "missing") is None
+
+
+class TestInsight:
+    def test_insight_compares_to_text(self):
+        ins = Insight("Caches tokens", system="Auth")
+        assert ins == "Caches tokens"
+        assert ins.words == frozenset({"caches", "tokens"})
+        assert ins.to_json() == "Caches tokens"
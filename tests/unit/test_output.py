@@ -0,0 +1,234 @@
+import io
+import json
+
+import pytest
+from src.arch_scribe.cli.commands import run
+from src.arch_scribe.cli.output import Writer, clean, emit
+
+
+@pytest.fixture
+def project(temp_dir, monkeypatch, capsys):
+    monkeypatch.chdir(temp_dir)
+    (temp_dir / "pkg").mkdir()
+    for name in ("a.py", "b.py"):
+        (temp_dir / "pkg" / name).write_text("x = 1\n" * 300)
+    run(["init", "Machine"])
+    run(["add", "Core"])
+    run(["add", "Api"])
+    run(["map", "Core", "pkg/a.py"])
+    capsys.readouterr()
+    return temp_dir
+
+
+def _lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+class TestWriter:
+    def test_buffers_until_flush(self):
+        stream = io.StringIO()
+        writer = Writer(stream)
+        writer.record({"a": 1})
+        assert stream.getvalue() == ""
+        writer.flush()
+        assert stream.getvalue() == '{"a":1}\n'
+
+    def test_flushes_in_chunks(self):
+        stream = io.StringIO()
+        writer = Writer(stream)
+        for i in range(Writer.CHUNK // 8):
+            writer.record({"i": i})
+        assert stream.getvalue()
+
+    def test_emit_jsonl_streams_items(self):
+        stream = io.StringIO()
+        emit("jsonl", "list", {"items": iter([{"n": 1}, {"n": 2}])}, Writer(stream))
+        lines = stream.getvalue().splitlines()
+        assert json.loads(lines[0]) == {"command": "list", "ok": True}
+        assert [json.loads(l) for l in lines[1:]] == [{"n": 1}, {"n": 2}]
+
+    def test_clean_strips_colors_only(self):
+        assert clean("\n\x1b[92m✅ Mapped 1 files\x1b[0m\n  • item\n") == ["✅ Mapped 1 files", "• item"]
+
+
+class TestFormats:
+    def test_list_json(self, project, capsys):
+        run(["--format", "json", "list"])
+        (result,) = _lines(capsys)
+        assert result["command"] == "list" and result["ok"]
+        assert [s["name"] for s in result["items"]] == ["Core", "Api"]
+
+    def test_list_jsonl_after_subcommand(self, project, capsys):
+        run(["list", "--format", "jsonl"])
+        head, *items = _lines(capsys)
+        assert head == {"command": "list", "ok": True}
+        assert items[0]["files"] == 1
+
+    def test_status_json(self, project, capsys):
+        run(["--format", "json", "status"])
+        (result,) = _lines(capsys)
+        assert result["mapped"] == 1 and result["significant"] == 2
+        assert result["gate_a"] is False
+
+    def test_coverage_jsonl(self, project, capsys):
+        run(["--format", "jsonl", "coverage"])
+        head, *items = _lines(capsys)
+        assert head["command"] == "coverage"
+        assert {"type": "dir", "dir": "pkg", "mapped": 1, "total": 2} in items
+        assert items[-1]["type"] == "unmapped" and items[-1]["file"] == "pkg/b.py"
+
+    def test_validate_reports_errors(self, project, capsys):
+        run(["--format", "json", "validate"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False
+        assert "Core: No insights recorded" in result["errors"]
+
+    def test_mutation_messages(self, project, capsys):
+        run(["--format", "json", "add", "Core"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False
+        assert result["messages"] == ["⚠️  System 'Core' already exists."]
+
+        run(["--format", "json", "add", "Web"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is True
+
+
+class TestPayloads:
+    """Commands with real output return it as data, not scraped text."""
+
+    def test_graph_mermaid(self, project, capsys):
+        run(["dep", "Core", "Api", "serves requests"])
+        capsys.readouterr()
+        run(["--format", "json", "graph"])
+        (result,) = _lines(capsys)
+        assert result["diagrams"] == 1
+        assert result["mermaid"].startswith("```mermaid\ngraph TD\n")
+        assert '  Core -->|serves requests| Api\n' in result["mermaid"]
+        assert "messages" not in result
+
+    def test_graph_out(self, project, capsys):
+        run(["--format", "json", "graph", "--out", "diagrams"])
+        (result,) = _lines(capsys)
+        assert result["files"] == ["diagrams/index.md"]
+        assert (project / "diagrams" / "index.md").exists()
+
+    def test_audit_codes(self, project, capsys):
+        run(["insight", "Core", "does stuff", "--yes"])
+        capsys.readouterr()
+        run(["--format", "jsonl", "audit"])
+        head, *items = _lines(capsys)
+        assert head["systems"]["Core"]["insights"] == 1
+        assert items[0]["system"] == "Core" and items[0]["codes"]
+
+    def test_dedupe_clusters(self, project, capsys):
+        text = "Implements token refresh using a Redis cache, which reduces database load on every request"
+        run(["insight", "Core", text, "--yes"])
+        run(["insight", "Api", text + " path", "--yes"])
+        capsys.readouterr()
+        run(["--format", "json", "dedupe"])
+        (result,) = _lines(capsys)
+        (cluster,) = result["items"]
+        assert [(e["system"], e["position"]) for e in cluster["insights"]] == [("Core", 0), ("Api", 0)]
+
+    def test_recompute_and_export(self, project, capsys):
+        run(["--format", "json", "recompute", "--full"])
+        (result,) = _lines(capsys)
+        assert isinstance(result["changed"], list)
+
+        run(["--format", "json", "export", "--format", "csv", "--out", "out"])
+        (result,) = _lines(capsys)
+        assert result["files"] == {"csv": ["out/nodes.csv", "out/edges.csv"]}
+
+    def test_session_end(self, project, capsys):
+        run(["--format", "json", "session-end"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False
+
+        run(["--format", "json", "session-start"])
+        (result,) = _lines(capsys)
+        assert result == {"command": "session-start", "ok": True, "session": 1}
+        run(["add", "Web"])
+        capsys.readouterr()
+        run(["--format", "json", "session-end"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is True
+        assert result["session"]["session_id"] == 1
+        assert result["session"]["new_systems_found"] == 1
+
+
+class TestNonInteractive:
+    """json/jsonl never prompt: confirmations are declined unless --yes."""
+
+    @pytest.fixture(autouse=True)
+    def no_stdin(self, monkeypatch):
+        def prompt(*_):
+            raise AssertionError("prompted in machine mode")
+
+        monkeypatch.setattr("builtins.input", prompt)
+
+    def _systems(self):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        return StateManager().data["systems"]
+
+    def test_dep_missing_target(self, project, capsys):
+        run(["--format", "json", "dep", "Core", "Db", "stores rows"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False
+        assert "Db" not in self._systems()
+        assert self._systems()["Core"]["dependencies"] == []
+
+        run(["--format", "json", "dep", "Core", "Db", "stores rows", "--yes"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is True
+        assert [d["system"] for d in self._systems()["Core"]["dependencies"]] == ["Db"]
+
+    def test_insight_failing_quality(self, project, capsys):
+        run(["--format", "jsonl", "insight", "Core", "does stuff"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False
+        assert self._systems()["Core"]["insights"] == []
+
+        run(["--format", "jsonl", "insight", "Core", "does stuff", "--yes"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is True
+        assert self._systems()["Core"]["insights"] == ["does stuff"]
+
+    def test_init_over_existing_state(self, project, capsys):
+        run(["--format", "json", "init", "Other"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False
+        assert "Core" in self._systems()
+
+        run(["--format", "json", "init", "Other", "--yes"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is True
+        assert self._systems() == {}
+
+    def test_audit_corpus_without_state(self, temp_dir, monkeypatch, capsys):
+        monkeypatch.chdir(temp_dir)
+        corpus = temp_dir / "corpus.jsonl"
+        corpus.write_text(json.dumps({"id": "x", "system": "X", "text": "does stuff"}) + "\n")
+        run(["--format", "json", "audit", "--corpus", str(corpus)])
+        (result,) = _lines(capsys)
+        assert result["ok"] is True and result["source"] == str(corpus)
+        assert result["items"] == [{"system": "X", "id": "x", "codes": result["items"][0]["codes"]}]
+        assert result["items"][0]["codes"]
+        assert result["systems"]["X"]["passed"] == 0
+        assert "messages" not in result
+
+        run(["--format", "json", "audit", "--corpus", str(temp_dir / "missing.jsonl")])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False
+
+    def test_show_missing_system(self, project, capsys):
+        run(["--format", "json", "show", "Nope"])
+        (result,) = _lines(capsys)
+        assert result == {"command": "show", "ok": False, "error": "System 'Nope' not found"}
+
+    def test_no_state(self, temp_dir, monkeypatch, capsys):
+        monkeypatch.chdir(temp_dir)
+        run(["--format", "json", "list"])
+        (result,) = _lines(capsys)
+        assert result["ok"] is False and "init" in result["error"]
@@ -0,0 +1,105 @@
+import pytest
+import os
+from src.arch_scribe.core.paths import (
+    PathTable, canonical, bitmap, bitmap_ids, popcount,
+)
+from src.arch_scribe.core.constants import PATHS_FILE
+from src.arch_scribe.operations.stats_ops import refresh_stats
+
+
+class TestCanonical:
+    def test_canonical_forms(self):
+        assert canonical("./src/a.py") == "src/a.py"
+        assert canonical("src\\auth\\login.py") == "src/auth/login.py"
+        assert canonical("src//a/./b.py") == "src/a/b.py"
+        assert canonical("a.py") == "a.py"
+
+
+class TestPathTable:
+    def test_intern_assigns_stable_ids(self):
+        table = PathTable()
+        a = table.intern("src/a.py")
+        b = table.intern("src/b.py")
+        assert (a, b) == (0, 1)
+        assert table.intern("./src/a.py") == a
+        assert table.lookup("src/b.py") == b
+        assert table.lookup("missing.py") is None
+        assert table.paths_for([b, a]) == ["src/b.py", "src/a.py"]
+
+    def test_bitmap_helpers(self):
+        ids = {0, 3, 9, 64}
+        bits = bitmap(ids)
+        assert popcount(bits) == 4
+        assert list(bitmap_ids(bits)) == [0, 3, 9, 64]
+        assert bitmap(set()) == 0
+        assert popcount(bitmap({1, 2}) & bitmap({2, 3})) == 1
+
+    def test_persisted_ids_stable_across_loads(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        table = PathTable()
+        table.intern_many(["a.py", "b.py"])
+        assert table.dirty
+        table.save()
+        assert not table.dirty
+
+        reloaded = PathTable.load()
+        assert reloaded.lookup("a.py") == table.lookup("a.py")
+        assert reloaded.lookup("b.py") == table.lookup("b.py")
+
+    def test_save_merges_concurrent_tables(self, temp_dir, monkeypatch):
+        """A second writer's new paths go after those already on disk."""
+        monkeypatch.chdir(temp_dir)
+        base = PathTable(["a.py"])
+        base.save()
+
+        first = PathTable.load()
+        second = PathTable.load()
+        first.intern("b.py")
+        second.intern("c.py")
+        first.save()
+        second.save()
+
+        assert second.lookup("b.py") == 1
+        assert second.lookup("c.py") == 2
+        assert second.generation == 1
+        assert PathTable.load().paths == ["a.py", "b.py", "c.py"]
+
+    def test_load_corrupted_table_starts_empty(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        os.makedirs(os.path.dirname(PATHS_FILE))
+        with open(PATHS_FILE, "w") as f:
+            f.write("{broken")
+        assert len(PathTable.load()) == 0
+
+
+class TestIdCoverage:
+    def test_refresh_stats_with_ids(self):
+        data = {
+            "metadata": {"scan_stats": {}},
+            "progress": {},
+            "systems": {
+                "A": {"key_files": ["./a.py", "b.py"]},
+                "B": {"key_files": ["b.py", "x.py"]},
+            },
+        }
+        refresh_stats(data, 10, 4, {"a.py", "b.py", "c.py", "d.py"}, PathTable())
+
+        stats = data["metadata"]["scan_stats"]
+        assert stats["mapped_files_count"] == 2
+        assert stats["coverage_percentage"] == 50.0
+        assert stats["coverage_quality"] == 50.0
+
+    def test_state_manager_persists_table(self, temp_dir, monkeypatch):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        monkeypatch.chdir(temp_dir)
+        with open("a.py", "w") as f:
+            f.write("x" * 2000)
+        mgr = StateManager()
+        mgr.init_project("Paths")
+        mgr.add_system("Core")
+        mgr.map_files("Core", ["./a.py"])
+
+        assert mgr.data["systems"]["Core"]["key_files"] == ["a.py"]
+        assert os.path.exists(PATHS_FILE)
+        assert StateManager().paths.lookup("a.py") == mgr.paths.lookup("a.py")
@@ -0,0 +1,110 @@
+import pytest
+from src.arch_scribe.core import models, progress
+from src.arch_scribe.operations import system_ops, insight_ops, stats_ops
+
+
+def _state(systems=None):
+    return models.hydrate({
+        "metadata": {"scan_stats": {}},
+        "progress": {},
+        "systems": systems or {},
+    })
+
+
+class TestTotals:
+    def test_complete_threshold_crossings(self):
+        totals = progress.Totals()
+        totals.add(80)
+        assert totals.complete == 0
+        totals.change(80, 90)
+        assert totals.complete == 1
+        totals.change(90, 85)
+        assert totals.complete == 1
+        totals.change(85, 10)
+        assert totals.complete == 0
+        assert totals.completeness_sum == 10
+
+    def test_seeded_from_existing_systems(self):
+        data = _state({
+            "A": {"completeness": 90},
+            "B": {"completeness": 30},
+        })
+        totals = progress.totals_of(data)
+        assert totals is progress.totals_of(data)
+        assert totals.as_progress() == {
+            "systems_identified": 2,
+            "systems_complete": 1,
+            "completeness_sum": 120,
+            "estimated_overall_completeness": 60.0,
+        }
+
+    def test_seeded_from_saved_progress_without_walking(self, monkeypatch):
+        data = _state({"A": {"completeness": 90}, "B": {"completeness": 30}})
+        system_ops.add_system(data, "C")
+        saved = models.hydrate({**data, "progress": dict(data["progress"])})
+
+        monkeypatch.setattr(progress, "recompute", pytest.fail)
+        assert progress.totals_of(saved).as_progress() == data["progress"]
+        system_ops.add_system(saved, "D")
+        assert saved["progress"]["systems_identified"] == 4
+
+
+class TestIncrementalProgress:
+    def test_mutations_keep_progress_current(self):
+        data = _state({"Legacy": {"completeness": 50, "key_files": ["x.py"]}})
+        system_ops.add_system(data, "Core")
+        system_ops.map_files(data, "Core", [f"f{i}.py" for i in range(10)])
+        insight_ops.add_insight(data, "Core", "Routes requests using a table, which keeps dispatch flat")
+
+        prog = data["progress"]
+        assert prog["systems_identified"] == 2
+        assert prog["estimated_overall_completeness"] == round((50 + 47) / 2, 1)
+        assert progress.verify(data) == []
+
+    def test_mutation_does_not_walk_systems(self, monkeypatch):
+        data = _state({f"S{i}": {} for i in range(50)})
+        progress.totals_of(data)
+
+        def fail(systems):
+            raise AssertionError("recomputed from scratch")
+
+        monkeypatch.setattr(progress, "recompute", fail)
+        system_ops.add_system(data, "New")
+        system_ops.map_files(data, "New", ["a.py"])
+        stats_ops.refresh_stats(data, 1, 1, {"a.py"})
+        assert data["progress"]["systems_identified"] == 51
+
+    def test_verify_detects_drift(self):
+        data = _state()
+        system_ops.add_system(data, "Core")
+        data["progress"]["systems_identified"] = 7
+        assert progress.verify(data) == [
+            "progress.systems_identified: stored 7, expected 1"
+        ]
+
+
+class TestVerifyStats:
+    def test_scan_stats_checked_against_sets(self):
+        data = _state()
+        system_ops.add_system(data, "Core")
+        system_ops.map_files(data, "Core", ["a.py", "z.py"])
+        stats_ops.refresh_stats(data, 3, 2, {"a.py", "b.py"})
+        assert stats_ops.verify_stats(data, {"a.py", "b.py"}) == []
+
+        data["metadata"]["scan_stats"]["mapped_files_count"] = 2
+        assert stats_ops.verify_stats(data, {"a.py", "b.py"}) == [
+            "scan_stats.mapped_files_count: stored 2, expected 1"
+        ]
+
+    def test_state_manager_verify_stats(self, temp_dir, monkeypatch):
+        from src.arch_scribe.core.state_manager import StateManager
+
+        monkeypatch.chdir(temp_dir)
+        with open("a.py", "w") as f:
+            f.write("x" * 2000)
+        mgr = StateManager()
+        mgr.init_project("Verify")
+        mgr.add_system("Core")
+        mgr.map_files("Core", ["a.py"])
+        assert mgr.verify_stats() == []
+        assert StateManager().verify_stats() == []
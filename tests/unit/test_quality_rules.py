@@ -0,0 +1,87 @@
+import pytest
+from src.arch_scribe.metrics import quality_rules
+from src.arch_scribe.metrics.insight_quality import (
+    MISSING_ACTION, MISSING_HOW, MISSING_IMPACT, TOO_SHORT, check_insight,
+)
+
+GOOD = (
+    "Caches session tokens using Redis with a sliding TTL window, "
+    "which reduces database load for every authenticated request today"
+)
+NO_HOW = (
+    "Caches session tokens in memory for a short sliding window of time, "
+    "which reduces database load for every single authenticated request today"
+)
+
+
+class TestPipeline:
+    def test_rules_sorted_by_cost(self):
+        costs = [r.cost for r in quality_rules.pipeline("strict").rules]
+        assert costs == sorted(costs)
+
+    def test_levels(self):
+        assert quality_rules.pipeline("standard").codes(GOOD) == []
+        assert quality_rules.pipeline("strict").codes(NO_HOW) == [MISSING_HOW]
+        assert quality_rules.pipeline("standard").codes(NO_HOW) == []
+        # lenient doesn't ask for impact and accepts 10 words
+        assert quality_rules.pipeline("lenient").codes("Caches tokens in Redis for ten minutes per user session here") == []
+
+    def test_codes_in_report_order(self):
+        assert quality_rules.pipeline("strict").codes("Uses JWT") == [
+            TOO_SHORT, MISSING_ACTION, MISSING_IMPACT, MISSING_HOW,
+        ]
+
+    def test_passes_stops_at_first_failure(self, monkeypatch):
+        def boom(text):
+            raise AssertionError("scan should not run")
+
+        monkeypatch.setattr(quality_rules, "scan", boom)
+        assert quality_rules.pipeline("standard").passes("too short") is False
+
+    def test_unknown_level(self):
+        with pytest.raises(ValueError):
+            quality_rules.pipeline("pedantic")
+
+
+class TestOutcomeCache:
+    @pytest.fixture(autouse=True)
+    def fresh(self, monkeypatch):
+        monkeypatch.setattr(quality_rules, "_cache", quality_rules.OutcomeCache())
+
+    def test_key_covers_level_and_version(self):
+        a = quality_rules.OutcomeCache.key(GOOD, "standard")
+        assert a != quality_rules.OutcomeCache.key(GOOD, "strict")
+        assert a.endswith(":standard:" + quality_rules.rules_version())
+
+    def test_hit_skips_rules(self, monkeypatch):
+        assert quality_rules.codes(NO_HOW, "strict") == [MISSING_HOW]
+        monkeypatch.setattr(quality_rules, "pipeline", None)
+        assert quality_rules.codes(NO_HOW, "strict") == [MISSING_HOW]
+        assert quality_rules.passes(NO_HOW, "strict") is False
+
+    def test_round_trip_and_version_check(self, tmp_path):
+        path = str(tmp_path / "quality.json")
+        store = quality_rules.cache()
+        quality_rules.codes(GOOD, "strict")
+        store.save(path)
+        assert quality_rules.OutcomeCache.load(path).entries == store.entries
+
+        quality_rules.rules_version.cache_clear()
+        try:
+            quality_rules.RULES_REVISION += 1
+            assert quality_rules.OutcomeCache.load(path).entries == {}
+        finally:
+            quality_rules.RULES_REVISION -= 1
+            quality_rules.rules_version.cache_clear()
+
+    def test_check_insight_uses_level_thresholds(self):
+        errors = check_insight("Caches tokens using Redis, which reduces load", "strict")
+        assert errors == ["Too short (7 words, need 20+)"]
+
+    def test_single_check_does_not_load_sidecar(self, monkeypatch):
+        monkeypatch.setattr(quality_rules, "_cache", None)
+        monkeypatch.setattr(quality_rules.OutcomeCache, "load", pytest.fail)
+        assert check_insight(NO_HOW, "strict") == [
+            "Missing [HOW] - no mechanism ('using', 'via', 'backed by', ...)"
+        ]
+        assert quality_rules._cache is None
@@ -0,0 +1,60 @@
+import pytest
+from src.arch_scribe.cli.commands import run
+from src.arch_scribe.core import fingerprint
+from src.arch_scribe.core import state_manager
+
+
+def _fail(*args, **kwargs):
+    pytest.fail("state loaded for a cached report")
+
+
+@pytest.fixture
+def project(temp_dir, monkeypatch):
+    monkeypatch.chdir(temp_dir)
+    (temp_dir / "pkg").mkdir()
+    for name in ("a.py", "b.py"):
+        (temp_dir / "pkg" / name).write_text("x = 1\n" * 300)
+    run(["init", "Cached"])
+    run(["add", "Core"])
+    return temp_dir
+
+
+class TestRenderCache:
+    def test_repeat_list_is_served_without_loading(self, project, monkeypatch, capsys):
+        run(["list"])
+        first = capsys.readouterr().out
+        monkeypatch.setattr(state_manager.StateManager, "__init__", _fail)
+        run(["list"])
+        assert capsys.readouterr().out == first
+
+    def test_mutation_invalidates(self, project, capsys):
+        run(["list"])
+        run(["add", "Api"])
+        capsys.readouterr()
+        run(["list"])
+        assert "Api" in capsys.readouterr().out
+
+    def test_arguments_are_part_of_the_entry(self, project, capsys):
+        run(["graph"])
+        run(["graph", "--collapse-cycles"])
+        assert len(list((project / ".arch_scribe" / "render").iterdir())) == 2
+
+    def test_status_served_until_the_tree_changes(self, project, monkeypatch, capsys):
+        run(["status"])
+        first = capsys.readouterr().out
+        with monkeypatch.context() as m:
+            m.setattr(state_manager.StateManager, "__init__", _fail)
+            run(["status"])
+            assert capsys.readouterr().out == first
+
+        (project / "pkg" / "c.py").write_text("x = 1\n" * 300)
+        run(["status"])
+        assert "/3 significant files" in capsys.readouterr().out
+
+    def test_tree_fingerprint_ignores_tool_files(self, project):
+        before = fingerprint.tree()
+        (project / "architecture.json.backup").write_text("{}")
+        (project / ".arch_scribe" / "extra.json").write_text("{}")
+        assert fingerprint.tree() == before
+        (project / "pkg" / "sub").mkdir()
+        assert fingerprint.tree() != before
@@ -0,0 +1,106 @@
+import csv
+import json
+import xml.etree.ElementTree as ET
+
+import pytest
+from src.arch_scribe.core.state_manager import StateManager
+from src.arch_scribe.reporting.reporters import REPORTERS, Model, render
+
+STATE = {
+    "metadata": {"project_name": "Shop"},
+    "systems": {
+        "API": {
+            "completeness": 40,
+            "clarity": "medium",
+            "key_files": ["api.py"],
+            "insights": [],
+            "dependencies": [
+                {"system": "DB", "reason": 'reads "orders"'},
+                {"system": "DB", "reason": "writes"},
+                {"system": "Queue", "reason": "publishes"},
+            ],
+        },
+        "DB": {"completeness": 80, "clarity": "high", "key_files": [], "insights": ["x"], "dependencies": []},
+    },
+}
+
+
+@pytest.fixture
+def exported(temp_dir):
+    written = render(Model.from_state(STATE), list(REPORTERS), str(temp_dir))
+    return temp_dir, written
+
+
+class TestReporters:
+    def test_all_formats_written(self, exported):
+        temp_dir, written = exported
+        assert set(written) == {"dot", "graphml", "jgf", "csv", "mermaid"}
+        assert len(written["csv"]) == 2
+
+    def test_json_graph(self, exported):
+        temp_dir, _ = exported
+        graph = json.loads((temp_dir / "graph.json").read_text())["graph"]
+        assert graph["label"] == "Shop"
+        assert graph["nodes"]["DB"]["metadata"]["completeness"] == 80
+        assert graph["nodes"]["Queue"]["metadata"]["missing"] is True
+        assert graph["edges"][0] == {
+            "source": "API",
+            "target": "DB",
+            "relation": "depends_on",
+            "metadata": {"reasons": ['reads "orders"', "writes"]},
+        }
+
+    def test_graphml_is_well_formed(self, exported):
+        temp_dir, _ = exported
+        root = ET.parse(temp_dir / "graph.graphml").getroot()
+        ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+        assert len(root.findall(".//g:node", ns)) == 3
+        assert len(root.findall(".//g:edge", ns)) == 2
+
+    def test_dot_escapes_quotes(self, exported):
+        temp_dir, _ = exported
+        dot = (temp_dir / "graph.dot").read_text()
+        assert '"API" -> "DB" [label="reads \\"orders\\"; writes"];' in dot
+        assert '"Queue" [completeness=0, style=dashed];' in dot
+
+    def test_csv_lists(self, exported):
+        temp_dir, _ = exported
+        with open(temp_dir / "edges.csv", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["source", "target", "reason"]
+        assert rows[1] == ["API", "DB", 'reads "orders"; writes']
+        with open(temp_dir / "nodes.csv", newline="") as f:
+            nodes = list(csv.DictReader(f))
+        assert nodes[1]["name"] == "DB" and nodes[1]["insights"] == "1"
+
+    def test_serial_matches_concurrent(self, temp_dir):
+        model = Model.from_state(STATE)
+        render(model, ["dot", "jgf"], str(temp_dir / "a"), workers=1)
+        render(model, ["dot", "jgf"], str(temp_dir / "b"), workers=2)
+        for name in ("graph.dot", "graph.json"):
+            assert (temp_dir / "a" / name).read_text() == (temp_dir / "b" / name).read_text()
+
+    def test_repeated_format_written_once(self, temp_dir, monkeypatch):
+        calls = []
+        real = REPORTERS["dot"].write
+        monkeypatch.setattr(REPORTERS["dot"], "write", lambda *a: calls.append(1) or real(*a))
+        written = render(Model.from_state(STATE), ["dot", "csv", "dot"], str(temp_dir), workers=3)
+        assert list(written) == ["dot", "csv"]
+        assert len(calls) == 1
+
+    def test_unknown_format(self, temp_dir):
+        with pytest.raises(ValueError):
+            render(Model.from_state(STATE), ["svg"], str(temp_dir))
+
+
+class TestExportCommand:
+    def test_export_from_state(self, temp_dir, monkeypatch, capsys):
+        monkeypatch.chdir(temp_dir)
+        StateManager().init_project("Shop")
+        StateManager().add_system("API")
+        StateManager().add_system("DB")
+        StateManager().add_dependency("API", "DB", "queries")
+        written = StateManager().export_reports(["jgf", "csv"], "out")
+        assert sorted(written) == ["csv", "jgf"]
+        graph = json.loads((temp_dir / "out" / "graph.json").read_text())["graph"]
+        assert graph["edges"][0]["target"] == "DB"
@@ -0,0 +1,63 @@
+import pytest
+from src.arch_scribe.core import session
+
+
+def make_state(systems):
+    return {
+        "metadata": {"state_version": 3, "total_sessions": 1, "session_history": []},
+        "systems": systems,
+    }
+
+
+class TestFingerprint:
+    """Test compact session fingerprints."""
+
+    def test_files_hash_is_order_independent(self):
+        assert session.files_hash(["a.py", "b.py"]) == session.files_hash(["b.py", "a.py"])
+        assert session.files_hash(["a.py"]) != session.files_hash(["b.py"])
+
+    def test_fingerprint_counts(self):
+        data = make_state({
+            "Core": {"key_files": ["a.py", "b.py"], "insights": ["x"], "dependencies": []},
+        })
+        fp = session.fingerprint(data)
+        assert fp["state_version"] == 3
+        assert fp["systems"]["Core"]["files"] == 2
+        assert fp["systems"]["Core"]["insights"] == 1
+        assert session.is_fingerprint(fp)
+        assert not session.is_fingerprint(data)
+
+    def test_diff_fingerprints(self):
+        old = session.fingerprint(make_state({
+            "Core": {"key_files": ["a.py"], "insights": []},
+        }))
+        new = session.fingerprint(make_state({
+            "Core": {"key_files": ["a.py", "b.py"], "insights": ["x"]},
+            "Api": {"key_files": ["c.py"], "insights": ["y", "z"]},
+        }))
+        assert session.diff_fingerprints(old, new) == (1, 2, 3)
+
+
+class TestIncrementalDelta:
+    """Test delta recording against the active session."""
+
+    def test_records_are_noops_without_session(self):
+        data = make_state({})
+        session.record_system_added(data, "Core")
+        session.record_files_mapped(data, ["a.py"])
+        session.record_insight_added(data)
+        assert session.active(data) is None
+
+    def test_records_accumulate_and_finish(self):
+        data = make_state({})
+        session.begin(data, 1)
+        session.record_system_added(data, "Core")
+        session.record_system_added(data, "Core")
+        session.record_files_mapped(data, ["a.py", "b.py"])
+        session.record_files_mapped(data, ["a.py"])
+        session.record_insight_added(data)
+
+        assert session.delta_counts(data) == (1, 2, 1)
+
+        session.close_session(data, session.delta_counts(data), "2024-01-01")
+        assert session.active(data) is None
@@ -299,6 +299,43 @@ class TestSystemOperations:
 
 
 
+class TestReadOnlyStatus:
+    """Test that status reads persisted stats and never writes the state."""
+
+    @pytest.fixture
+    def project(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        (temp_dir / "pkg").mkdir()
+        for name in ("a.py", "b.py"):
+            (temp_dir / "pkg" / name).write_text("x = 1\n" * 300)
+        StateManager().init_project("Status")
+        StateManager().add_system("Core")
+        StateManager().map_files("Core", ["pkg/a.py"])
+        return temp_dir
+
+    def test_status_does_not_write_state(self, project, capsys):
+        before = os.stat(STATE_FILE).st_mtime_ns
+        StateManager().print_status()
+        StateManager().print_status(refresh=True)
+        assert os.stat(STATE_FILE).st_mtime_ns == before
+        assert "(1/2 significant files)" in capsys.readouterr().out
+
+    def test_unchanged_tree_skips_the_scan(self, project, capsys):
+        mgr = StateManager()
+        assert not mgr.stats_stale()
+        with patch.object(mgr, "scan", side_effect=AssertionError("rescanned")):
+            mgr.print_status()
+
+    def test_changed_tree_rescans_in_memory(self, project, capsys):
+        (project / "pkg" / "c.py").write_text("x = 1\n" * 300)
+        mgr = StateManager()
+        assert mgr.stats_stale()
+        mgr.print_status()
+        assert "(1/3 significant files)" in capsys.readouterr().out
+        with open(STATE_FILE) as f:
+            assert json.load(f)["metadata"]["scan_stats"]["significant_files_total"] == 2
+
+
 class TestClarityComputation(unittest.TestCase):
     """Tests for auto-computed clarity levels"""
 
@@ -0,0 +1,86 @@
+import os
+import pytest
+from src.arch_scribe.core import models, timeseries
+from src.arch_scribe.core.state_manager import StateManager
+
+
+def _state(systems, coverage=0.0, session=0):
+    data = models.hydrate(
+        {
+            "metadata": {
+                "state_version": 1,
+                "total_sessions": session,
+                "scan_stats": {"coverage_percentage": coverage},
+            },
+            "systems": {name: {"completeness": c} for name, c in systems.items()},
+            "progress": {},
+        }
+    )
+    return data
+
+
+@pytest.fixture
+def path(temp_dir):
+    return str(temp_dir / "series")
+
+
+class TestSeries:
+    def test_rows_and_delta_encoded_systems(self, path):
+        timeseries.append(_state({"A": 10, "B": 20}, 5.0), path=path)
+        timeseries.append(_state({"A": 10, "B": 30}, 7.5), path=path)
+        timeseries.append(_state({"A": 40, "B": 30, "C": 0}, 9.0), path=path)
+
+        series = timeseries.Series(path)
+        assert len(series) == 3
+        assert [v for _, v in series.trend("coverage")] == [5.0, 7.5, 9.0]
+        assert list(series.column("systems")) == [2, 2, 3]
+        # Only changed values are stored
+        assert len(series.column("sys_id")) == 2 + 1 + 2
+        assert [v for _, v in series.system_history("B")] == [20, 30]
+        assert [v for _, v in series.system_history("A")] == [10, 40]
+
+    def test_interrupted_append_is_discarded(self, path):
+        timeseries.append(_state({"A": 10}, 5.0), path=path)
+        # A crash after some columns were written, before the commit marker
+        with open(os.path.join(path, "coverage.col"), "ab") as f:
+            f.write(b"\0" * 8)
+        with open(os.path.join(path, "sys_id.col"), "ab") as f:
+            f.write(b"\0" * 4)
+        assert len(timeseries.Series(path)) == 1
+
+        os.remove(os.path.join(path, "head.json"))
+        timeseries.append(_state({"A": 20}, 6.0), path=path)
+        series = timeseries.Series(path)
+        assert [v for _, v in series.trend("coverage")] == [5.0, 6.0]
+        assert [v for _, v in series.system_history("A")] == [10, 20]
+
+    def test_velocity_and_low_yield_streak(self, path):
+        systems = {}
+        for session, (added, coverage) in enumerate([(2, 10.0), (1, 20.0), (0, 22.0), (0, 23.0)], 1):
+            timeseries.append(_state(systems, coverage - 5, session), timeseries.SESSION_START, path)
+            for i in range(added):
+                systems[f"S{session}-{i}"] = 0
+            timeseries.append(_state(systems, coverage, session), timeseries.SESSION_END, path)
+
+        series = timeseries.Series(path)
+        assert series.session_deltas("systems") == [(1, 2), (2, 1), (3, 0), (4, 0)]
+        assert series.velocity("coverage", sessions=2) == 5.0
+        assert series.low_yield_streak() == 2
+
+    def test_unknown_column(self, path):
+        with pytest.raises(KeyError):
+            timeseries.Series(path).column("nope")
+
+
+class TestGateB:
+    def test_gate_b_from_series(self, temp_dir, monkeypatch, capsys):
+        monkeypatch.chdir(temp_dir)
+        StateManager().init_project("Series")
+        for _ in range(3):
+            StateManager().start_session()
+            StateManager().end_session()
+        mgr = StateManager()
+        # The gate reads the series, not session_history
+        mgr.data["metadata"]["session_history"] = []
+        mgr.print_status()
+        assert "Gate B: Diminishing returns detected" in capsys.readouterr().out
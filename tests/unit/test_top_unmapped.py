@@ -0,0 +1,92 @@
+import os
+import random
+import pytest
+from unittest.mock import patch
+from src.arch_scribe.core.dirtree import DirTree
+from src.arch_scribe.core.snapshot import Snapshot, count_lines
+from src.arch_scribe.metrics.coverage import top_unmapped
+
+
+def _snapshot(n=500, seed=3):
+    rng = random.Random(seed)
+    files = {
+        f"d{i % 7}/f{i}.py": [rng.randint(3000, 90000), 0, rng.randint(10, 3000)]
+        for i in range(n)
+    }
+    return Snapshot(n, files)
+
+
+class TestTopUnmapped:
+    def test_true_top_k_by_bytes_and_lines(self):
+        snap = _snapshot()
+        unmapped = set(list(snap.files)[::2])
+        with patch("os.stat", side_effect=AssertionError("no stat calls")), \
+                patch("os.path.getsize", side_effect=AssertionError("no stat calls")):
+            by_bytes = top_unmapped(snap, unmapped, 10, "bytes")
+            by_lines = top_unmapped(snap, unmapped, 10, "lines")
+        expected = sorted(unmapped, key=lambda p: (-snap.size(p), p))[:10]
+        assert [r[0] for r in by_bytes] == expected
+        expected = sorted(unmapped, key=lambda p: (-snap.lines(p), p))[:10]
+        assert [r[0] for r in by_lines] == expected
+
+    def test_priority_prefers_code_entry_points_in_uncharted_dirs(self):
+        files = {
+            "src/main.py": [2000, 0, 200],
+            "src/helpers.py": [2000, 0, 200],
+            "docs/guide.md": [2000, 0, 200],
+            "mapped/util.py": [2000, 0, 200],
+            "mapped/other.py": [2000, 0, 200],
+        }
+        snap = Snapshot(5, files)
+        tree = DirTree.build(files, lambda p: p == "mapped/other.py")
+        ranked = [r[0] for r in top_unmapped(snap, tree.unmapped, 5, "priority", tree)]
+        assert ranked == ["src/main.py", "src/helpers.py", "mapped/util.py", "docs/guide.md"]
+
+    def test_unknown_rank(self):
+        with pytest.raises(ValueError):
+            top_unmapped(_snapshot(5), set(), 3, "mtime")
+
+
+class TestSnapshotLines:
+    def test_count_lines(self, temp_dir):
+        path = temp_dir / "a.py"
+        path.write_text("a\nb\nc")
+        assert count_lines(str(path)) == 3
+        path.write_text("a\nb\n")
+        assert count_lines(str(path)) == 2
+
+    def test_lines_reused_for_unchanged_files(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        (temp_dir / "a.py").write_text("x\n" * 40)
+        stats = {"a.py": (80, 123)}
+        with patch("src.arch_scribe.core.snapshot.count_lines", side_effect=AssertionError):
+            first = Snapshot.from_scan(1, {"a.py"}, stats)
+        assert first.lines("a.py") == 40
+        assert first.dirty
+        with patch("src.arch_scribe.core.snapshot.count_lines", side_effect=AssertionError):
+            again = Snapshot.from_scan(1, {"a.py"}, stats, first)
+        assert again.lines("a.py") == 40
+        changed = Snapshot.from_scan(1, {"a.py"}, {"a.py": (80, 456)}, first)
+        assert changed.files["a.py"][2] is None
+        assert changed.lines("a.py") == 40  # recounted
+
+    def test_id_moves_with_added_and_removed_paths(self):
+        first = Snapshot.from_scan(2, {"a.py", "b.py"})
+        second = Snapshot.from_scan(2, {"b.py", "c.py"}, previous=first)
+        assert second.id == Snapshot(2, {"b.py": [], "c.py": []}).id
+
+    def test_only_top_candidates_are_counted(self, temp_dir, monkeypatch):
+        monkeypatch.chdir(temp_dir)
+        files = {}
+        for i in range(200):
+            path = f"f{i}.py"
+            (temp_dir / path).write_text("x = 1\n" * (i + 1))
+            files[path] = [6 * (i + 1), 0, None]
+        snap = Snapshot(200, files)
+        counted = []
+        real = count_lines
+        with patch("src.arch_scribe.core.snapshot.count_lines", side_effect=lambda p: counted.append(p) or real(p)):
+            ranked = top_unmapped(snap, set(files), 5, "lines")
+        assert [r[0] for r in ranked] == [f"f{i}.py" for i in range(199, 194, -1)]
+        assert [r[2] for r in ranked] == [200, 199, 198, 197, 196]
+        assert len(counted) == 20  # POOL * k